@@ -2,15 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import click
-import httpx
 from dotenv import load_dotenv
 
 from agent_argocd.agent import ArgoCDAgent # type: ignore[import-untyped]
-from agent_argocd.protocol_bindings.a2a_server.agent_executor import ArgoCDAgentExecutor # type: ignore[import-untyped]
+from agent_argocd.protocol_bindings.a2a_server.app import build_app
 
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryPushNotifier, InMemoryTaskStore
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
@@ -26,17 +22,7 @@ load_dotenv()
 @click.option('--host', 'host', default='localhost')
 @click.option('--port', 'port', default=10000)
 def main(host: str, port: int):
-    client = httpx.AsyncClient()
-    request_handler = DefaultRequestHandler(
-        agent_executor=ArgoCDAgentExecutor(),
-        task_store=InMemoryTaskStore(),
-        push_notifier=InMemoryPushNotifier(client),
-    )
-
-    server = A2AStarletteApplication(
-        agent_card=get_agent_card(host, port), http_handler=request_handler
-    )
-    app = server.build()
+    app = build_app(get_agent_card(host, port))
 
     # Add CORSMiddleware to allow requests from any origin (disables CORS restrictions)
     app.add_middleware(
@@ -4,9 +4,9 @@
 import logging
 
 from collections.abc import AsyncIterable
-from typing import Any, Literal, Dict
+from typing import Any, Literal, Optional
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
 
 from langchain_core.messages import AIMessage, ToolMessage, HumanMessage
 from langchain_core.runnables.config import (
@@ -14,19 +14,17 @@ from langchain_core.runnables.config import (
 )
 from pydantic import BaseModel
 
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import create_react_agent  # type: ignore
 
 
 import asyncio
+import hashlib
+import json
 import os
 
-from agent_argocd.state import (
-    AgentState,
-    InputState,
-    Message,
-    MsgType,
-)
+from agent_argocd.checkpointer import checkpointer_metrics, create_checkpointer
+from agent_argocd.tool_retrieval import with_tool_retrieval
+from agent_argocd.mcp_session import PersistentMCPSession, connection_from_env, DEFAULT_SERVER_PATH
 from cnoe_agent_utils import LLMFactory
 
 logger = logging.getLogger(__name__)
@@ -39,7 +37,63 @@ def debug_print(message: str, banner: bool = True):
         if banner:
             print("=" * 80)
 
-memory = MemorySaver()
+# The capability summary costs an LLM round trip, so it is opt-in and cached on disk per tool set
+WARMUP_ENABLED = os.getenv("AGENT_WARMUP", "false").lower() == "true"
+CAPABILITIES_CACHE_PATH = os.getenv(
+  "AGENT_CAPABILITIES_CACHE",
+  os.path.join(os.path.expanduser("~"), ".cache", "agent_argocd", "capabilities.json"),
+)
+
+
+def tool_set_hash(tools: list) -> str:
+  """Hash the names, descriptions and argument schemas of a tool set."""
+  digest = hashlib.sha256()
+  for tool in sorted(tools, key=lambda t: t.name):
+    digest.update(json.dumps([tool.name, tool.description, tool.args_schema], sort_keys=True, default=str).encode())
+  return digest.hexdigest()
+
+
+def describe_tools(tools: list) -> str:
+  """One block per tool: its name, the first line of its description and its parameters."""
+  lines = []
+  for tool in tools:
+    lines.append(f"Tool: {tool.name}")
+    summary = (tool.description or '').strip().split('\n', 1)[0]
+    lines.append(f"  Description: {summary}")
+    params = tool.args_schema.get('properties', {})
+    if not params:
+      lines.append("  Parameters: None")
+      continue
+    lines.append("  Parameters:")
+    for param, meta in params.items():
+      default = meta.get('default', None)
+      suffix = f" [default: {default}]" if default is not None else ""
+      lines.append(f"    - {param} ({meta.get('type', 'unknown')}): {meta.get('title', param)}{suffix}")
+  return "\n".join(lines)
+
+
+def load_capabilities(tools_hash: str, path: Optional[str] = None) -> Optional[str]:
+  try:
+    with open(path or CAPABILITIES_CACHE_PATH) as f:
+      return json.load(f).get(tools_hash)
+  except (OSError, ValueError):
+    return None
+
+
+def store_capabilities(tools_hash: str, summary: str, path: Optional[str] = None) -> None:
+  path = path or CAPABILITIES_CACHE_PATH
+  try:
+    with open(path) as f:
+      cache = json.load(f)
+  except (OSError, ValueError):
+    cache = {}
+  cache[tools_hash] = summary
+  try:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+      json.dump(cache, f)
+  except OSError as e:
+    logger.warning(f"Could not write capabilities cache to {path}: {e}")
 
 class ResponseFormat(BaseModel):
     """Respond to the user in this format."""
@@ -65,117 +119,133 @@ class ArgoCDAgent:
         'Set response status to error if the input indicates an error'
     )
 
-    def __init__(self):
-      # Setup the math agent and load MCP tools
+    def __init__(self, server_path: str = DEFAULT_SERVER_PATH):
+      # Cheap synchronous setup; tools, graph and the optional warm-up happen in start()/on first use
       self.model = LLMFactory().get_llm()
       self.graph = None
-      async def _async_argocd_agent(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
-          args = config.get("configurable", {})
-
-          server_path = args.get("server_path", "./agent_argocd/protocol_bindings/mcp_server/mcp_argocd/server.py")
-          print(f"Launching MCP server at: {server_path}")
-
-          argocd_token = os.getenv("ARGOCD_TOKEN")
-          if not argocd_token:
-            raise ValueError("ARGOCD_TOKEN must be set as an environment variable.")
-
-          argocd_api_url = os.getenv("ARGOCD_API_URL")
-          if not argocd_api_url:
-            raise ValueError("ARGOCD_API_URL must be set as an environment variable.")
-          client = MultiServerMCPClient(
-              {
-                  "math": {
-                      "command": "uv",
-                      "args": ["run", server_path],
-                      "env": {
-                          "ARGOCD_TOKEN": os.getenv("ARGOCD_TOKEN"),
-                          "ARGOCD_API_URL": os.getenv("ARGOCD_API_URL"),
-                          "ARGOCD_VERIFY_SSL": "false"
-                      },
-                      "transport": "stdio",
-                  }
-              }
-          )
-          tools = await client.get_tools()
-          print('*'*80)
-          print("Available Tools and Parameters:")
-          for tool in tools:
-            print(f"Tool: {tool.name}")
-            print(f"  Description: {tool.description.strip().splitlines()[0]}")
-            params = tool.args_schema.get('properties', {})
-            if params:
-              print("  Parameters:")
-              for param, meta in params.items():
-                param_type = meta.get('type', 'unknown')
-                param_title = meta.get('title', param)
-                default = meta.get('default', None)
-                print(f"    - {param} ({param_type}): {param_title}", end='')
-                if default is not None:
-                  print(f" [default: {default}]")
-                else:
-                  print()
-            else:
-              print("  Parameters: None")
-            print()
-          print('*'*80)
-          self.graph = create_react_agent(
-            self.model,
-            tools,
-            checkpointer=memory,
-            prompt=self.SYSTEM_INSTRUCTION,
-            response_format=(self.RESPONSE_FORMAT_INSTRUCTION, ResponseFormat),
-          )
+      self.tools_hash: Optional[str] = None
+      self.tool_count = 0
+      self.capabilities: Optional[str] = None
+      self.capabilities_source: Optional[str] = None
+      self.init_error: Optional[str] = None
+      self.checkpointer = None
+      self.mcp_session = PersistentMCPSession(connection_from_env(server_path))
+      self._init_lock = asyncio.Lock()
+
+    async def start(self, warm_up: bool = WARMUP_ENABLED) -> None:
+      """Build the graph (and optionally warm up) in the background; failures are reported by readiness()."""
+      try:
+        await self._ensure_initialized()
+        if warm_up:
+          await self.warm_up()
+      except Exception as e:
+        self.init_error = str(e)
+        logger.error(f"ArgoCD agent initialization failed: {e}")
+
+    def readiness(self) -> dict[str, Any]:
+      """Report whether the graph is built, separately from the server accepting tasks."""
+      return {
+        'ready': self.graph is not None,
+        'tools': self.tool_count,
+        'tools_hash': self.tools_hash,
+        'capabilities': self.capabilities_source,
+        'error': None if self.graph is not None else self.init_error,
+      }
 
+    def metrics(self) -> dict[str, Any]:
+      return {
+        'checkpointer': checkpointer_metrics(self.checkpointer),
+        'mcp_reconnects': self.mcp_session.reconnects,
+        'mcp_cancelled_requests': self.mcp_session.cancelled_requests,
+      }
 
-          # Provide a 'configurable' key such as 'thread_id' for the checkpointer
-          runnable_config = RunnableConfig(configurable={"thread_id": "one-time-test-thread"})
-          llm_result = await self.graph.ainvoke({"messages": HumanMessage(content="Summarize what you can do?")}, config=runnable_config)
-
-          # Try to extract meaningful content from the LLM result
-          ai_content = None
-
-          # Look through messages for final assistant content
-          for msg in reversed(llm_result.get("messages", [])):
-              if hasattr(msg, "type") and msg.type in ("ai", "assistant") and getattr(msg, "content", None):
-                  ai_content = msg.content
-                  break
-              elif isinstance(msg, dict) and msg.get("type") in ("ai", "assistant") and msg.get("content"):
-                  ai_content = msg["content"]
-                  break
-
-          # Fallback: if no content was found but tool_call_results exists
-          if not ai_content and "tool_call_results" in llm_result:
-              ai_content = "\n".join(
-                  str(r.get("content", r)) for r in llm_result["tool_call_results"]
-              )
-
-
-          # Return response
-          if ai_content:
-              print("Assistant generated response")
-              output_messages = [Message(type=MsgType.assistant, content=ai_content)]
-          else:
-              logger.warning("No assistant content found in LLM result")
-              output_messages = []
-
-          # Add a banner before printing the output messages
-          debug_print(f"Agent MCP Capabilities: {output_messages[-1].content}")
-
-      def _create_agent(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
-          return asyncio.run(_async_argocd_agent(state, config))
-      messages = []
-      state_input = InputState(messages=messages)
-      agent_input = AgentState(input=state_input).model_dump(mode="json")
-      runnable_config = RunnableConfig()
-      # Add a HumanMessage to the input messages if not already present
-      if not any(isinstance(m, HumanMessage) for m in messages):
-          messages.append(HumanMessage(content="What can you do?"))
-      _create_agent(agent_input, config=runnable_config)
+    async def close(self) -> None:
+      await self.mcp_session.close()
+      if hasattr(self.checkpointer, 'aclose'):
+        await self.checkpointer.aclose()
+
+    async def _ensure_initialized(self) -> None:
+      if self.graph is None:
+        async with self._init_lock:
+          if self.graph is None:
+            await self._async_argocd_agent()
+
+    async def _async_argocd_agent(self) -> None:
+      argocd_token = os.getenv("ARGOCD_TOKEN")
+      if not argocd_token:
+        raise ValueError("ARGOCD_TOKEN must be set as an environment variable.")
+
+      argocd_api_url = os.getenv("ARGOCD_API_URL")
+      if not argocd_api_url:
+        raise ValueError("ARGOCD_API_URL must be set as an environment variable.")
+
+      # Tools call back into the persistent session, which reconnects if the transport drops
+      tools = await load_mcp_tools(self.mcp_session)
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Available tools and parameters:\n%s", describe_tools(tools))
+      if self.checkpointer is None:
+        self.checkpointer = await create_checkpointer()
+      self.graph = create_react_agent(
+        # Each LLM call binds only the tools relevant to the latest user message
+        with_tool_retrieval(self.model, tools),
+        tools,
+        checkpointer=self.checkpointer,
+        prompt=self.SYSTEM_INSTRUCTION,
+        response_format=(self.RESPONSE_FORMAT_INSTRUCTION, ResponseFormat),
+      )
+      self.tools_hash = tool_set_hash(tools)
+      self.tool_count = len(tools)
+      self.init_error = None
+
+    async def warm_up(self) -> Optional[str]:
+      """Return the capability summary, asking the LLM only once per tool-set hash."""
+      await self._ensure_initialized()
+      summary = load_capabilities(self.tools_hash)
+      if summary is not None:
+        self.capabilities, self.capabilities_source = summary, 'cached'
+      else:
+        summary = await self._summarize_capabilities()
+        if summary:
+          store_capabilities(self.tools_hash, summary)
+          self.capabilities, self.capabilities_source = summary, 'generated'
+      if summary:
+        debug_print(f"Agent MCP Capabilities: {summary}")
+      return summary
+
+    async def _summarize_capabilities(self) -> Optional[str]:
+      # Provide a 'configurable' key such as 'thread_id' for the checkpointer
+      runnable_config = RunnableConfig(configurable={"thread_id": "one-time-test-thread"})
+      llm_result = await self.graph.ainvoke({"messages": HumanMessage(content="Summarize what you can do?")}, config=runnable_config)
+
+      # Try to extract meaningful content from the LLM result
+      ai_content = None
+
+      # Look through messages for final assistant content
+      for msg in reversed(llm_result.get("messages", [])):
+          if hasattr(msg, "type") and msg.type in ("ai", "assistant") and getattr(msg, "content", None):
+              ai_content = msg.content
+              break
+          elif isinstance(msg, dict) and msg.get("type") in ("ai", "assistant") and msg.get("content"):
+              ai_content = msg["content"]
+              break
+
+      # Fallback: if no content was found but tool_call_results exists
+      if not ai_content and "tool_call_results" in llm_result:
+          ai_content = "\n".join(
+              str(r.get("content", r)) for r in llm_result["tool_call_results"]
+          )
+
+      if ai_content:
+        print("Assistant generated response")
+      else:
+        logger.warning("No assistant content found in LLM result")
+      return ai_content
 
     async def stream(
       self, query: str, context_id: str
     ) -> AsyncIterable[dict[str, Any]]:
       print("DEBUG: Starting stream with query:", query, "and context_id:", context_id)
+      await self._ensure_initialized()
       inputs: dict[str, Any] = {'messages': [('user', query)]}
       config: RunnableConfig = {'configurable': {'thread_id': context_id}}
 
@@ -199,10 +269,12 @@ class ArgoCDAgent:
                 'content': 'Processing ArgoCD Resources rates..',
               }
 
-      yield self.get_agent_response(config)
-    def get_agent_response(self, config: RunnableConfig) -> dict[str, Any]:
+      yield await self.get_agent_response(config)
+
+    async def get_agent_response(self, config: RunnableConfig) -> dict[str, Any]:
       debug_print(f"Fetching agent response with config: {config}")
-      current_state = self.graph.get_state(config)
+      # The async read also works with savers that only allow async calls on their own loop (AsyncSqliteSaver)
+      current_state = await self.graph.aget_state(config)
       debug_print(f"Current state: {current_state}")
 
       structured_response = current_state.values.get('structured_response')
@@ -0,0 +1,211 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Conversation checkpointers for the agent graph.
+
+The graph keeps one thread per A2A context_id. `BoundedMemorySaver` bounds
+what an in-memory saver can hold: threads are evicted least-recently-used
+beyond `max_threads` and after `ttl_seconds` idle, and a thread over its byte
+budget is pruned down to its latest checkpoint (earlier checkpoints only serve
+time travel, the latest one carries the whole conversation). AGENT_CHECKPOINTER=sqlite
+keeps checkpoints on disk instead when langgraph-checkpoint-sqlite is installed;
+it applies the same thread count and idle limits but no per-thread byte budget.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver, ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINTER = os.getenv("AGENT_CHECKPOINTER", "memory").lower()
+MAX_THREADS = int(os.getenv("AGENT_CHECKPOINT_MAX_THREADS", "1000"))
+TTL_SECONDS = float(os.getenv("AGENT_CHECKPOINT_TTL_SECONDS", "3600"))
+THREAD_MAX_BYTES = int(os.getenv("AGENT_CHECKPOINT_THREAD_MAX_BYTES", str(4 * 1024 * 1024)))
+CHECKPOINT_DB = os.getenv(
+  "AGENT_CHECKPOINT_DB",
+  os.path.join(os.path.expanduser("~"), ".cache", "agent_argocd", "checkpoints.sqlite"),
+)
+
+
+class BoundedMemorySaver(InMemorySaver):
+  """InMemorySaver with LRU/TTL eviction by thread and a per-thread byte budget."""
+
+  def __init__(
+    self,
+    max_threads: int = MAX_THREADS,
+    ttl_seconds: Optional[float] = TTL_SECONDS,
+    thread_max_bytes: Optional[int] = THREAD_MAX_BYTES,
+    clock=time.monotonic,
+    **kwargs: Any,
+  ):
+    super().__init__(**kwargs)
+    self.max_threads = max_threads
+    self.ttl_seconds = ttl_seconds
+    self.thread_max_bytes = thread_max_bytes
+    self.clock = clock
+    # thread_id -> last access time, least recently used first
+    self._last_access: "OrderedDict[str, float]" = OrderedDict()
+    self._blob_keys: Dict[str, Set[Tuple]] = {}
+    self._write_keys: Dict[str, Set[Tuple]] = {}
+    self._bytes: Dict[str, int] = {}
+    self._over_budget: Set[str] = set()
+    self.stats = {"evictions": 0, "expirations": 0, "prunes": 0}
+
+  # Accounting
+
+  def _touch(self, thread_id: str) -> None:
+    self._last_access[thread_id] = self.clock()
+    self._last_access.move_to_end(thread_id)
+
+  def _thread_bytes(self, thread_id: str) -> int:
+    size = 0
+    for checkpoints in self.storage.get(thread_id, {}).values():
+      for checkpoint, metadata, _ in checkpoints.values():
+        size += len(checkpoint[1]) + len(metadata[1])
+    for key in self._blob_keys.get(thread_id, ()):
+      size += len(self.blobs[key][1])
+    for key in self._write_keys.get(thread_id, ()):
+      size += sum(len(write[2][1]) for write in self.writes[key].values())
+    return size
+
+  def _prune(self, thread_id: str) -> None:
+    """Drop every checkpoint of a thread except the latest one per namespace."""
+    keep_blobs, keep_writes = set(), set()
+    for checkpoint_ns, checkpoints in self.storage[thread_id].items():
+      latest = max(checkpoints)
+      for checkpoint_id in [c for c in checkpoints if c != latest]:
+        del checkpoints[checkpoint_id]
+      checkpoint, metadata, _ = checkpoints[latest]
+      checkpoints[latest] = (checkpoint, metadata, None)
+      versions = self.serde.loads_typed(checkpoint)["channel_versions"]
+      keep_blobs.update((thread_id, checkpoint_ns, k, v) for k, v in versions.items())
+      keep_writes.add((thread_id, checkpoint_ns, latest))
+    for key in self._blob_keys[thread_id] - keep_blobs:
+      del self.blobs[key]
+    for key in self._write_keys.get(thread_id, set()) - keep_writes:
+      self.writes.pop(key, None)
+    self._blob_keys[thread_id] &= keep_blobs
+    self._write_keys[thread_id] = self._write_keys.get(thread_id, set()) & keep_writes
+    self.stats["prunes"] += 1
+
+  def _enforce(self, thread_id: str) -> None:
+    self._touch(thread_id)
+    size = self._thread_bytes(thread_id)
+    if self.thread_max_bytes is not None and size > self.thread_max_bytes:
+      self._prune(thread_id)
+      size = self._thread_bytes(thread_id)
+      if size > self.thread_max_bytes and thread_id not in self._over_budget:
+        self._over_budget.add(thread_id)
+        logger.warning(f"Thread {thread_id} holds {size} bytes in its latest checkpoint, above the {self.thread_max_bytes} byte budget")
+    self._bytes[thread_id] = size
+    self.evict_expired()
+    while len(self._last_access) > self.max_threads:
+      oldest = next(iter(self._last_access))
+      self.delete_thread(oldest)
+      self.stats["evictions"] += 1
+
+  def evict_expired(self) -> int:
+    """Delete threads idle for longer than ttl_seconds; returns how many were dropped."""
+    if self.ttl_seconds is None:
+      return 0
+    deadline = self.clock() - self.ttl_seconds
+    expired = []
+    for thread_id, last_access in self._last_access.items():
+      if last_access > deadline:
+        break
+      expired.append(thread_id)
+    for thread_id in expired:
+      self.delete_thread(thread_id)
+    self.stats["expirations"] += len(expired)
+    return len(expired)
+
+  def metrics(self) -> Dict[str, Any]:
+    return {
+      "backend": "memory",
+      "threads": len(self._last_access),
+      "bytes": sum(self._bytes.values()),
+      **self.stats,
+    }
+
+  # BaseCheckpointSaver
+
+  def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+    thread_id = config["configurable"]["thread_id"]
+    if thread_id not in self.storage:
+      # The parent class indexes defaultdicts, which would leave empty entries behind
+      return None
+    self._touch(thread_id)
+    return super().get_tuple(config)
+
+  def put(
+    self,
+    config: RunnableConfig,
+    checkpoint: Checkpoint,
+    metadata: CheckpointMetadata,
+    new_versions: ChannelVersions,
+  ) -> RunnableConfig:
+    thread_id = config["configurable"]["thread_id"]
+    checkpoint_ns = config["configurable"]["checkpoint_ns"]
+    result = super().put(config, checkpoint, metadata, new_versions)
+    self._blob_keys.setdefault(thread_id, set()).update((thread_id, checkpoint_ns, k, v) for k, v in new_versions.items())
+    self._enforce(thread_id)
+    return result
+
+  def put_writes(
+    self,
+    config: RunnableConfig,
+    writes: Sequence[Tuple[str, Any]],
+    task_id: str,
+    task_path: str = "",
+  ) -> None:
+    super().put_writes(config, writes, task_id, task_path)
+    thread_id = config["configurable"]["thread_id"]
+    key = (thread_id, config["configurable"].get("checkpoint_ns", ""), config["configurable"]["checkpoint_id"])
+    self._write_keys.setdefault(thread_id, set()).add(key)
+    self._enforce(thread_id)
+
+  def delete_thread(self, thread_id: str) -> None:
+    # Only this thread's keys are visited, instead of a scan over every blob and write
+    self.storage.pop(thread_id, None)
+    for key in self._blob_keys.pop(thread_id, ()):
+      self.blobs.pop(key, None)
+    for key in self._write_keys.pop(thread_id, ()):
+      self.writes.pop(key, None)
+    self._last_access.pop(thread_id, None)
+    self._bytes.pop(thread_id, None)
+    self._over_budget.discard(thread_id)
+
+
+async def create_checkpointer(backend: str = CHECKPOINTER, path: Optional[str] = None) -> BaseCheckpointSaver:
+  """Build the checkpointer selected by AGENT_CHECKPOINTER (memory or sqlite)."""
+  if backend == "sqlite":
+    try:
+      import aiosqlite
+      from agent_argocd.sqlite_checkpointer import BoundedSqliteSaver
+    except ImportError:
+      logger.warning("AGENT_CHECKPOINTER=sqlite needs langgraph-checkpoint-sqlite, falling back to the bounded in-memory checkpointer")
+    else:
+      path = path or CHECKPOINT_DB
+      os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+      saver = BoundedSqliteSaver(await aiosqlite.connect(path), max_threads=MAX_THREADS, ttl_seconds=TTL_SECONDS)
+      await saver.setup()
+      return saver
+  elif backend != "memory":
+    raise ValueError(f"Unsupported AGENT_CHECKPOINTER: {backend}")
+  return BoundedMemorySaver()
+
+
+def checkpointer_metrics(saver: Optional[BaseCheckpointSaver]) -> Dict[str, Any]:
+  if hasattr(saver, "metrics"):
+    return saver.metrics()
+  if saver is None:
+    return {"backend": None}
+  return {"backend": type(saver).__name__}
@@ -0,0 +1,279 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent MCP client session shared by every agent request."""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, List, Optional, Set, Tuple
+
+import anyio
+import httpx
+from langchain_mcp_adapters.sessions import Connection
+from mcp import ClientSession, StdioServerParameters, types
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.message import SessionMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVER_PATH = "./agent_argocd/protocol_bindings/mcp_server/mcp_argocd/server.py"
+# Seconds to spend telling the server about a cancelled request before giving up
+CANCEL_NOTIFY_TIMEOUT = 2.0
+
+# Errors that mean the transport is gone, as opposed to a tool-level failure
+CONNECTION_ERRORS = (
+  anyio.ClosedResourceError,
+  anyio.BrokenResourceError,
+  anyio.EndOfStream,
+  ConnectionError,
+  httpx.TransportError,
+)
+
+
+def connection_from_env(server_path: str = DEFAULT_SERVER_PATH) -> Optional[Connection]:
+  """
+  Build the MCP connection from MCP_TRANSPORT.
+
+  `stdio` (default) spawns the server with `uv run`, `sse` and `streamable_http`
+  connect to a long-running server at MCP_SERVER_URL, and `inprocess` returns
+  None so the tools are hosted inside the agent process.
+  """
+  transport = os.getenv("MCP_TRANSPORT", "stdio").lower()
+  if transport == "inprocess":
+    return None
+  if transport in ("sse", "streamable_http"):
+    default_url = "http://localhost:8000/sse" if transport == "sse" else "http://localhost:8000/mcp"
+    return {"transport": transport, "url": os.getenv("MCP_SERVER_URL", default_url)}
+  if transport != "stdio":
+    raise ValueError(f"Unsupported MCP_TRANSPORT: {transport}")
+  return {
+    "command": "uv",
+    "args": ["run", server_path],
+    "env": {
+      "ARGOCD_TOKEN": os.getenv("ARGOCD_TOKEN"),
+      "ARGOCD_API_URL": os.getenv("ARGOCD_API_URL"),
+      "ARGOCD_VERIFY_SSL": "false",
+    },
+    "transport": "stdio",
+  }
+
+
+# Ids of the requests sent by the current task, collected while `_RequestIdRecorder` is set up for it
+_sent_request_ids: ContextVar[Optional[List[Any]]] = ContextVar("mcp_sent_request_ids", default=None)
+
+
+class _RequestIdRecorder:
+  """
+  Session write stream that notes the id of every request it sends.
+
+  ClientSession assigns request ids internally. Noting them as they are
+  written, in a list owned by the calling task, lets a cancelled call name its
+  own request however many calls share the session.
+  """
+
+  def __init__(self, stream):
+    self._stream = stream
+
+  async def send(self, message: SessionMessage) -> None:
+    sent = _sent_request_ids.get()
+    if sent is not None and isinstance(message.message.root, types.JSONRPCRequest):
+      sent.append(message.message.root.id)
+    await self._stream.send(message)
+
+  async def __aenter__(self):
+    await self._stream.__aenter__()
+    return self
+
+  async def __aexit__(self, *exc_info):
+    return await self._stream.__aexit__(*exc_info)
+
+  def __getattr__(self, name: str) -> Any:
+    return getattr(self._stream, name)
+
+
+@asynccontextmanager
+async def _client_session(read_stream, write_stream) -> AsyncIterator[ClientSession]:
+  async with ClientSession(read_stream, _RequestIdRecorder(write_stream)) as session:
+    await session.initialize()
+    yield session
+
+
+@asynccontextmanager
+async def _transport(connection: Connection) -> AsyncIterator[Tuple[Any, Any]]:
+  """Read and write streams of the transports `connection_from_env` produces."""
+  transport = connection["transport"]
+  if transport == "stdio":
+    # Commands such as `uv` are looked up on PATH, which the server env does not inherit
+    env = {"PATH": os.environ.get("PATH", ""), **(connection.get("env") or {})}
+    params = StdioServerParameters(command=connection["command"], args=connection["args"], env=env)
+    async with stdio_client(params) as (read_stream, write_stream):
+      yield read_stream, write_stream
+  elif transport == "sse":
+    async with sse_client(connection["url"]) as (read_stream, write_stream):
+      yield read_stream, write_stream
+  elif transport == "streamable_http":
+    async with streamablehttp_client(connection["url"]) as (read_stream, write_stream, _):
+      yield read_stream, write_stream
+  else:
+    raise ValueError(f"Unsupported MCP_TRANSPORT: {transport}")
+
+
+@asynccontextmanager
+async def _memory_session(server) -> AsyncIterator[ClientSession]:
+  """A session connected to a low-level MCP server running in this process."""
+  from mcp.shared.memory import create_client_server_memory_streams
+
+  async with create_client_server_memory_streams() as (client_streams, server_streams):
+    async with anyio.create_task_group() as tg:
+      tg.start_soon(lambda: server.run(*server_streams, server.create_initialization_options()))
+      try:
+        async with _client_session(*client_streams) as session:
+          yield session
+      finally:
+        tg.cancel_scope.cancel()
+
+
+def _inprocess_session():
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.server import create_server
+
+  return _memory_session(create_server()._mcp_server)
+
+
+class PersistentMCPSession:
+  """
+  One long-lived MCP ClientSession reused across requests.
+
+  The session is opened lazily in a background task (MCP transports must be
+  entered and exited from the same task) and reopened transparently when the
+  transport fails. It exposes `list_tools`/`call_tool` so it can be handed to
+  langchain-mcp-adapters in place of a ClientSession.
+
+  A call that fails because the transport broke is sent again on the new
+  session only if it cannot change anything: `list_tools`, and the tools the
+  server annotates as read-only. A mutating tool may already have run before
+  the transport dropped, so its failure is raised instead.
+  """
+
+  def __init__(self, connection: Optional[Connection]):
+    self.connection = connection
+    self._session: Optional[ClientSession] = None
+    self._task: Optional[asyncio.Task] = None
+    self._ready: Optional[asyncio.Event] = None
+    self._closing: Optional[asyncio.Event] = None
+    self._error: Optional[BaseException] = None
+    self._lock = asyncio.Lock()
+    self.read_only_tools: Set[str] = set()
+    self.reconnects = 0
+    self.cancelled_requests = 0
+
+  @property
+  def connected(self) -> bool:
+    return self._session is not None and self._task is not None and not self._task.done()
+
+  def _open(self):
+    if self.connection is None:
+      return _inprocess_session()
+    return self._open_connection()
+
+  @asynccontextmanager
+  async def _open_connection(self) -> AsyncIterator[ClientSession]:
+    async with _transport(self.connection) as (read_stream, write_stream):
+      async with _client_session(read_stream, write_stream) as session:
+        yield session
+
+  async def _run(self) -> None:
+    try:
+      async with self._open() as session:
+        self._session = session
+        self._ready.set()
+        await self._closing.wait()
+    except asyncio.CancelledError:
+      raise
+    except Exception as e:
+      self._error = e
+      logger.warning(f"MCP session closed with error: {e}")
+    finally:
+      self._session = None
+      self._ready.set()
+
+  async def connect(self) -> ClientSession:
+    """Return the open session, connecting (or reconnecting) if necessary."""
+    async with self._lock:
+      if self.connected:
+        return self._session
+      if self._task is not None:
+        self.reconnects += 1
+        logger.warning("MCP session lost, reconnecting")
+      self._ready, self._closing, self._error = asyncio.Event(), asyncio.Event(), None
+      self._task = asyncio.create_task(self._run(), name="mcp-session")
+      await self._ready.wait()
+      if self._session is None:
+        raise ConnectionError(f"Could not open MCP session: {self._error}") from self._error
+      return self._session
+
+  async def list_tools(self) -> Any:
+    result = await self._with_reconnect(True, "list_tools")
+    self.read_only_tools = {tool.name for tool in result.tools if tool.annotations is not None and tool.annotations.readOnlyHint}
+    return result
+
+  async def call_tool(self, name: str, arguments: Optional[dict[str, Any]] = None) -> Any:
+    return await self._with_reconnect(name in self.read_only_tools, "call_tool", name, arguments)
+
+  async def _with_reconnect(self, retry: bool, method: str, *args: Any) -> Any:
+    session = await self.connect()
+    try:
+      return await self._call(session, method, *args)
+    except CONNECTION_ERRORS as e:
+      await self._drop()
+      if not retry:
+        logger.warning(f"MCP {method} {args[0] if args else ''} failed on a broken session and may have run, not retrying: {e}")
+        raise
+      logger.warning(f"MCP {method} failed on a broken session, retrying once: {e}")
+      session = await self.connect()
+      return await self._call(session, method, *args)
+
+  async def _call(self, session: ClientSession, method: str, *args: Any) -> Any:
+    """Call a session method; if the caller is cancelled, ask the server to cancel the request as well."""
+    sent: List[Any] = []
+    token = _sent_request_ids.set(sent)
+    try:
+      return await getattr(session, method)(*args)
+    except asyncio.CancelledError:
+      for request_id in sent:
+        await self._notify_cancelled(session, request_id)
+      raise
+    finally:
+      _sent_request_ids.reset(token)
+
+  async def _notify_cancelled(self, session: ClientSession, request_id: Any) -> None:
+    notification = types.ClientNotification(
+      types.CancelledNotification(
+        method="notifications/cancelled",
+        params=types.CancelledNotificationParams(requestId=request_id, reason="Client cancelled the request"),
+      )
+    )
+    try:
+      with anyio.fail_after(CANCEL_NOTIFY_TIMEOUT):
+        await session.send_notification(notification)
+      self.cancelled_requests += 1
+      logger.debug(f"Asked the MCP server to cancel request {request_id}")
+    except Exception as e:
+      logger.warning(f"Could not notify the MCP server of cancelled request {request_id}: {e}")
+
+  async def _drop(self) -> None:
+    task = self._task
+    if task is not None and not task.done():
+      self._closing.set()
+      await asyncio.gather(task, return_exceptions=True)
+    self._session = None
+
+  async def close(self) -> None:
+    """Close the session and its transport."""
+    async with self._lock:
+      await self._drop()
+      self._task = None
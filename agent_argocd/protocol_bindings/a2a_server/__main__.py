@@ -4,16 +4,12 @@
 import os
 
 import click
-import httpx
 import uvicorn
 
-from agent import ArgoCDAgent # type: ignore[import-untyped]
-from agent_executor import ArgoCDAgentExecutor # type: ignore[import-untyped]
+from agent_argocd.agent import ArgoCDAgent # type: ignore[import-untyped]
+from agent_argocd.protocol_bindings.a2a_server.app import build_app
 from dotenv import load_dotenv
 
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryPushNotifier, InMemoryTaskStore
 from a2a.types import (
   AgentAuthentication,
   AgentCapabilities,
@@ -37,18 +33,9 @@ def main(host: str, port: int):
   host = host or env_host or 'localhost'
   port = port or int(env_port) if env_port is not None else 8000
 
-  client = httpx.AsyncClient()
-  request_handler = DefaultRequestHandler(
-    agent_executor=ArgoCDAgentExecutor(),
-    task_store=InMemoryTaskStore(),
-    push_notifier=InMemoryPushNotifier(client),
-  )
-
-  server = A2AStarletteApplication(
-    agent_card=get_agent_card(host, port), http_handler=request_handler
-  )
+  app = build_app(get_agent_card(host, port))
 
-  uvicorn.run(server.build(), host=host, port=port)
+  uvicorn.run(app, host=host, port=port)
 
 
 def get_agent_card(host: str, port: int):
@@ -0,0 +1,175 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Admission control for agent executions: global and per-context concurrency caps with a bounded wait queue"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+MAX_CONCURRENT_TASKS = int(os.getenv("A2A_MAX_CONCURRENT_TASKS", "8"))
+MAX_TASKS_PER_CONTEXT = int(os.getenv("A2A_MAX_TASKS_PER_CONTEXT", "2"))
+MAX_QUEUED_TASKS = int(os.getenv("A2A_MAX_QUEUED_TASKS", "32"))
+QUEUE_TIMEOUT = float(os.getenv("A2A_QUEUE_TIMEOUT_SECONDS", "30"))
+# Recent queue waits kept for the percentiles in metrics()
+WAIT_SAMPLES = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when an execution is not admitted; `reason` is context_limit, queue_full or queue_timeout."""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class AdmissionController:
+    """
+    Limits how many agent executions run at once.
+
+    At most `max_concurrent` executions run; further ones wait in a FIFO queue
+    of at most `max_queued` entries for up to `queue_timeout` seconds. One
+    context (conversation) may hold at most `max_per_context` running or
+    queued executions. Anything beyond these limits is rejected at once, so
+    a burst of requests cannot fan out into unbounded LLM and ArgoCD calls.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_TASKS,
+        max_per_context: int = MAX_TASKS_PER_CONTEXT,
+        max_queued: int = MAX_QUEUED_TASKS,
+        queue_timeout: float = QUEUE_TIMEOUT,
+        clock=time.monotonic,
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_context = max(1, max_per_context)
+        self.max_queued = max(0, max_queued)
+        self.queue_timeout = queue_timeout
+        self.clock = clock
+        self.running = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._per_context: Counter = Counter()
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.stats = {"admitted": 0, "queued": 0, "completed": 0, "rejected": Counter(), "wait_seconds_total": 0.0, "wait_seconds_max": 0.0}
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, context_id: Optional[str] = None) -> float:
+        """
+        Take an execution slot, waiting in the queue if all are busy.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            AdmissionRejected: If the context is at its cap, the queue is full or the wait timed out
+        """
+        context_id = context_id or ""
+        if context_id and self._per_context[context_id] >= self.max_per_context:
+            self._reject("context_limit")
+            raise AdmissionRejected("context_limit", f"This conversation already has {self.max_per_context} requests in progress")
+        if self.running < self.max_concurrent and not self._waiters:
+            self.running += 1
+            self._per_context[context_id] += 1
+            self._admitted(0.0)
+            return 0.0
+        if len(self._waiters) >= self.max_queued:
+            self._reject("queue_full")
+            raise AdmissionRejected("queue_full", "The agent is busy, please retry shortly")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._per_context[context_id] += 1
+        self.stats["queued"] += 1
+        start = self.clock()
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait ended; give it back
+                self.release(context_id)
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+                self._decrement(context_id)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._reject("queue_timeout")
+            raise AdmissionRejected("queue_timeout", f"The agent is busy, no capacity within {self.queue_timeout:.0f}s, please retry shortly") from None
+        waited = self.clock() - start
+        self._admitted(waited)
+        return waited
+
+    def release(self, context_id: Optional[str] = None) -> None:
+        """Free a slot, handing it to the oldest waiter if there is one."""
+        self._decrement(context_id or "")
+        self.stats["completed"] += 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.running -= 1
+
+    @asynccontextmanager
+    async def admit(self, context_id: Optional[str] = None) -> AsyncIterator[float]:
+        """Hold a slot for the duration of the block; yields the seconds spent waiting for it."""
+        waited = await self.acquire(context_id)
+        try:
+            yield waited
+        finally:
+            self.release(context_id)
+
+    def _decrement(self, context_id: str) -> None:
+        self._per_context[context_id] -= 1
+        if self._per_context[context_id] <= 0:
+            del self._per_context[context_id]
+
+    def _admitted(self, waited: float) -> None:
+        self.stats["admitted"] += 1
+        self.stats["wait_seconds_total"] += waited
+        self.stats["wait_seconds_max"] = max(self.stats["wait_seconds_max"], waited)
+        self._waits.append(waited)
+
+    def _reject(self, reason: str) -> None:
+        self.stats["rejected"][reason] += 1
+        logger.warning(f"Rejected agent execution ({reason}): {self.running} running, {len(self._waiters)} queued")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current load, limits and counters, with wait percentiles over the last WAIT_SAMPLES admissions."""
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> float:
+            return waits[min(len(waits) - 1, int(p * len(waits)))] if waits else 0.0
+
+        return {
+            "running": self.running,
+            "queued": len(self._waiters),
+            "contexts": len(self._per_context),
+            "limits": {
+                "max_concurrent": self.max_concurrent,
+                "max_per_context": self.max_per_context,
+                "max_queued": self.max_queued,
+                "queue_timeout_seconds": self.queue_timeout,
+            },
+            "admitted": self.stats["admitted"],
+            "queued_total": self.stats["queued"],
+            "completed": self.stats["completed"],
+            "rejected": dict(self.stats["rejected"]),
+            "wait_seconds": {
+                "total": round(self.stats["wait_seconds_total"], 3),
+                "max": round(self.stats["wait_seconds_max"], 3),
+                "p50": round(percentile(0.5), 3),
+                "p99": round(percentile(0.99), 3),
+            },
+        }
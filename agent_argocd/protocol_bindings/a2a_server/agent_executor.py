@@ -1,24 +1,41 @@
 # Copyright 2025 CNOE
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
 from agent_argocd.agent import ArgoCDAgent # type: ignore[import-untyped]
+from agent_argocd.protocol_bindings.a2a_server.admission import AdmissionController, AdmissionRejected
 from typing_extensions import override
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events.event_queue import EventQueue
 from a2a.types import (
+    Task,
     TaskArtifactUpdateEvent,
+    TaskNotCancelableError,
     TaskState,
     TaskStatus,
     TaskStatusUpdateEvent,
 )
 from a2a.utils import new_agent_text_message, new_task, new_text_artifact
+from a2a.utils.errors import ServerError
+
+logger = logging.getLogger(__name__)
+
+# Seconds cancel() waits for a canceled run to unwind before reporting it canceled itself
+CANCEL_TIMEOUT = 5.0
 
 
 class ArgoCDAgentExecutor(AgentExecutor):
     """Currency AgentExecutor Example."""
 
-    def __init__(self):
-        self.agent = ArgoCDAgent()
+    def __init__(self, admission: Optional[AdmissionController] = None, agent: Optional[ArgoCDAgent] = None):
+        self.agent = agent or ArgoCDAgent()
+        self.admission = admission or AdmissionController()
+        # Runs in progress by task id, with the execute() call awaiting each
+        self._runs: Dict[str, Tuple[asyncio.Task, asyncio.Task]] = {}
+        self.canceled = 0
 
     @override
     async def execute(
@@ -36,6 +53,41 @@ class ArgoCDAgentExecutor(AgentExecutor):
         if not task:
             task = new_task(context.message)
             event_queue.enqueue_event(task)
+
+        # The run gets its own asyncio Task so cancel() can stop it, while queued
+        # for admission or in the middle of LLM and tool calls
+        run = asyncio.create_task(self._admit_and_run(query, context_id, task, event_queue), name=f'argocd-task-{task.id}')
+        self._runs[task.id] = (run, asyncio.current_task())
+        try:
+            await run
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            logger.info(f'Task {task.id} canceled')
+            self.canceled += 1
+            event_queue.enqueue_event(self._canceled_event(task.contextId, task.id))
+        finally:
+            if task.id in self._runs and self._runs[task.id][0] is run:
+                del self._runs[task.id]
+
+    async def _admit_and_run(self, query: str, context_id: Optional[str], task: Task, event_queue: EventQueue) -> None:
+        try:
+            async with self.admission.admit(context_id):
+                await self._run(query, context_id, task, event_queue)
+        except AdmissionRejected as e:
+            event_queue.enqueue_event(
+                TaskStatusUpdateEvent(
+                    status=TaskStatus(
+                        state=TaskState.rejected,
+                        message=new_agent_text_message(str(e), task.contextId, task.id),
+                    ),
+                    final=True,
+                    contextId=task.contextId,
+                    taskId=task.id,
+                )
+            )
+
+    async def _run(self, query: str, context_id: Optional[str], task: Task, event_queue: EventQueue) -> None:
         # invoke the underlying agent, using streaming results
         async for event in self.agent.stream(query, context_id):
             if event['is_task_complete']:
@@ -97,4 +149,31 @@ class ArgoCDAgentExecutor(AgentExecutor):
     async def cancel(
         self, context: RequestContext, event_queue: EventQueue
     ) -> None:
-        raise Exception('cancel not supported')
+        """
+        Cancel a running task; its execute() call then reports it canceled.
+
+        Cancellation propagates from the run through graph.astream and the MCP
+        session, which asks the MCP server to cancel its in-flight tool call and
+        with it the ArgoCD API requests. The admission slot is freed as soon as
+        the run has unwound.
+
+        Raises:
+            ServerError: TaskNotCancelableError if the task is not running
+        """
+        run, execution = self._runs.get(context.task_id, (None, None))
+        if run is None or run.done():
+            raise ServerError(error=TaskNotCancelableError())
+        run.cancel()
+        done, _ = await asyncio.wait({execution}, timeout=CANCEL_TIMEOUT)
+        if not done:
+            logger.warning(f'Task {context.task_id} did not stop within {CANCEL_TIMEOUT:.0f}s of being canceled')
+            event_queue.enqueue_event(self._canceled_event(context.context_id, context.task_id))
+
+    @staticmethod
+    def _canceled_event(context_id: str, task_id: str) -> TaskStatusUpdateEvent:
+        return TaskStatusUpdateEvent(
+            status=TaskStatus(state=TaskState.canceled),
+            final=True,
+            contextId=context_id,
+            taskId=task_id,
+        )
@@ -0,0 +1,62 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""The A2A Starlette application shared by the agent entrypoints"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from agent_argocd.protocol_bindings.a2a_server.agent_executor import ArgoCDAgentExecutor
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryPushNotifier, InMemoryTaskStore
+from a2a.types import AgentCard
+
+
+def build_app(agent_card: AgentCard, agent_executor: Optional[ArgoCDAgentExecutor] = None) -> Starlette:
+    """
+    Build the A2A app for the ArgoCD agent, with its startup and shutdown hooks.
+
+    The agent is built in the background on startup so the server accepts tasks
+    right away; early tasks wait for the same initialization and /ready reports
+    when it is done. On shutdown the agent closes its MCP session. /metrics
+    reports the agent, admission control and canceled task counters.
+    """
+    agent_executor = agent_executor or ArgoCDAgentExecutor()
+    push_client = httpx.AsyncClient()
+    request_handler = DefaultRequestHandler(
+        agent_executor=agent_executor,
+        task_store=InMemoryTaskStore(),
+        push_notifier=InMemoryPushNotifier(push_client),
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        startup = asyncio.create_task(agent_executor.agent.start())
+        yield
+        startup.cancel()
+        await agent_executor.agent.close()
+        await push_client.aclose()
+
+    async def readiness(request: Request) -> JSONResponse:
+        status = agent_executor.agent.readiness()
+        return JSONResponse(status, status_code=200 if status['ready'] else 503)
+
+    async def metrics(request: Request) -> JSONResponse:
+        return JSONResponse({**agent_executor.agent.metrics(), 'admission': agent_executor.admission.metrics(), 'canceled_tasks': agent_executor.canceled})
+
+    server = A2AStarletteApplication(agent_card=agent_card, http_handler=request_handler)
+    return server.build(
+        routes=[
+            Route('/ready', readiness, methods=['GET']),
+            Route('/metrics', metrics, methods=['GET']),
+        ],
+        lifespan=lifespan,
+    )
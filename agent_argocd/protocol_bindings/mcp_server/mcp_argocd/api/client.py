@@ -5,10 +5,17 @@
 """API client for making requests to the service"""
 
 import os
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Tuple, Any
+import importlib.util
+from contextlib import aclosing
+from typing import Optional, Dict, Tuple, Any, AsyncIterator, Callable
 import httpx
 
+from ..utils import codec
+from .response_cache import response_cache, revalidation_cache, resource_root, Validated, RESPONSE_CACHE_ENABLED, REVALIDATE_ENABLED
+
 # Load environment variables
 API_URL = os.getenv("ARGOCD_API_URL")
 API_TOKEN = os.getenv("ARGOCD_TOKEN")
@@ -18,10 +25,79 @@ if not API_URL:
 if not API_TOKEN:
     raise ValueError("ARGOCD_API_TOKEN environment variable is not set.")
 
+# Connection pool configuration
+MAX_CONNECTIONS = int(os.getenv("ARGOCD_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("ARGOCD_MAX_KEEPALIVE_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("ARGOCD_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("ARGOCD_HTTP2", "false").lower() == "true"
+
+# Largest single event accepted from a streaming endpoint
+STREAM_MAX_EVENT_BYTES = int(os.getenv("ARGOCD_STREAM_MAX_EVENT_BYTES", str(16 * 1024 * 1024)))
+
+# Share one upstream request between concurrent identical GETs
+COALESCE_GETS = os.getenv("ARGOCD_COALESCE_GETS", "true").lower() == "true"
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("mcp_argocd")
 
+# Process-wide client shared by every tool call, created lazily by get_client()
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# In-flight GETs by request key, see make_api_request
+_in_flight: Dict[Tuple, "_InFlight"] = {}
+
+# Upstream requests actually sent vs GETs that joined an identical in-flight request
+request_stats = {"upstream": 0, "deduplicated": 0}
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for all ArgoCD API requests."""
+    http2 = HTTP2_ENABLED
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("ARGOCD_HTTP2 is enabled but the 'h2' package is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    logger.debug(f"Creating shared HTTP client (http2={http2}, max_connections={MAX_CONNECTIONS})")
+    return httpx.AsyncClient(limits=limits, http2=http2)
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    Connections are bound to the event loop that opened them, so a new client is
+    created if the running loop differs from the one the current client was built on.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        logger.debug("Closing shared HTTP client")
+        await client.aclose()
+
+
+class StreamRequestError(Exception):
+    """Raised when a streaming request is rejected by the API server."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 def assemble_nested_body(flat_body: Dict[str, Any]) -> Dict[str, Any]:
@@ -36,6 +112,24 @@ def assemble_nested_body(flat_body: Dict[str, Any]) -> Dict[str, Any]:
     return nested
 
 
+class _InFlight:
+    """An upstream GET and the number of callers waiting for its result."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+def _request_key(path: str, params: Dict[str, Any], token: str) -> Tuple:
+    """Identity of a GET: path, query parameters in a canonical order and a digest of the token."""
+    normalized = tuple(
+        sorted((str(k), tuple(map(str, v)) if isinstance(v, (list, tuple)) else str(v)) for k, v in params.items() if v is not None)
+    )
+    return (path, normalized, hashlib.sha256(token.encode()).hexdigest())
+
+
 async def make_api_request(
     path: str,
     method: str = "GET",
@@ -47,6 +141,19 @@ async def make_api_request(
     """
     Make a request to the API
 
+    Concurrent GETs with the same path, query parameters and token share one
+    upstream request and receive the same parsed result, which callers must not
+    mutate. Deduplicated calls are counted in `request_stats`. GETs issued after
+    a write to the same collection never join a request sent before it.
+
+    GETs of slow-moving endpoints (settings, version, projects, ...) are served
+    from `response_cache` for the TTL of their policy, and any POST, PUT, PATCH
+    or DELETE drops the cached responses of the collection it writes to.
+
+    Large responses (applications, resource trees) are kept in
+    `revalidation_cache` with their validators; an unchanged one is returned
+    from there without decoding the body again.
+
     Args:
         path: API path to request (without base URL)
         method: HTTP method (default: GET)
@@ -56,8 +163,82 @@ async def make_api_request(
         timeout: Request timeout in seconds (default: 30)
 
     Returns:
-        Tuple of (success, data) where data is either the response JSON or an error dict
+        Tuple of (success, data) where data is either the response JSON or an error dict.
+        The error dict has `"request_sent": False` when the request never reached
+        the server (no connection could be made), so it is safe to send again.
     """
+    if method != "GET":
+        result = await _send_request(path, method, token, params, data, timeout)
+        _forget_in_flight(path)
+        if RESPONSE_CACHE_ENABLED:
+            # Invalidated even on failure: a timed-out write may still have been applied
+            response_cache.invalidate(path)
+        return result
+
+    key = _request_key(path, params, token or API_TOKEN or "")
+    cacheable = RESPONSE_CACHE_ENABLED and response_cache.ttl_for(path) is not None
+    if cacheable:
+        cached = response_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Serving {path} from the response cache")
+            return (True, cached)
+        generation = response_cache.generation
+
+    if COALESCE_GETS:
+        result = await _coalesced_get(key, path, token, params, timeout)
+    else:
+        result = await _send_request(path, method, token, params, data, timeout, cache_key=key)
+    if cacheable and result[0]:
+        response_cache.put(key, path, result[1], generation)
+    return result
+
+
+def _forget_in_flight(path: str) -> None:
+    """Stop later GETs from joining in-flight requests in the collection of `path`; their current callers still get the result."""
+    root = resource_root(path)
+    for key in [key for key in _in_flight if key[0] == root or key[0].startswith(root + "/")]:
+        del _in_flight[key]
+
+
+async def _coalesced_get(key: Tuple, path: str, token: Optional[str], params: Dict[str, Any], timeout: int) -> Tuple[bool, Dict[str, Any]]:
+    """Send a GET, or wait for the identical one already in flight on this event loop."""
+    flight = _in_flight.get(key)
+    if flight is not None and flight.task.get_loop() is asyncio.get_running_loop():
+        request_stats["deduplicated"] += 1
+        logger.debug(f"Joining in-flight GET {path}")
+    else:
+        flight = _InFlight(asyncio.ensure_future(_send_request(path, "GET", token, params, {}, timeout, cache_key=key)))
+        _in_flight[key] = flight
+
+        def _forget(_task: asyncio.Task, flight: _InFlight = flight) -> None:
+            if _in_flight.get(key) is flight:
+                del _in_flight[key]
+
+        flight.task.add_done_callback(_forget)
+
+    flight.waiters += 1
+    try:
+        # Shielded so one caller giving up does not cancel the request for the others
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            # Every caller gave up, so the upstream request is abandoned as well
+            if _in_flight.get(key) is flight:
+                del _in_flight[key]
+            flight.task.cancel()
+
+
+async def _send_request(
+    path: str,
+    method: str,
+    token: Optional[str],
+    params: Dict[str, Any],
+    data: Dict[str, Any],
+    timeout: int,
+    cache_key: Optional[Tuple] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    request_stats["upstream"] += 1
     logger.debug(f"Making {method} request to {path}")
 
     if not token:
@@ -79,63 +260,73 @@ async def make_api_request(
         }
         headers = {key: value.format(token=token) for key, value in headers_dict.items()}
 
+        endpoint = revalidation_cache.endpoint(path) if REVALIDATE_ENABLED and cache_key is not None else None
+        cached = revalidation_cache.get(cache_key) if endpoint else None
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+            revalidation_cache.record(endpoint, "revalidations")
+
         logger.debug("Request headers prepared (Authorization header masked)")
         logger.debug(f"Request parameters: {params}")
         if data:
             logger.debug(f"Request data: {data}")
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            url = f"{API_URL}{path}"
-            logger.debug(f"Full request URL: {url}")
-
-            method_map = {
-                "GET": client.get,
-                "POST": client.post,
-                "PUT": client.put,
-                "PATCH": client.patch,
-                "DELETE": client.delete,
-            }
-
-            if method not in method_map:
-                logger.error(f"Unsupported HTTP method: {method}")
-                return (False, {"error": f"Unsupported method: {method}"})
-
-            request_kwargs = {
-                "headers": headers,
-                "params": params,
-            }
-            if method in ["POST", "PUT", "PATCH"]:
-                request_kwargs["json"] = data
-
-            response = await method_map[method](url, **request_kwargs)
-            logger.debug(f"Response status code: {response.status_code}")
-
-            if response.status_code in [200, 201, 202, 204]:
-                if response.status_code == 204:
-                    logger.debug("Request successful (204 No Content)")
-                    return (True, {"status": "success"})
-                try:
-                    response_data = response.json()
-                    logger.debug("Request successful, parsed JSON response")
-                    return (True, response_data)
-                except ValueError:
-                    logger.warning("Request successful but could not parse JSON response")
-                    return (True, {"status": "success", "raw_response": response.text})
-            else:
-                error_message = f"API request failed: {response.status_code}"
-                logger.error(error_message)
-                try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_message = f"{error_message} - {error_data['error']}"
-                    elif "message" in error_data:
-                        error_message = f"{error_message} - {error_data['message']}"
-                    logger.error(f"Error details: {error_data}")
-                    return (False, {"error": error_message, "details": error_data})
-                except ValueError:
-                    error_text = response.text[:200] if response.text else ""
-                    logger.error(f"Error response (not JSON): {error_text}")
-                    return (False, {"error": f"{error_message} - {error_text}"})
+        client = get_client()
+        url = f"{API_URL}{path}"
+        logger.debug(f"Full request URL: {url}")
+
+        if method not in ["GET", "POST", "PUT", "PATCH", "DELETE"]:
+            logger.error(f"Unsupported HTTP method: {method}")
+            return (False, {"error": f"Unsupported method: {method}"})
+
+        request_kwargs = {
+            "headers": headers,
+            "params": params,
+            "timeout": timeout,
+        }
+        if method in ["POST", "PUT", "PATCH"]:
+            request_kwargs["content"] = codec.dumps(data)
+
+        response = await client.request(method, url, **request_kwargs)
+        logger.debug(f"Response status code: {response.status_code}")
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"{path} not modified, using the cached response")
+            revalidation_cache.record(endpoint, "hits")
+            return (True, cached.value)
+        if response.status_code in [200, 201, 202, 204]:
+            if response.status_code == 204:
+                logger.debug("Request successful (204 No Content)")
+                return (True, {"status": "success"})
+            try:
+                if endpoint and response.status_code == 200:
+                    response_data = _decode_validated(response, cache_key, endpoint, cached)
+                else:
+                    response_data = codec.loads(response.content)
+                logger.debug("Request successful, parsed JSON response")
+                return (True, response_data)
+            except ValueError:
+                logger.warning("Request successful but could not parse JSON response")
+                return (True, {"status": "success", "raw_response": response.text})
+        else:
+            error_message = f"API request failed: {response.status_code}"
+            logger.error(error_message)
+            try:
+                error_data = codec.loads(response.content)
+                if "error" in error_data:
+                    error_message = f"{error_message} - {error_data['error']}"
+                elif "message" in error_data:
+                    error_message = f"{error_message} - {error_data['message']}"
+                logger.error(f"Error details: {error_data}")
+                return (False, {"error": error_message, "details": error_data})
+            except ValueError:
+                error_text = response.text[:200] if response.text else ""
+                logger.error(f"Error response (not JSON): {error_text}")
+                return (False, {"error": f"{error_message} - {error_text}"})
+    except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+        error_message = str(e).replace(token, "[REDACTED]") if token else str(e)
+        logger.error(f"Could not connect to send the request: {error_message}")
+        return (False, {"error": f"Connection error: {error_message}", "request_sent": False})
     except httpx.TimeoutException:
         logger.error(f"Request timed out after {timeout} seconds")
         return (False, {"error": f"Request timed out after {timeout} seconds"})
@@ -154,3 +345,142 @@ async def make_api_request(
             error_message = error_message.replace(token, "[REDACTED]")
         logger.error(f"Unexpected error: {error_message}")
         return (False, {"error": f"Unexpected error: {error_message}"})
+
+
+def _decode_validated(response: httpx.Response, key: Tuple, endpoint: str, cached: Optional[Validated]) -> Any:
+    """Decode a full response, or return the cached object when it has the same version."""
+    body = response.content
+    etag = response.headers.get("etag")
+    if cached is not None and cached.matches(body, etag):
+        logger.debug(f"{endpoint} response unchanged, skipping JSON decoding")
+        revalidation_cache.record(endpoint, "hits")
+        return cached.value
+    value = codec.loads(body)
+    revalidation_cache.record(endpoint, "misses")
+    size = revalidation_cache.parsed_size(endpoint, value, len(body))
+    revalidation_cache.put(key, Validated(value, body, etag, response.headers.get("last-modified"), size=size))
+    return value
+
+
+def cache_metrics() -> Dict[str, Any]:
+    """Counters of the request coalescing and response caches in this process."""
+    return {
+        "requests": dict(request_stats),
+        "response_cache": {**response_cache.stats, "entries": len(response_cache)},
+        "revalidation_cache": {
+            "entries": len(revalidation_cache),
+            "bytes": revalidation_cache.bytes,
+            "endpoints": {endpoint: dict(counters) for endpoint, counters in revalidation_cache.stats.items()},
+        },
+    }
+
+
+async def stream_api_request(
+    path: str,
+    token: Optional[str] = None,
+    params: Dict[str, Any] = {},
+    connect_timeout: int = 30,
+    max_event_bytes: int = STREAM_MAX_EVENT_BYTES,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream newline-delimited JSON events from a watch endpoint
+
+    Events are parsed as they arrive. The response body is only read when the
+    caller pulls the next event, so at most one network chunk plus one partial
+    event is buffered regardless of how long the stream runs.
+
+    Args:
+        path: API path to request (without base URL)
+        token: API token (defaults to ARGOCD_TOKEN)
+        params: Query parameters for the request (optional)
+        connect_timeout: Connection timeout in seconds, the stream itself has no read timeout (default: 30)
+        max_event_bytes: Largest single event accepted before the stream is aborted
+
+    Yields:
+        Each decoded JSON event as it arrives
+
+    Raises:
+        StreamRequestError: If the server rejects the request, reports an error event or sends an oversized event
+    """
+    logger.debug(f"Opening stream to {path}")
+    token = token or API_TOKEN
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+    timeout = httpx.Timeout(connect_timeout, read=None)
+
+    async with get_client().stream("GET", f"{API_URL}{path}", headers=headers, params=params, timeout=timeout) as response:
+        if response.status_code != 200:
+            body = (await response.aread()).decode(errors="replace")[:200]
+            raise StreamRequestError(f"API request failed: {response.status_code} - {body}", response.status_code)
+
+        pending = bytearray()
+        async for chunk in response.aiter_bytes():
+            pending += chunk
+            while True:
+                newline = pending.find(b"\n")
+                if newline < 0:
+                    break
+                line = bytes(pending[:newline])
+                del pending[: newline + 1]
+                if line.strip():
+                    yield _decode_stream_event(line)
+            if len(pending) > max_event_bytes:
+                raise StreamRequestError(f"Stream event exceeds {max_event_bytes} bytes")
+        if pending.strip():
+            yield _decode_stream_event(bytes(pending))
+
+
+def _decode_stream_event(line: bytes) -> Dict[str, Any]:
+    event = codec.loads(line)
+    if "error" in event:
+        error = event["error"]
+        raise StreamRequestError(f"Stream error: {error.get('message', error)}", error.get("http_code"))
+    return event
+
+
+async def watch_api_request(
+    path: str,
+    token: Optional[str] = None,
+    params: Dict[str, Any] = {},
+    max_events: int = 10,
+    max_duration: float = 30,
+    until: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Collect a bounded window of events from a watch endpoint
+
+    Args:
+        path: API path to request (without base URL)
+        token: API token (defaults to ARGOCD_TOKEN)
+        params: Query parameters for the request (optional)
+        max_events: Stop after this many events (default: 10)
+        max_duration: Stop after this many seconds (default: 30)
+        until: Stop after the first event for which this predicate returns True (optional)
+
+    Returns:
+        Tuple of (success, data) where data holds the collected events and why collection stopped,
+        or an error dict
+    """
+    events = []
+    stop_reason = "stream_closed"
+    try:
+        async with asyncio.timeout(max_duration), aclosing(stream_api_request(path, token=token, params=params)) as stream:
+            async for event in stream:
+                events.append(event)
+                if until is not None and until(event):
+                    stop_reason = "condition_met"
+                    break
+                if len(events) >= max_events:
+                    stop_reason = "max_events"
+                    break
+    except TimeoutError:
+        stop_reason = "max_duration"
+    except StreamRequestError as e:
+        logger.error(str(e))
+        return (False, {"error": str(e)})
+    except httpx.RequestError as e:
+        error_message = str(e).replace(token or API_TOKEN, "[REDACTED]")
+        logger.error(f"Request error: {error_message}")
+        return (False, {"error": f"Request error: {error_message}"})
+
+    logger.debug(f"Collected {len(events)} events from {path} ({stop_reason})")
+    return (True, {"events": events, "count": len(events), "stop_reason": stop_reason})
@@ -0,0 +1,282 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Response caches of the API client: TTL cache for slow-moving GET endpoints, validator cache for large ones"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple, Any, List, Pattern
+
+RESPONSE_CACHE_ENABLED = os.getenv("ARGOCD_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("ARGOCD_RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+REVALIDATE_ENABLED = os.getenv("ARGOCD_REVALIDATE_ENABLED", "true").lower() == "true"
+# Estimated memory of the decoded objects kept, several times the size of their JSON bodies
+REVALIDATE_MAX_BYTES = int(os.getenv("ARGOCD_REVALIDATE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Every this many decoded responses of an endpoint, its objects are measured instead of estimated
+SIZE_SAMPLE_INTERVAL = 32
+
+# Endpoint path pattern -> TTL in seconds. Paths without a policy are never cached.
+DEFAULT_POLICIES: Dict[str, float] = {
+    r"/api/version": 300,
+    r"/api/v1/settings": 60,
+    r"/api/v1/settings/plugins": 60,
+    r"/api/v1/notifications/(services|templates|triggers)": 300,
+    r"/api/v1/certificates": 60,
+    r"/api/v1/gpgkeys": 60,
+    r"/api/v1/gpgkeys/[^/]+": 60,
+    r"/api/v1/projects": 30,
+}
+
+# Endpoint name -> path pattern of large GET responses kept with their validators
+REVALIDATE_ENDPOINTS: Dict[str, str] = {
+    "applications.list": r"/api/v1/applications",
+    "applications.get": r"/api/v1/applications/[^/]+",
+    "applications.resource_tree": r"/api/v1/applications/[^/]+/resource-tree",
+    "applications.managed_resources": r"/api/v1/applications/[^/]+/managed-resources",
+    "applicationsets.list": r"/api/v1/applicationsets",
+}
+
+# resourceVersion of the top-level metadata object, found without decoding the body. Stops at the
+# first nested object so it never picks up the resourceVersion of a list item.
+TOP_LEVEL_RESOURCE_VERSION = re.compile(rb'^\s*\{\s*"metadata"\s*:\s*\{[^{}]*?"resourceVersion"\s*:\s*"([^"]*)"')
+
+logger = logging.getLogger("mcp_argocd")
+
+
+def load_policies() -> Dict[str, float]:
+    """Default policies updated with ARGOCD_RESPONSE_CACHE_TTLS, a JSON object of path pattern -> seconds (0 disables)."""
+    policies = dict(DEFAULT_POLICIES)
+    overrides = os.getenv("ARGOCD_RESPONSE_CACHE_TTLS")
+    if overrides:
+        try:
+            policies.update({pattern: float(ttl) for pattern, ttl in json.loads(overrides).items()})
+        except (ValueError, AttributeError, TypeError) as e:
+            logger.warning(f"Ignoring invalid ARGOCD_RESPONSE_CACHE_TTLS: {e}")
+    return {pattern: ttl for pattern, ttl in policies.items() if ttl > 0}
+
+
+def resource_root(path: str) -> str:
+    """The collection a path belongs to, e.g. /api/v1/projects for /api/v1/projects/a/roles/b/token."""
+    segments = path.strip("/").split("/")
+    depth = 3 if segments[:2] == ["api", "v1"] else 2
+    return "/" + "/".join(segments[:depth])
+
+
+class ResponseCache:
+    """
+    Bounded cache of successful GET results with a TTL per endpoint.
+
+    A mutating request invalidates every cached path in the same collection
+    (see `resource_root`), so the server's own writes are never followed by a
+    stale read.
+    """
+
+    def __init__(self, policies: Optional[Dict[str, float]] = None, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, clock=time.monotonic):
+        self.policies: List[Tuple[Pattern, float]] = [
+            (re.compile(f"^{pattern}$"), ttl) for pattern, ttl in (load_policies() if policies is None else policies).items()
+        ]
+        self.max_entries = max_entries
+        self.clock = clock
+        # key -> (path, value, expires_at), least recently used first
+        self._entries: "OrderedDict[Tuple, Tuple[str, Any, float]]" = OrderedDict()
+        # Bumped by every invalidation so a GET that started before a write does not store its stale result
+        self.generation = 0
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "invalidations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self.policies:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if entry[2] <= self.clock():
+            del self._entries[key]
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def put(self, key: Tuple, path: str, value: Any, generation: Optional[int] = None) -> None:
+        """Cache `value` for the TTL of `path`, unless an invalidation happened since `generation` was read."""
+        ttl = self.ttl_for(path)
+        if ttl is None or (generation is not None and generation != self.generation):
+            return
+        self._entries[key] = (path, value, self.clock() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> int:
+        """Drop every cached response in the collection of `path`; returns how many were dropped."""
+        root = resource_root(path)
+        self.generation += 1
+        stale = [key for key, (cached_path, _, _) in self._entries.items() if cached_path == root or cached_path.startswith(root + "/")]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses under {root}")
+            self.stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+
+
+response_cache = ResponseCache()
+
+
+def resource_version(body: bytes) -> Optional[bytes]:
+    """`metadata.resourceVersion` of a raw JSON object, when it comes before any nested object."""
+    match = TOP_LEVEL_RESOURCE_VERSION.match(body)
+    return match.group(1) if match else None
+
+
+def object_size(value: Any) -> int:
+    """
+    Approximate memory held by a decoded JSON value, in bytes.
+
+    Dict keys are skipped: JSON decoders share one string per distinct key, so
+    they are a small and fixed part of the total.
+    """
+    getsizeof = sys.getsizeof
+    size = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        size += getsizeof(current)
+        items = current.values() if type(current) is dict else current
+        for item in items:
+            if type(item) is dict or type(item) is list:
+                stack.append(item)
+            else:
+                size += getsizeof(item)
+    return size
+
+
+class Validated:
+    """A parsed response body with the validators that identify its version; `size` is the memory of the parsed value."""
+
+    __slots__ = ("value", "size", "etag", "last_modified", "resource_version", "digest")
+
+    def __init__(self, value: Any, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None, size: Optional[int] = None):
+        self.value = value
+        self.size = size if size is not None else len(body)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.resource_version = resource_version(body)
+        # Fallback for bodies without any version, such as resource trees
+        self.digest = None if etag or self.resource_version else hashlib.blake2b(body, digest_size=16).digest()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def matches(self, body: bytes, etag: Optional[str]) -> bool:
+        """Whether a full response carries the same version as this entry."""
+        if self.etag and etag:
+            return etag == self.etag
+        if self.resource_version is not None:
+            return resource_version(body) == self.resource_version
+        return self.digest is not None and hashlib.blake2b(body, digest_size=16).digest() == self.digest
+
+
+class RevalidationCache:
+    """
+    Parsed bodies of large GET responses kept next to their validators.
+
+    A repeated GET sends If-None-Match / If-Modified-Since when the server gave
+    an ETag or Last-Modified; a 304 returns the cached object. ArgoCD usually
+    sends neither, so a full response is compared with the cached one by
+    `metadata.resourceVersion` (or a digest of the body when there is none)
+    before it is decoded, and an unchanged body is never parsed again.
+
+    Per endpoint, `stats` counts `hits` (cached object returned), `revalidations`
+    (requests made while holding an entry) and `misses` (body decoded).
+
+    `max_bytes` bounds the memory of the parsed objects, not of the JSON
+    bodies. Measuring an object costs more than decoding it, so each endpoint
+    is measured on its first and every SIZE_SAMPLE_INTERVAL-th decoded
+    response, and other sizes are scaled from the body by the last measured
+    ratio (see `parsed_size`).
+    """
+
+    def __init__(self, endpoints: Dict[str, str] = REVALIDATE_ENDPOINTS, max_bytes: int = REVALIDATE_MAX_BYTES):
+        self.endpoints: List[Tuple[str, Pattern]] = [(name, re.compile(f"^{pattern}$")) for name, pattern in endpoints.items()]
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[Tuple, Validated]" = OrderedDict()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        # Endpoint -> (parsed size / body size, responses sized since it was measured)
+        self._ratios: Dict[str, Tuple[float, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def endpoint(self, path: str) -> Optional[str]:
+        for name, pattern in self.endpoints:
+            if pattern.match(path):
+                return name
+        return None
+
+    def record(self, endpoint: str, outcome: str) -> None:
+        counters = self.stats.setdefault(endpoint, {"hits": 0, "revalidations": 0, "misses": 0})
+        counters[outcome] += 1
+
+    def parsed_size(self, endpoint: str, value: Any, body_size: int) -> int:
+        """Estimated memory of a value decoded from a body of `body_size` bytes of this endpoint."""
+        ratio, count = self._ratios.get(endpoint, (0.0, SIZE_SAMPLE_INTERVAL))
+        if count >= SIZE_SAMPLE_INTERVAL:
+            size = object_size(value)
+            self._ratios[endpoint] = (size / max(1, body_size), 1)
+            return size
+        self._ratios[endpoint] = (ratio, count + 1)
+        return int(body_size * ratio)
+
+    def get(self, key: Tuple) -> Optional[Validated]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple, entry: Validated) -> None:
+        self.discard(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.bytes += entry.size
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.size
+
+    def discard(self, key: Tuple) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+
+revalidation_cache = RevalidationCache()
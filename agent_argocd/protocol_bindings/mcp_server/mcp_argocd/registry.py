@@ -0,0 +1,362 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Table-driven tool registration
+
+Every MCP tool is listed in TOOL_MANIFEST as tool name -> module under `tools/`
+(the function in that module has the same name as the tool), and the tools that
+change nothing are also listed in READ_ONLY_TOOLS. Tool schemas are
+precomputed into a JSON cache, so on startup tools are registered from the cache
+and their modules are only imported on first call. The cache is keyed by a
+fingerprint of the manifest and the tool sources and is rebuilt when stale.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import importlib
+import importlib.metadata
+from typing import Any, Callable, Dict, List, Optional
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.types import TextContent, ToolAnnotations
+from pydantic import PrivateAttr
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils import codec
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils.shaping import shape_response
+
+TOOLS_PACKAGE = "agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools"
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LAZY_TOOLS = os.getenv("ARGOCD_LAZY_TOOLS", "true").lower() == "true"
+SCHEMA_CACHE_PATH = os.getenv(
+    "ARGOCD_TOOL_SCHEMA_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "mcp_argocd", "tool_schemas.json"),
+)
+
+logger = logging.getLogger("mcp_argocd")
+
+# Tool name -> module under tools/, in registration order
+TOOL_MANIFEST: Dict[str, str] = {
+    "account_service__list_accounts": "api_v1_account",
+    "account_service__can_i": "api_v1_account_can_i_resource_action_subresource",
+    "account_service__update_password": "api_v1_account_password",
+    "account_service__get_account": "api_v1_account_name",
+    "account_service__create_token": "api_v1_account_name_token",
+    "account_service__delete_token": "api_v1_account_name_token_id",
+    "application_service__list": "api_v1_applications",
+    "application_service__create": "api_v1_applications",
+    "application_service__get_manifests_with_files": "api_v1_applications_manifestswithfiles",
+    "application_service__update": "api_v1_applications_application_metadata_name",
+    "application_service__managed_resources": "api_v1_applications_applicationname_managed_resources",
+    "application_service__resource_tree": "api_v1_applications_applicationname_resource_tree",
+    "application_service__get": "api_v1_applications_name",
+    "application_service__delete": "api_v1_applications_name",
+    "application_service__list_resource_events": "api_v1_applications_name_events",
+    "application_service__list_links": "api_v1_applications_name_links",
+    "application_service__pod_logs2": "api_v1_applications_name_logs",
+    "application_service__get_manifests": "api_v1_applications_name_manifests",
+    "application_service__terminate_operation": "api_v1_applications_name_operation",
+    "application_service__pod_logs": "api_v1_applications_name_pods_podname_logs",
+    "application_service__get_resource": "api_v1_applications_name_resource",
+    "application_service__patch_resource": "api_v1_applications_name_resource",
+    "application_service__delete_resource": "api_v1_applications_name_resource",
+    "application_service__list_resource_actions": "api_v1_applications_name_resource_actions",
+    "application_service__run_resource_action": "api_v1_applications_name_resource_actions",
+    "application_service__list_resource_links": "api_v1_applications_name_resource_links",
+    "application_service__revision_chart_details": "api_v1_applications_name_revisions_revision_chartdetails",
+    "application_service__revision_metadata": "api_v1_applications_name_revisions_revision_metadata",
+    "application_service__rollback": "api_v1_applications_name_rollback",
+    "application_service__update_spec": "api_v1_applications_name_spec",
+    "application_service__sync": "api_v1_applications_name_sync",
+    "application_service__get_application_sync_windows": "api_v1_applications_name_syncwindows",
+    "application_set_service__list": "api_v1_applicationsets",
+    "application_set_service__create": "api_v1_applicationsets",
+    "application_set_service__generate": "api_v1_applicationsets_generate",
+    "application_set_service__get": "api_v1_applicationsets_name",
+    "application_set_service__delete": "api_v1_applicationsets_name",
+    "application_set_service__resource_tree": "api_v1_applicationsets_name_resource_tree",
+    "certificate_service__list_certificates": "api_v1_certificates",
+    "certificate_service__create_certificate": "api_v1_certificates",
+    "certificate_service__delete_certificate": "api_v1_certificates",
+    "cluster_service__list": "api_v1_clusters",
+    "cluster_service__create": "api_v1_clusters",
+    "cluster_service__get": "api_v1_clusters_id_value",
+    "cluster_service__update": "api_v1_clusters_id_value",
+    "cluster_service__delete": "api_v1_clusters_id_value",
+    "cluster_service__invalidate_cache": "api_v1_clusters_id_value_invalidate_cache",
+    "cluster_service__rotate_auth": "api_v1_clusters_id_value_rotate_auth",
+    "gpg_key_service__list": "api_v1_gpgkeys",
+    "gpg_key_service__create": "api_v1_gpgkeys",
+    "gpg_key_service__delete": "api_v1_gpgkeys",
+    "gpg_key_service__get": "api_v1_gpgkeys_keyid",
+    "notification_service__list_services": "api_v1_notifications_services",
+    "notification_service__list_templates": "api_v1_notifications_templates",
+    "notification_service__list_triggers": "api_v1_notifications_triggers",
+    "project_service__list": "api_v1_projects",
+    "project_service__create": "api_v1_projects",
+    "project_service__get": "api_v1_projects_name",
+    "project_service__delete": "api_v1_projects_name",
+    "project_service__get_detailed_project": "api_v1_projects_name_detailed",
+    "project_service__list_events": "api_v1_projects_name_events",
+    "project_service__get_global_projects": "api_v1_projects_name_globalprojects",
+    "project_service__list_links": "api_v1_projects_name_links",
+    "project_service__get_sync_windows_state": "api_v1_projects_name_syncwindows",
+    "project_service__update": "api_v1_projects_project_metadata_name",
+    "project_service__create_token": "api_v1_projects_project_roles_role_token",
+    "project_service__delete_token": "api_v1_projects_project_roles_role_token_iat",
+    "repo_creds_service__list_repository_credentials": "api_v1_repocreds",
+    "repo_creds_service__create_repository_credentials": "api_v1_repocreds",
+    "repo_creds_service__update_repository_credentials": "api_v1_repocreds_creds_url",
+    "repo_creds_service__delete_repository_credentials": "api_v1_repocreds_url",
+    "repository_service__list_repositories": "api_v1_repositories",
+    "repository_service__create_repository": "api_v1_repositories",
+    "repository_service__update_repository": "api_v1_repositories_repo_repo",
+    "repository_service__get": "api_v1_repositories_repo",
+    "repository_service__delete_repository": "api_v1_repositories_repo",
+    "repository_service__list_apps": "api_v1_repositories_repo_apps",
+    "repository_service__get_helm_charts": "api_v1_repositories_repo_helmcharts",
+    "repository_service__list_refs": "api_v1_repositories_repo_refs",
+    "repository_service__validate_access": "api_v1_repositories_repo_validate",
+    "repository_service__get_app_details": "api_v1_repositories_source_repourl_appdetails",
+    "session_service__create": "api_v1_session",
+    "session_service__delete": "api_v1_session",
+    "session_service__get_user_info": "api_v1_session_userinfo",
+    "settings_service__get": "api_v1_settings",
+    "settings_service__get_plugins": "api_v1_settings_plugins",
+    "application_service__watch": "api_v1_stream_applications",
+    "application_service__watch_resource_tree": "api_v1_stream_applications_applicationname_resource_tree",
+    "repo_creds_service__list_write_repository_credentials": "api_v1_write_repocreds",
+    "repo_creds_service__create_write_repository_credentials": "api_v1_write_repocreds",
+    "repo_creds_service__update_write_repository_credentials": "api_v1_write_repocreds_creds_url",
+    "repo_creds_service__delete_write_repository_credentials": "api_v1_write_repocreds_url",
+    "repository_service__list_write_repositories": "api_v1_write_repositories",
+    "repository_service__create_write_repository": "api_v1_write_repositories",
+    "repository_service__update_write_repository": "api_v1_write_repositories_repo_repo",
+    "repository_service__get_write": "api_v1_write_repositories_repo",
+    "repository_service__delete_write_repository": "api_v1_write_repositories_repo",
+    "repository_service__validate_write_access": "api_v1_write_repositories_repo_validate",
+    "version_service__version": "api_version",
+    "application_service__query": "application_query",
+    "application_service__sync_many": "application_bulk_sync",
+    "application_service__get_many": "application_get_many",
+    "application_service__aggregate": "application_aggregate",
+    "application_service__pod_logs_many": "application_pod_logs_many",
+    "application_service__resource_subtree": "application_resource_graph",
+    "application_service__resource_ancestry": "application_resource_graph",
+    "application_service__unhealthy_resources": "application_resource_graph",
+}
+
+# Tools that only read, annotated readOnlyHint so clients know they are safe to retry
+READ_ONLY_TOOLS = frozenset({
+    "account_service__list_accounts",
+    "account_service__can_i",
+    "account_service__get_account",
+    "application_service__list",
+    "application_service__get_manifests_with_files",
+    "application_service__managed_resources",
+    "application_service__resource_tree",
+    "application_service__get",
+    "application_service__list_resource_events",
+    "application_service__list_links",
+    "application_service__pod_logs2",
+    "application_service__get_manifests",
+    "application_service__pod_logs",
+    "application_service__get_resource",
+    "application_service__list_resource_actions",
+    "application_service__list_resource_links",
+    "application_service__revision_chart_details",
+    "application_service__revision_metadata",
+    "application_service__get_application_sync_windows",
+    "application_set_service__list",
+    "application_set_service__generate",
+    "application_set_service__get",
+    "application_set_service__resource_tree",
+    "certificate_service__list_certificates",
+    "cluster_service__list",
+    "cluster_service__get",
+    "gpg_key_service__list",
+    "gpg_key_service__get",
+    "notification_service__list_services",
+    "notification_service__list_templates",
+    "notification_service__list_triggers",
+    "project_service__list",
+    "project_service__get",
+    "project_service__get_detailed_project",
+    "project_service__list_events",
+    "project_service__get_global_projects",
+    "project_service__list_links",
+    "project_service__get_sync_windows_state",
+    "repo_creds_service__list_repository_credentials",
+    "repository_service__list_repositories",
+    "repository_service__get",
+    "repository_service__list_apps",
+    "repository_service__get_helm_charts",
+    "repository_service__list_refs",
+    "repository_service__validate_access",
+    "repository_service__get_app_details",
+    "session_service__get_user_info",
+    "settings_service__get",
+    "settings_service__get_plugins",
+    "application_service__watch",
+    "application_service__watch_resource_tree",
+    "repo_creds_service__list_write_repository_credentials",
+    "repository_service__list_write_repositories",
+    "repository_service__get_write",
+    "repository_service__validate_write_access",
+    "version_service__version",
+    "application_service__query",
+    "application_service__get_many",
+    "application_service__aggregate",
+    "application_service__pod_logs_many",
+    "application_service__resource_subtree",
+    "application_service__resource_ancestry",
+    "application_service__unhealthy_resources",
+})
+
+
+def load_tool(name: str) -> Callable:
+    """Import the module of a tool and return its function wrapped with response shaping."""
+    module = importlib.import_module(f"{TOOLS_PACKAGE}.{TOOL_MANIFEST[name]}")
+    return shape_response(getattr(module, name))
+
+
+def tool_annotations(name: str) -> ToolAnnotations:
+    return ToolAnnotations(readOnlyHint=name in READ_ONLY_TOOLS)
+
+
+def manifest_fingerprint() -> str:
+    """Hash the manifest, the tool and shaping sources and the mcp version that produced the schemas."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(TOOL_MANIFEST, sort_keys=True).encode())
+    digest.update(json.dumps(sorted(READ_ONLY_TOOLS)).encode())
+    digest.update(importlib.metadata.version("mcp").encode())
+    sources = sorted(set(TOOL_MANIFEST.values()))
+    paths = [os.path.join(PACKAGE_DIR, "tools", f"{module}.py") for module in sources]
+    paths.append(os.path.join(PACKAGE_DIR, "utils", "shaping.py"))
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def encode_tool_result(result: Any, tool: Tool) -> Any:
+    """
+    Turn a tool result into MCP content.
+
+    With a fast codec the result is encoded once, compactly, and the same object
+    is handed over as structured content; FastMCP's own conversion pretty-prints
+    it with pydantic and validates and copies it again for the output schema.
+    """
+    if not codec.FAST_CODEC or not isinstance(result, dict):
+        return tool.fn_metadata.convert_result(result)
+    content = [TextContent(type="text", text=codec.dumps(result).decode())]
+    if tool.output_schema is None:
+        return content
+    return content, {"result": result} if tool.fn_metadata.wrap_output else result
+
+
+class CodecTool(Tool):
+    """A tool whose results are converted by `encode_tool_result`."""
+
+    async def run(self, arguments: Dict[str, Any], context=None, convert_result: bool = False) -> Any:
+        result = await super().run(arguments, context=context)
+        return encode_tool_result(result, self) if convert_result else result
+
+
+class LazyTool(Tool):
+    """A tool registered from cached schemas that imports its implementation on first call."""
+
+    output_schema_cache: Optional[Dict[str, Any]] = None
+    _resolved: Optional[Tool] = PrivateAttr(None)
+
+    @property
+    def output_schema(self) -> Optional[Dict[str, Any]]:
+        return self.output_schema_cache
+
+    def resolve(self) -> Tool:
+        if self._resolved is None:
+            logger.debug(f"Loading tool implementation for {self.name}")
+            self._resolved = Tool.from_function(load_tool(self.name), name=self.name, annotations=self.annotations)
+        return self._resolved
+
+    async def run(self, arguments: Dict[str, Any], context=None, convert_result: bool = False) -> Any:
+        tool = self.resolve()
+        result = await tool.run(arguments, context=context)
+        return encode_tool_result(result, tool) if convert_result else result
+
+
+async def _placeholder() -> None:
+    pass
+
+
+def load_schema_cache(path: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Return cached tool schemas if the cache exists and matches the current manifest."""
+    try:
+        with open(path or SCHEMA_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("fingerprint") != manifest_fingerprint():
+        logger.info("Tool schema cache is stale, rebuilding")
+        return None
+    return cache["tools"]
+
+
+def write_schema_cache(tools: List[Tool], path: Optional[str] = None) -> None:
+    """Persist the schemas of fully loaded tools for the next startup."""
+    cache = {
+        "fingerprint": manifest_fingerprint(),
+        "tools": [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.parameters,
+                "output_schema": tool.output_schema,
+            }
+            for tool in tools
+        ],
+    }
+    path = path or SCHEMA_CACHE_PATH
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"Could not write tool schema cache to {path}: {e}")
+
+
+def register_tools(mcp: FastMCP, lazy: bool = LAZY_TOOLS) -> None:
+    """Register every tool in TOOL_MANIFEST, from the schema cache when possible."""
+    cached = load_schema_cache() if lazy else None
+    if cached is not None:
+        metadata = func_metadata(_placeholder)
+        for entry in cached:
+            # FastMCP has no public hook for pre-built tools, so they are added to its tool manager directly
+            mcp._tool_manager._tools[entry["name"]] = LazyTool(
+                fn=_placeholder,
+                name=entry["name"],
+                description=entry["description"],
+                parameters=entry["parameters"],
+                fn_metadata=metadata,
+                is_async=True,
+                annotations=tool_annotations(entry["name"]),
+                output_schema_cache=entry["output_schema"],
+            )
+        logger.debug(f"Registered {len(cached)} tools from schema cache")
+        return
+
+    for name in TOOL_MANIFEST:
+        tool = CodecTool.from_function(load_tool(name), name=name, annotations=tool_annotations(name))
+        mcp._tool_manager._tools[tool.name] = tool
+    if lazy:
+        write_schema_cache(mcp._tool_manager.list_tools())
+
+
+if __name__ == "__main__":
+    # Prebuild the schema cache, e.g. while building a container image
+    register_tools(FastMCP("ARGOCD MCP Server"), lazy=True)
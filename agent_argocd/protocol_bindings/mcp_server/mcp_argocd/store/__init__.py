@@ -0,0 +1,4 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-memory stores kept in sync with the ArgoCD API server."""
@@ -0,0 +1,153 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compact records for cached applications and resource tree nodes"""
+
+import sys
+from typing import Optional, Dict, Any, Tuple
+
+
+def _intern(value: Any) -> str:
+    """Interned copy of a string field, so the many repeats of a namespace, kind or URL share one object."""
+    return sys.intern(value) if isinstance(value, str) else ""
+
+
+class ResourceNode:
+    """
+    The fields of a resource tree node that graph queries read.
+
+    `parents` holds the ids (uid, or the joined key for refs without one) of
+    the owners listed in parentRefs. Everything else in a node, such as
+    networking info, images and createdAt, is dropped.
+    """
+
+    __slots__ = ("group", "version", "kind", "namespace", "name", "uid", "health", "message", "parents")
+
+    def __init__(
+        self,
+        group: str,
+        version: str,
+        kind: str,
+        namespace: str,
+        name: str,
+        uid: str = "",
+        health: Optional[str] = None,
+        message: Optional[str] = None,
+        parents: Tuple[str, ...] = (),
+    ):
+        self.group = group
+        self.version = version
+        self.kind = kind
+        self.namespace = namespace
+        self.name = name
+        self.uid = uid
+        self.health = health
+        self.message = message
+        self.parents = parents
+
+    @classmethod
+    def from_dict(cls, node: Dict[str, Any]) -> "ResourceNode":
+        health = node.get("health") or {}
+        return cls(
+            _intern(node.get("group")),
+            _intern(node.get("version")),
+            _intern(node.get("kind")),
+            _intern(node.get("namespace")),
+            node.get("name") or "",
+            node.get("uid") or "",
+            _intern(health.get("status")) or None,
+            health.get("message") or None,
+            tuple(ref.get("uid") or "/".join(_ref_key(ref)) for ref in node.get("parentRefs") or []),
+        )
+
+    @property
+    def key(self) -> Tuple[str, str, str, str]:
+        return (self.group, self.kind, self.namespace, self.name)
+
+    @property
+    def id(self) -> str:
+        return self.uid or "/".join(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResourceNode):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"ResourceNode({self.kind}/{self.namespace}/{self.name}, health={self.health})"
+
+
+def _ref_key(ref: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    return (ref.get("group") or "", ref.get("kind") or "", ref.get("namespace") or "", ref.get("name") or "")
+
+
+class CompactApplication:
+    """
+    The fields of an application that inventory queries and fleet counts read.
+
+    `to_dict` rebuilds a sparse Application object with only these fields, in
+    the API shape, for code written against full applications.
+    """
+
+    __slots__ = (
+        "namespace",
+        "name",
+        "resource_version",
+        "labels",
+        "project",
+        "repos",
+        "server",
+        "destination_name",
+        "destination_namespace",
+        "health",
+        "sync",
+        "revision",
+        "phase",
+    )
+
+    def __init__(self, **fields: Any):
+        for field in self.__slots__:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_dict(cls, app: Dict[str, Any]) -> "CompactApplication":
+        metadata = app.get("metadata") or {}
+        spec = app.get("spec") or {}
+        status = app.get("status") or {}
+        destination = spec.get("destination") or {}
+        sources = spec.get("sources") or ([spec["source"]] if spec.get("source") else [])
+        return cls(
+            namespace=_intern(metadata.get("namespace")),
+            name=metadata.get("name") or "",
+            resource_version=metadata.get("resourceVersion"),
+            labels=tuple((_intern(key), _intern(value)) for key, value in (metadata.get("labels") or {}).items()),
+            project=_intern(spec.get("project")) or None,
+            repos=tuple(_intern(source.get("repoURL")) for source in sources),
+            server=_intern(destination.get("server")) or None,
+            destination_name=_intern(destination.get("name")) or None,
+            destination_namespace=_intern(destination.get("namespace")) or None,
+            health=_intern((status.get("health") or {}).get("status")) or None,
+            sync=_intern((status.get("sync") or {}).get("status")) or None,
+            revision=(status.get("sync") or {}).get("revision"),
+            phase=_intern((status.get("operationState") or {}).get("phase")) or None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        destination = {"server": self.server, "name": self.destination_name, "namespace": self.destination_namespace}
+        spec = {"project": self.project, "destination": {k: v for k, v in destination.items() if v}}
+        if len(self.repos) == 1:
+            spec["source"] = {"repoURL": self.repos[0]}
+        elif self.repos:
+            spec["sources"] = [{"repoURL": repo} for repo in self.repos]
+        status = {}
+        if self.health:
+            status["health"] = {"status": self.health}
+        if self.sync or self.revision:
+            status["sync"] = {k: v for k, v in (("status", self.sync), ("revision", self.revision)) if v}
+        if self.phase:
+            status["operationState"] = {"phase": self.phase}
+        return {
+            "metadata": {"namespace": self.namespace, "name": self.name, "resourceVersion": self.resource_version, "labels": dict(self.labels)},
+            "spec": spec,
+            "status": status,
+        }
@@ -0,0 +1,173 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Content-addressed cache for responses that are fixed by a pinned revision"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple, Any
+
+CONTENT_CACHE_ENABLED = os.getenv("ARGOCD_CONTENT_CACHE_ENABLED", "true").lower() == "true"
+CONTENT_CACHE_MAX_BYTES = int(os.getenv("ARGOCD_CONTENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CONTENT_CACHE_DIR = os.getenv("ARGOCD_CONTENT_CACHE_DIR")
+CONTENT_CACHE_MAX_DISK_BYTES = int(os.getenv("ARGOCD_CONTENT_CACHE_MAX_DISK_BYTES", str(512 * 1024 * 1024)))
+
+# A full git commit SHA (SHA-1 or SHA-256); branches, tags and HEAD can move
+COMMIT_SHA = re.compile(r"^[0-9a-f]{40}$|^[0-9a-f]{64}$")
+# A Helm chart version, immutable once published to a chart repository
+CHART_VERSION = re.compile(r"^v?\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
+
+logger = logging.getLogger("mcp_argocd")
+
+
+def is_pinned_revision(revision: Optional[str], allow_chart_version: bool = False) -> bool:
+    """Whether a revision always resolves to the same content."""
+    if not revision:
+        return False
+    revision = str(revision)
+    return bool(COMMIT_SHA.match(revision) or (allow_chart_version and CHART_VERSION.match(revision)))
+
+
+class ContentCache:
+    """
+    LRU cache of immutable responses with a byte budget and an optional disk tier.
+
+    Entries never expire: a key names content that cannot change. The memory tier
+    evicts least-recently-used entries beyond `max_bytes`; when `directory` is set
+    every entry is also written there (one JSON file per key hash) and survives
+    restarts, with the oldest files removed beyond `max_disk_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = CONTENT_CACHE_MAX_BYTES,
+        directory: Optional[str] = CONTENT_CACHE_DIR,
+        max_disk_bytes: int = CONTENT_CACHE_MAX_DISK_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self.bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self.disk_bytes = 0
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        if directory:
+            self._scan_disk()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _scan_disk(self) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+        except OSError as e:
+            logger.warning(f"Content cache directory {self.directory} is unusable, keeping the cache in memory: {e}")
+            self.directory = None
+            return
+        for entry in sorted(files, key=lambda e: e.stat().st_mtime):
+            self._disk[entry.path] = entry.stat().st_size
+            self.disk_bytes += entry.stat().st_size
+
+    def _path(self, key: Tuple) -> str:
+        digest = hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0]
+        if self.directory:
+            path = self._path(key)
+            if path in self._disk:
+                try:
+                    with open(path, "rb") as f:
+                        raw = f.read()
+                    value = json.loads(raw)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Dropping unreadable content cache file {path}: {e}")
+                    self._remove_file(path)
+                else:
+                    self._disk.move_to_end(path)
+                    self._remember(key, value, len(raw))
+                    self.stats["disk_hits"] += 1
+                    return value
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: Tuple, value: Any) -> None:
+        raw = json.dumps(value, separators=(",", ":")).encode()
+        self._remember(key, value, len(raw))
+        if self.directory:
+            self._write(self._path(key), raw)
+
+    def _remember(self, key: Tuple, value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous[1]
+        self._entries[key] = (value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.stats["evictions"] += 1
+
+    def _write(self, path: str, raw: bytes) -> None:
+        try:
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write content cache file {path}: {e}")
+            return
+        self.disk_bytes -= self._disk.pop(path, 0)
+        self._disk[path] = len(raw)
+        self.disk_bytes += len(raw)
+        while self.disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            self._remove_file(next(iter(self._disk)))
+
+    def _remove_file(self, path: str) -> None:
+        self.disk_bytes -= self._disk.pop(path, 0)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+
+content_cache = ContentCache()
+
+
+def spec_fingerprint(app: dict) -> str:
+    """Hash of an application spec, for responses rendered from the spec as well as a revision."""
+    return hashlib.sha256(json.dumps(app.get("spec", {}), sort_keys=True).encode()).hexdigest()
+
+
+def content_key(kind: str, app: str, revision: Any, *parts: Any, allow_chart_version: bool = False) -> Optional[Tuple]:
+    """
+    Cache key for a revision-addressed response, or None when it must not be cached.
+
+    `revision` is one revision or the per-source list of a multi-source request;
+    every one of them must be pinned. `parts` carry everything else that selects
+    the content, such as the source position and application namespace.
+    """
+    revisions = [revision] if not isinstance(revision, (list, tuple)) else list(revision)
+    if not CONTENT_CACHE_ENABLED or not revisions:
+        return None
+    if not all(is_pinned_revision(r, allow_chart_version) for r in revisions):
+        return None
+    return (kind, app, tuple(str(r) for r in revisions), *(tuple(p) if isinstance(p, list) else p for p in parts))
@@ -0,0 +1,180 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Secondary hash indexes over applications for set-based filtering"""
+
+from typing import Dict, Any, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Indexed field name -> description, in the order they are reported
+INDEXED_FIELDS = {
+    "project": "spec.project",
+    "health": "status.health.status",
+    "sync": "status.sync.status",
+    "repo": "spec.source(s).repoURL",
+    "server": "spec.destination.server (or destination.name)",
+    "namespace": "spec.destination.namespace",
+    "label": "metadata.labels as key=value",
+    "label_key": "metadata.labels keys",
+}
+
+
+def parse_label_selector(selector: str) -> Optional[List[Tuple[str, str, Optional[str]]]]:
+    """
+    Parse an equality-based label selector into (key, operator, value) requirements.
+
+    Supports `k=v`, `k==v`, `k!=v`, `k` and `!k`. Returns None for set-based
+    selectors (`in`, `notin`), which are left to the API server.
+    """
+    requirements = []
+    for term in (t.strip() for t in selector.split(",")):
+        if not term:
+            continue
+        if "(" in term or " in " in term or " notin " in term:
+            return None
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            requirements.append((key.strip(), "!=", value.strip()))
+        elif "==" in term:
+            key, value = term.split("==", 1)
+            requirements.append((key.strip(), "=", value.strip()))
+        elif "=" in term:
+            key, value = term.split("=", 1)
+            requirements.append((key.strip(), "=", value.strip()))
+        elif term.startswith("!"):
+            requirements.append((term[1:].strip(), "!", None))
+        else:
+            requirements.append((term, "exists", None))
+    return requirements
+
+
+def index_values(app: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """Extract the indexed values of one application."""
+    metadata = app.get("metadata") or {}
+    spec = app.get("spec") or {}
+    status = app.get("status") or {}
+    destination = spec.get("destination") or {}
+    labels = metadata.get("labels") or {}
+
+    repos = {source.get("repoURL") for source in spec.get("sources") or []}
+    if spec.get("source"):
+        repos.add(spec["source"].get("repoURL"))
+
+    values = {
+        "project": {spec.get("project")},
+        "health": {(status.get("health") or {}).get("status")},
+        "sync": {(status.get("sync") or {}).get("status")},
+        "repo": repos,
+        "server": {destination.get("server") or destination.get("name")},
+        "namespace": {destination.get("namespace")},
+        "label": {f"{key}={value}" for key, value in labels.items()},
+        "label_key": set(labels),
+    }
+    for field_values in values.values():
+        field_values.discard(None)
+    return values
+
+
+class ApplicationIndex:
+    """
+    Hash indexes mapping each indexed field value to the set of application keys.
+
+    Entries are updated incrementally on add/remove, so compound filters are
+    answered with set intersections instead of scanning every application.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, Dict[str, Set[Hashable]]] = {field: {} for field in INDEXED_FIELDS}
+        self._entries: Dict[Hashable, Dict[str, Set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> Set[Hashable]:
+        return set(self._entries)
+
+    def add(self, key: Hashable, app: Dict[str, Any]) -> None:
+        self.remove(key)
+        values = index_values(app)
+        for field, field_values in values.items():
+            for value in field_values:
+                self._index[field].setdefault(value, set()).add(key)
+        self._entries[key] = values
+
+    def remove(self, key: Hashable) -> None:
+        values = self._entries.pop(key, None)
+        if values is None:
+            return
+        for field, field_values in values.items():
+            for value in field_values:
+                keys = self._index[field].get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._index[field][value]
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def lookup(self, field: str, values: Iterable[str]) -> Set[Hashable]:
+        """Return the keys whose field matches any of the given values."""
+        index = self._index[field]
+        result: Set[Hashable] = set()
+        for value in values:
+            result |= index.get(value, set())
+        return result
+
+    def values(self, field: str) -> Dict[str, int]:
+        """Return each distinct value of a field with the number of applications holding it."""
+        return {value: len(keys) for value, keys in self._index[field].items()}
+
+    def match(self, field: str, spec: str) -> Set[Hashable]:
+        """
+        Return keys matching a filter spec for one field.
+
+        The spec is a comma-separated list of values (union); a leading `!`
+        negates the whole spec, e.g. `!Healthy` or `!Synced,Unknown`.
+        """
+        negate = spec.startswith("!")
+        values = [v.strip() for v in spec.lstrip("!").split(",") if v.strip()]
+        matched = self.lookup(field, values)
+        return self.keys() - matched if negate else matched
+
+    def query(self, filters: Dict[str, Optional[str]], selector: Optional[str] = None) -> Set[Hashable]:
+        """
+        Intersect the matches of every non-empty filter.
+
+        Args:
+            filters: Field name -> filter spec (see `match`)
+            selector: Equality-based label selector (see `parse_label_selector`)
+
+        Returns:
+            The set of matching application keys
+
+        Raises:
+            ValueError: If the selector uses set-based requirements
+        """
+        candidates = [self.match(field, spec) for field, spec in filters.items() if spec]
+        if selector:
+            requirements = parse_label_selector(selector)
+            if requirements is None:
+                raise ValueError(f"Unsupported label selector: {selector}")
+            for key, op, value in requirements:
+                if op == "=":
+                    candidates.append(self.lookup("label", [f"{key}={value}"]))
+                elif op == "!=":
+                    candidates.append(self.keys() - self.lookup("label", [f"{key}={value}"]))
+                elif op == "exists":
+                    candidates.append(self.lookup("label_key", [key]))
+                else:
+                    candidates.append(self.keys() - self.lookup("label_key", [key]))
+
+        if not candidates:
+            return self.keys()
+        # Intersect smallest first so each step touches as few keys as possible
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for keys in candidates[1:]:
+            if not result:
+                break
+            result &= keys
+        return result
@@ -0,0 +1,213 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Live in-memory application inventory fed by the /api/v1/stream/applications watch"""
+
+import os
+import asyncio
+import logging
+from typing import Optional, Dict, Tuple, Any, List, Set, Union
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import (
+    make_api_request,
+    stream_api_request,
+    StreamRequestError,
+)
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.compact import CompactApplication
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.indexes import ApplicationIndex, parse_label_selector
+
+INVENTORY_ENABLED = os.getenv("ARGOCD_INVENTORY_ENABLED", "false").lower() == "true"
+# Keep only the queried fields of each application; full objects are then read from the API
+INVENTORY_COMPACT = os.getenv("ARGOCD_INVENTORY_COMPACT", "false").lower() == "true"
+RELIST_TIMEOUT = int(os.getenv("ARGOCD_INVENTORY_RELIST_TIMEOUT", "120"))
+MIN_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+
+logger = logging.getLogger("mcp_argocd")
+
+
+class ApplicationInventory:
+    """
+    Local mirror of all ArgoCD applications.
+
+    Performs one initial list, then applies ADDED/MODIFIED/DELETED events from the
+    application watch stream. On disconnect the watch resumes from the last seen
+    resourceVersion; if the server rejects that version the inventory is relisted.
+    Applications are keyed by (namespace, name) and kept in secondary indexes.
+
+    With `compact`, each application is stored as a CompactApplication holding
+    only the fields the indexes and fleet counts read, a fraction of the memory
+    of the decoded JSON (see benchmarks/bench_memory.py). Full objects are then
+    not served: `get` and `list` return None so callers fall back to the API
+    server, unless `list` is asked for sparse objects only.
+    """
+
+    def __init__(self, compact: bool = INVENTORY_COMPACT):
+        self.compact = compact
+        self._apps: Dict[Tuple[str, str], Union[Dict[str, Any], CompactApplication]] = {}
+        self._namespaces_by_name: Dict[str, Set[str]] = {}
+        self.index = ApplicationIndex()
+        self.resource_version: Optional[str] = None
+        self.synced = False
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"relists": 0, "events": 0, "reconnects": 0}
+
+    def __len__(self) -> int:
+        return len(self._apps)
+
+    @staticmethod
+    def _key(app: Dict[str, Any]) -> Tuple[str, str]:
+        metadata = app.get("metadata", {})
+        return metadata.get("namespace", ""), metadata.get("name", "")
+
+    def replace(self, items: List[Dict[str, Any]], resource_version: Optional[str]) -> None:
+        """Replace the whole inventory with the result of a list call."""
+        self._apps = {}
+        self._namespaces_by_name = {}
+        self.index.clear()
+        for app in items:
+            self.upsert(app)
+        self.resource_version = resource_version
+
+    def upsert(self, app: Dict[str, Any]) -> None:
+        namespace, name = key = self._key(app)
+        self._apps[key] = CompactApplication.from_dict(app) if self.compact else app
+        self.index.add(key, app)
+        self._namespaces_by_name.setdefault(name, set()).add(namespace)
+
+    def remove(self, app: Dict[str, Any]) -> None:
+        namespace, name = key = self._key(app)
+        self._apps.pop(key, None)
+        self.index.remove(key)
+        namespaces = self._namespaces_by_name.get(name)
+        if namespaces is not None:
+            namespaces.discard(namespace)
+            if not namespaces:
+                del self._namespaces_by_name[name]
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        """Apply one watch event of the form {"result": {"type": ..., "application": {...}}}."""
+        result = event.get("result", event)
+        app = result.get("application")
+        if not app:
+            return
+        if result.get("type") == "DELETED":
+            self.remove(app)
+        else:
+            self.upsert(app)
+        version = app.get("metadata", {}).get("resourceVersion")
+        if version:
+            self.resource_version = version
+        self.stats["events"] += 1
+
+    def get(self, name: str, app_namespace: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return an application by name, or None if it is unknown, ambiguous across namespaces or only kept compact."""
+        if self.compact:
+            return None
+        if app_namespace:
+            return self._apps.get((app_namespace, name))
+        namespaces = self._namespaces_by_name.get(name)
+        if not namespaces or len(namespaces) > 1:
+            return None
+        return self._apps.get((next(iter(namespaces)), name))
+
+    def list(
+        self,
+        name: Optional[str] = None,
+        projects: Optional[List[str]] = None,
+        selector: Optional[str] = None,
+        repo: Optional[str] = None,
+        app_namespace: Optional[str] = None,
+        full: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return applications matching the same filters as the list API.
+
+        Returns None when the filters cannot be evaluated locally, or when full
+        objects are asked of a compact inventory, so the caller should fall back
+        to the API server. With `full=False` the items may be sparse objects
+        holding only the fields of CompactApplication.
+        """
+        if selector and parse_label_selector(selector) is None:
+            return None
+        if self.compact and full:
+            return None
+
+        if name:
+            keys = {(namespace, name) for namespace in self._namespaces_by_name.get(name, ())}
+        else:
+            keys = self.index.keys()
+        if projects:
+            keys &= self.index.lookup("project", projects)
+        if repo:
+            keys &= self.index.lookup("repo", [repo])
+        if selector:
+            keys &= self.index.query({}, selector=selector)
+        if app_namespace:
+            keys = {key for key in keys if key[0] == app_namespace}
+
+        items = [self._apps[key] for key in sorted(keys)]
+        if self.compact:
+            items = [app.to_dict() for app in items]
+        return {"metadata": {"resourceVersion": self.resource_version}, "items": items}
+
+    async def relist(self) -> None:
+        success, response = await make_api_request("/api/v1/applications", timeout=RELIST_TIMEOUT)
+        if not success:
+            raise StreamRequestError(response.get("error", "Failed to list applications"))
+        self.replace(response.get("items") or [], response.get("metadata", {}).get("resourceVersion"))
+        self.stats["relists"] += 1
+        self.synced = True
+        logger.info(f"Application inventory synced with {len(self)} applications")
+
+    async def run(self) -> None:
+        """Keep the inventory in sync until cancelled."""
+        backoff = MIN_BACKOFF
+        needs_relist = True
+        while True:
+            try:
+                if needs_relist:
+                    await self.relist()
+                    needs_relist = False
+                params = {"resourceVersion": self.resource_version} if self.resource_version else {}
+                async for event in stream_api_request("/api/v1/stream/applications", params=params):
+                    self.apply_event(event)
+                    backoff = MIN_BACKOFF
+                logger.debug("Application watch closed by server, resuming")
+            except asyncio.CancelledError:
+                raise
+            except StreamRequestError as e:
+                # 410 Gone means the resourceVersion is too old to resume from
+                needs_relist = needs_relist or e.status_code == 410
+                logger.warning(f"Application watch failed, retrying in {backoff:.0f}s: {e}")
+            except Exception as e:
+                logger.warning(f"Application watch interrupted, retrying in {backoff:.0f}s: {e}")
+            self.stats["reconnects"] += 1
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF)
+
+    def start(self) -> None:
+        """Start the background informer if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="argocd-application-informer")
+
+    async def stop(self) -> None:
+        """Stop the background informer and mark the inventory as stale."""
+        task, self._task = self._task, None
+        self.synced = False
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+inventory = ApplicationInventory()
+
+
+def get_inventory() -> Optional[ApplicationInventory]:
+    """Return the process-wide inventory if it is enabled and synced, otherwise None."""
+    if INVENTORY_ENABLED and inventory.synced:
+        return inventory
+    return None
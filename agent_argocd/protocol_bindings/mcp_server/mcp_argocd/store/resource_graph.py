@@ -0,0 +1,169 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Graph index over an application resource tree"""
+
+from collections import deque
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.compact import ResourceNode
+
+# (group, kind, namespace, name) of a resource; the core group is ''
+ResourceKey = Tuple[str, str, str, str]
+
+
+def summarize(node: ResourceNode, **extra: Any) -> Dict[str, Any]:
+    """The few fields of a node worth returning to the model."""
+    summary = {"kind": node.kind, "name": node.name}
+    if node.namespace:
+        summary["namespace"] = node.namespace
+    if node.health:
+        summary["health"] = node.health
+    if node.message:
+        summary["message"] = node.message
+    summary.update(extra)
+    return summary
+
+
+class ResourceGraph:
+    """
+    Index of resource tree nodes by uid and by (group, kind, namespace, name),
+    with parent -> children and child -> parents adjacency built from parentRefs.
+
+    Nodes are kept as compact ResourceNode records rather than the decoded
+    JSON. Subtree and ancestry walks only visit the nodes they return. Nodes
+    without a uid (rare, e.g. resources that failed to be created) get their
+    key as id.
+    """
+
+    def __init__(self, nodes: Optional[List[Dict[str, Any]]] = None):
+        self._nodes: Dict[str, ResourceNode] = {}
+        self._by_key: Dict[ResourceKey, str] = {}
+        self._by_kind_name: Dict[Tuple[str, str], List[str]] = {}
+        self._children: Dict[str, List[str]] = {}
+        for node in nodes or []:
+            self.add(ResourceNode.from_dict(node))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(self, node: ResourceNode) -> None:
+        node_id = node.id
+        if node_id in self._nodes:
+            self.remove(node_id)
+        self._nodes[node_id] = node
+        self._by_key[node.key] = node_id
+        self._by_kind_name.setdefault((node.kind, node.name), []).append(node_id)
+        for parent in node.parents:
+            self._children.setdefault(parent, []).append(node_id)
+
+    def remove(self, node_id: str) -> Optional[ResourceNode]:
+        node = self._nodes.pop(node_id, None)
+        if node is None:
+            return None
+        if self._by_key.get(node.key) == node_id:
+            del self._by_key[node.key]
+        same_name = self._by_kind_name.get((node.kind, node.name), [])
+        if node_id in same_name:
+            same_name.remove(node_id)
+            if not same_name:
+                del self._by_kind_name[(node.kind, node.name)]
+        for parent in node.parents:
+            children = self._children.get(parent)
+            if children and node_id in children:
+                children.remove(node_id)
+                if not children:
+                    del self._children[parent]
+        return node
+
+    def items(self) -> Iterator[Tuple[str, ResourceNode]]:
+        return iter(self._nodes.items())
+
+    def get(self, node_id: str) -> Optional[ResourceNode]:
+        return self._nodes.get(node_id)
+
+    def find(self, kind: str, name: str, namespace: Optional[str] = None, group: Optional[str] = None) -> List[str]:
+        """Ids of the nodes with this kind and name, narrowed by namespace and group when given."""
+        if namespace is not None and group is not None:
+            node_id = self._by_key.get((group, kind, namespace, name))
+            return [node_id] if node_id else []
+        return [
+            node_id
+            for node_id in self._by_kind_name.get((kind, name), [])
+            if (namespace is None or self._nodes[node_id].namespace == namespace)
+            and (group is None or self._nodes[node_id].group == group)
+        ]
+
+    def roots(self) -> List[str]:
+        """Nodes without a parent in the tree, i.e. the resources the application manages directly."""
+        return [node_id for node_id, node in self._nodes.items() if not any(parent in self._nodes for parent in node.parents)]
+
+    def children(self, node_id: str) -> List[str]:
+        return [child for child in self._children.get(node_id, []) if child in self._nodes]
+
+    def subtree(self, node_id: str, max_depth: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(id, depth) of a node and its descendants in breadth-first order."""
+        seen = {node_id}
+        result = []
+        queue = deque([(node_id, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            result.append((current, depth))
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for child in self.children(current):
+                if child not in seen:
+                    seen.add(child)
+                    queue.append((child, depth + 1))
+        return result
+
+    def ancestors(self, node_id: str) -> List[str]:
+        """Ids of every owner of a node, nearest first."""
+        seen = {node_id}
+        result = []
+        queue = deque(self._nodes[node_id].parents if node_id in self._nodes else ())
+        while queue:
+            current = queue.popleft()
+            if current in seen or current not in self._nodes:
+                continue
+            seen.add(current)
+            result.append(current)
+            queue.extend(self._nodes[current].parents)
+        return result
+
+    def unhealthy_leaves(self, node_id: Optional[str] = None) -> List[str]:
+        """
+        Nodes with a non-Healthy health status none of whose descendants is also unhealthy.
+
+        These are where a problem originates, e.g. the crash-looping Pod rather
+        than the Degraded ReplicaSet and Deployment above it. Searches the
+        subtree of `node_id`, or the whole tree, visiting every node once.
+        """
+        # Whether each visited node has an unhealthy node at or below it
+        below: Dict[str, bool] = {}
+        entered = set()
+        result = []
+        for start in [node_id] if node_id is not None else self.roots():
+            stack = [(start, False)]
+            while stack:
+                current, expanded = stack.pop()
+                if current in below:
+                    continue
+                children = self.children(current)
+                if not expanded:
+                    if current in entered:
+                        continue
+                    entered.add(current)
+                    stack.append((current, True))
+                    stack.extend((child, False) for child in children if child not in below)
+                    continue
+                unhealthy_below = any(below.get(child, False) for child in children)
+                unhealthy = self._unhealthy(current)
+                if unhealthy and not unhealthy_below:
+                    result.append(current)
+                below[current] = unhealthy or unhealthy_below
+        return result
+
+    def _unhealthy(self, node_id: str) -> bool:
+        status = self._nodes[node_id].health
+        return status is not None and status != "Healthy"
@@ -0,0 +1,233 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-application resource tree cache fed by the /api/v1/stream/applications/{name}/resource-tree watch"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import stream_api_request, StreamRequestError
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.compact import ResourceNode
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.resource_graph import ResourceGraph
+
+TREE_CACHE_ENABLED = os.getenv("ARGOCD_TREE_CACHE_ENABLED", "false").lower() == "true"
+TREE_CACHE_MAX_APPS = int(os.getenv("ARGOCD_TREE_CACHE_MAX_APPS", "20"))
+TREE_CACHE_IDLE_SECONDS = float(os.getenv("ARGOCD_TREE_CACHE_IDLE_SECONDS", "600"))
+# How often idle subscriptions are looked for while any application is watched
+TREE_CACHE_SWEEP_SECONDS = float(os.getenv("ARGOCD_TREE_CACHE_SWEEP_SECONDS", "60"))
+# How long the first query of an application waits for its initial tree before falling back to the API
+FIRST_TREE_TIMEOUT = float(os.getenv("ARGOCD_TREE_CACHE_FIRST_TREE_TIMEOUT", "10"))
+MIN_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+
+logger = logging.getLogger("mcp_argocd")
+
+
+class WatchedTree:
+    """
+    The resource tree of one application, kept current by its watch stream.
+
+    Every stream event carries the whole tree; only the nodes that were
+    added, changed or removed since the previous event are applied to the
+    graph, so the indexes of unchanged nodes are left untouched. The latest
+    tree is kept as received for callers that need every field of it.
+    """
+
+    def __init__(self, name: str, app_namespace: Optional[str] = None, clock=time.monotonic):
+        self.name = name
+        self.app_namespace = app_namespace
+        self.graph = ResourceGraph()
+        self.tree: Optional[Dict[str, Any]] = None
+        self.synced = asyncio.Event()
+        self.clock = clock
+        self.last_used = clock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"events": 0, "added": 0, "updated": 0, "removed": 0, "reconnects": 0}
+
+    def apply(self, tree: Dict[str, Any]) -> None:
+        """Bring the graph in line with a full tree from the stream."""
+        incoming = {node.id: node for node in map(ResourceNode.from_dict, tree.get("nodes") or [])}
+        for node_id in [node_id for node_id, _ in self.graph.items() if node_id not in incoming]:
+            self.graph.remove(node_id)
+            self.stats["removed"] += 1
+        for node_id, node in incoming.items():
+            current = self.graph.get(node_id)
+            if current is None:
+                self.stats["added"] += 1
+            elif current != node:
+                self.stats["updated"] += 1
+            else:
+                continue
+            self.graph.add(node)
+        self.tree = tree
+        self.stats["events"] += 1
+        self.synced.set()
+
+    async def run(self) -> None:
+        """Apply tree updates until cancelled, reconnecting with backoff."""
+        path = f"/api/v1/stream/applications/{self.name}/resource-tree"
+        params = {"appNamespace": self.app_namespace} if self.app_namespace else {}
+        backoff = MIN_BACKOFF
+        while True:
+            try:
+                async for event in stream_api_request(path, params=params):
+                    self.apply(event.get("result", event))
+                    backoff = MIN_BACKOFF
+                logger.debug(f"Resource tree watch of {self.name} closed by server, resuming")
+            except asyncio.CancelledError:
+                raise
+            except StreamRequestError as e:
+                logger.warning(f"Resource tree watch of {self.name} failed, retrying in {backoff:.0f}s: {e}")
+            except Exception as e:
+                logger.warning(f"Resource tree watch of {self.name} interrupted, retrying in {backoff:.0f}s: {e}")
+            self.stats["reconnects"] += 1
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name=f"argocd-resource-tree-{self.name}")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        self.synced.clear()
+        self.tree = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+class ResourceTreeCache:
+    """
+    Resource trees of recently queried applications, each watched on demand.
+
+    The first query of an application subscribes to its tree watch and waits
+    for the initial tree; later queries are local lookups. At most `max_apps`
+    trees are watched: the least recently used subscription is closed to make
+    room, and subscriptions unused for `idle_seconds` are closed as well by a
+    background sweep that runs every `sweep_seconds` while any tree is watched.
+    """
+
+    def __init__(
+        self,
+        max_apps: int = TREE_CACHE_MAX_APPS,
+        idle_seconds: float = TREE_CACHE_IDLE_SECONDS,
+        sweep_seconds: float = TREE_CACHE_SWEEP_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.max_apps = max_apps
+        self.idle_seconds = idle_seconds
+        self.sweep_seconds = min(sweep_seconds, idle_seconds)
+        self.clock = clock
+        self._trees: "OrderedDict[Tuple[str, str], WatchedTree]" = OrderedDict()
+        self._sweeper: Optional[asyncio.Task] = None
+        self.stats = {"hits": 0, "misses": 0, "timeouts": 0, "evictions": 0, "expirations": 0}
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    async def get(self, name: str, app_namespace: Optional[str] = None, timeout: float = FIRST_TREE_TIMEOUT) -> Optional[ResourceGraph]:
+        """
+        The current resource graph of an application.
+
+        Returns None when the initial tree did not arrive within `timeout`, so
+        the caller should fall back to the API server; the subscription is kept
+        and later queries are served once it has synced.
+        """
+        tree = await self._watched(name, app_namespace, timeout)
+        return tree.graph if tree is not None else None
+
+    async def get_tree(self, name: str, app_namespace: Optional[str] = None, timeout: float = FIRST_TREE_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """The latest resource tree of an application as the API returns it, which callers must not mutate; None as for `get`."""
+        tree = await self._watched(name, app_namespace, timeout)
+        return tree.tree if tree is not None else None
+
+    async def _watched(self, name: str, app_namespace: Optional[str], timeout: float) -> Optional[WatchedTree]:
+        await self.expire()
+        key = (app_namespace or "", name)
+        tree = self._trees.get(key)
+        if tree is not None:
+            self._trees.move_to_end(key)
+        else:
+            tree = WatchedTree(name, app_namespace, self.clock)
+            self._trees[key] = tree
+            tree.start()
+            self._start_sweeper()
+            while len(self._trees) > self.max_apps:
+                _, evicted = self._trees.popitem(last=False)
+                self.stats["evictions"] += 1
+                logger.debug(f"Closing resource tree watch of {evicted.name} to stay within {self.max_apps} watched applications")
+                await evicted.stop()
+        tree.last_used = self.clock()
+
+        if tree.synced.is_set():
+            self.stats["hits"] += 1
+            return tree
+        self.stats["misses"] += 1
+        try:
+            await asyncio.wait_for(tree.synced.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.warning(f"No resource tree for {name} within {timeout:.0f}s, falling back to the API")
+            return None
+        return tree
+
+    async def expire(self) -> None:
+        """Close the subscriptions that have not been queried for `idle_seconds`."""
+        now = self.clock()
+        while self._trees:
+            key, tree = next(iter(self._trees.items()))
+            if now - tree.last_used < self.idle_seconds:
+                break
+            del self._trees[key]
+            self.stats["expirations"] += 1
+            logger.debug(f"Closing idle resource tree watch of {tree.name}")
+            await tree.stop()
+
+    async def _sweep(self) -> None:
+        """Expire idle subscriptions until none are left, so no watch outlives its last query by much."""
+        while self._trees:
+            await asyncio.sleep(self.sweep_seconds)
+            try:
+                await self.expire()
+            except Exception as e:
+                logger.warning(f"Expiring idle resource tree watches failed: {e}")
+
+    def _start_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep(), name="argocd-resource-tree-sweeper")
+
+    async def stop(self) -> None:
+        """Close every subscription."""
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.cancel()
+            try:
+                await sweeper
+            except asyncio.CancelledError:
+                pass
+        trees, self._trees = list(self._trees.values()), OrderedDict()
+        for tree in trees:
+            await tree.stop()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "watched": len(self._trees),
+            "nodes": sum(len(tree.graph) for tree in self._trees.values()),
+        }
+
+
+tree_cache = ResourceTreeCache()
+
+
+def get_tree_cache() -> Optional[ResourceTreeCache]:
+    """Return the process-wide resource tree cache if it is enabled, otherwise None."""
+    return tree_cache if TREE_CACHE_ENABLED else None
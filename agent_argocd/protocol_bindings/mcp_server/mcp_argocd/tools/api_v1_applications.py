@@ -7,6 +7,7 @@
 import logging
 from typing import Dict, Any, List
 from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import get_inventory
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -54,6 +55,19 @@ async def application_service__list(
     Raises:
         Exception: If the API request fails or returns an error.
     """
+    inventory = get_inventory()
+    if inventory is not None and param_refresh is None and param_resourceVersion is None:
+        response = inventory.list(
+            name=param_name,
+            projects=(param_projects or []) + (param_project or []),
+            selector=param_selector,
+            repo=param_repo,
+            app_namespace=param_appNamespace,
+        )
+        if response is not None:
+            logger.debug("Serving application list from local inventory")
+            return response
+
     logger.debug("Making GET request to /api/v1/applications")
 
     params = {}
@@ -7,6 +7,7 @@
 import logging
 from typing import Dict, Any
 from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.tree_cache import get_tree_cache
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -42,6 +43,13 @@ async def application_service__resource_tree(
     Raises:
         Exception: If the API request fails or returns an error, an exception is raised with the error details.
     '''
+    # The server reads only the application and its namespace and project; the watched tree carries no project to check
+    cache = get_tree_cache()
+    if cache is not None and param_project is None:
+        tree = await cache.get_tree(path_applicationName, param_appNamespace)
+        if tree is not None:
+            return tree
+
     logger.debug("Making GET request to /api/v1/applications/{applicationName}/resource-tree")
 
     params = {}
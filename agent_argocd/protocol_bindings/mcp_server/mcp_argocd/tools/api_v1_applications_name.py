@@ -7,6 +7,7 @@
 import logging
 from typing import Dict, Any, List
 from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import get_inventory
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -42,6 +43,14 @@ async def application_service__get(
     Raises:
         Exception: If the API request fails or returns an error.
     '''
+    inventory = get_inventory()
+    if inventory is not None and param_refresh is None and param_resourceVersion is None:
+        app = inventory.get(path_name, param_appNamespace)
+        projects = (param_projects or []) + (param_project or [])
+        if app is not None and (not projects or app.get("spec", {}).get("project") in projects):
+            logger.debug("Serving application from local inventory")
+            return app
+
     logger.debug("Making GET request to /api/v1/applications/{name}")
 
     params = {}
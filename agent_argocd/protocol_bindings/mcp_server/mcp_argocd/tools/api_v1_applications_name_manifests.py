@@ -5,14 +5,41 @@
 """Tools for /api/v1/applications/{name}/manifests operations"""
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.content_cache import content_cache, content_key, is_pinned_revision, spec_fingerprint
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store import content_cache as content_store
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import get_inventory
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("mcp_tools")
 
 
+def _all_pinned(revision: Any) -> bool:
+    revisions = revision if isinstance(revision, (list, tuple)) else [revision]
+    return all(is_pinned_revision(r) for r in revisions)
+
+
+def _target_revisions(app: Dict[str, Any]) -> List[Optional[str]]:
+    """The revisions the application renders when the request names none, one per source."""
+    spec = app.get("spec", {})
+    sources = spec.get("sources") or [spec.get("source") or {}]
+    return [source.get("targetRevision") for source in sources]
+
+
+async def _application(name: str, app_namespace: Optional[str], project: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The application from the inventory, or from the API when the inventory is off or does not hold it."""
+    inventory = get_inventory()
+    app = inventory.get(name, app_namespace) if inventory is not None else None
+    if app is not None:
+        return app
+    # Answered from the revalidation cache with a 304 while the application is unchanged
+    params = {k: v for k, v in (("appNamespace", app_namespace), ("project", project)) if v is not None}
+    success, response = await make_api_request(f"/api/v1/applications/{name}", params=params)
+    return response if success else None
+
+
 async def application_service__get_manifests(
     path_name: str,
     param_revision: str = None,
@@ -65,6 +92,26 @@ async def application_service__get_manifests(
     flat_body = {}
     data = assemble_nested_body(flat_body)
 
+    # Manifests depend on the application spec as well as the revision, so the key holds both
+    cache_key = None
+    revision = param_revisions if param_revisions else param_revision
+    if content_store.CONTENT_CACHE_ENABLED and (revision is None or _all_pinned(revision)):
+        app = await _application(path_name, param_appNamespace, param_project)
+        if app is not None:
+            cache_key = content_key(
+                "manifests",
+                path_name,
+                revision if revision is not None else _target_revisions(app),
+                param_appNamespace,
+                param_project,
+                param_sourcePositions,
+                spec_fingerprint(app),
+            )
+    if cache_key is not None:
+        cached = content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     success, response = await make_api_request(
         f"/api/v1/applications/{path_name}/manifests", method="GET", params=params, data=data
     )
@@ -72,4 +119,6 @@ async def application_service__get_manifests(
     if not success:
         logger.error(f"Request failed: {response.get('error')}")
         return {"error": response.get("error", "Request failed")}
+    if cache_key is not None:
+        content_cache.put(cache_key, response)
     return response
\ No newline at end of file
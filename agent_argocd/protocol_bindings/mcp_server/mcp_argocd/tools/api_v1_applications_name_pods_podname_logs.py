@@ -6,7 +6,7 @@
 
 import logging
 from typing import Dict, Any
-from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils.logs import tail_logs
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -32,6 +32,13 @@ async def application_service__pod_logs(
     param_appNamespace: str = None,
     param_project: str = None,
     param_matchCase: bool = False,
+    match: str = None,
+    level: str = None,
+    dedup: bool = True,
+    limit: int = 200,
+    max_lines: int = 100_000,
+    max_bytes: int = 64 * 1024 * 1024,
+    max_duration_seconds: int = 30,
 ) -> Dict[str, Any]:
     '''
     PodLogs returns a stream of log entries for the specified pod.
@@ -55,9 +62,16 @@ async def application_service__pod_logs(
         param_appNamespace (str, optional): The namespace of the application. Defaults to None.
         param_project (str, optional): The project associated with the application. Defaults to None.
         param_matchCase (bool, optional): Whether to match case in filters. Defaults to False.
+        match (str, optional): Regular expression a line must contain, applied while reading. Defaults to None.
+        level (str, optional): Minimum level (debug, info, warn, error, fatal); lines naming no level are dropped. Defaults to None.
+        dedup (bool, optional): Collapse repeated lines into one with a repeat count. Defaults to True.
+        limit (int, optional): Number of most recent matching lines to return. Defaults to 200.
+        max_lines (int, optional): Stop after reading this many lines. Defaults to 100000.
+        max_bytes (int, optional): Stop after reading this many bytes of log content. Defaults to 67108864.
+        max_duration_seconds (int, optional): Stop reading after this many seconds, e.g. when following. Defaults to 30.
 
     Returns:
-        Dict[str, Any]: The JSON response from the API call containing the logs.
+        Dict[str, Any]: The most recent matching log lines, oldest first, with how much was read and why reading stopped.
 
     Raises:
         Exception: If the API request fails or returns an error.
@@ -65,7 +79,6 @@ async def application_service__pod_logs(
     logger.debug("Making GET request to /api/v1/applications/{name}/pods/{podName}/logs")
 
     params = {}
-    data = {}
 
     if param_namespace is not None:
         params["namespace"] = str(param_namespace).lower() if isinstance(param_namespace, bool) else param_namespace
@@ -127,11 +140,17 @@ async def application_service__pod_logs(
     if param_matchCase is not None:
         params["matchCase"] = str(param_matchCase).lower() if isinstance(param_matchCase, bool) else param_matchCase
 
-    flat_body = {}
-    data = assemble_nested_body(flat_body)
-
-    success, response = await make_api_request(
-        f"/api/v1/applications/{path_name}/pods/{path_podName}/logs", method="GET", params=params, data=data
+    success, response = await tail_logs(
+        f"/api/v1/applications/{path_name}/pods/{path_podName}/logs",
+        params,
+        match=match,
+        level=level,
+        match_case=bool(param_matchCase),
+        dedup=dedup,
+        limit=limit,
+        max_lines=max_lines,
+        max_bytes=max_bytes,
+        max_duration=max_duration_seconds,
     )
 
     if not success:
@@ -7,6 +7,7 @@
 import logging
 from typing import Dict, Any
 from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.content_cache import content_cache, content_key
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -62,6 +63,22 @@ async def application_service__revision_chart_details(
     flat_body = {}
     data = assemble_nested_body(flat_body)
 
+    # A published chart version (or commit) never changes, so pinned revisions are served from the content cache
+    cache_key = content_key(
+        "revision_chart_details",
+        path_name,
+        path_revision,
+        param_appNamespace,
+        param_project,
+        param_sourceIndex,
+        param_versionId,
+        allow_chart_version=True,
+    )
+    if cache_key is not None:
+        cached = content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     success, response = await make_api_request(
         f"/api/v1/applications/{path_name}/revisions/{path_revision}/chartdetails",
         method="GET",
@@ -72,4 +89,6 @@ async def application_service__revision_chart_details(
     if not success:
         logger.error(f"Request failed: {response.get('error')}")
         return {"error": response.get("error", "Request failed")}
+    if cache_key is not None:
+        content_cache.put(cache_key, response)
     return response
\ No newline at end of file
@@ -7,6 +7,7 @@
 import logging
 from typing import Dict, Any
 from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.content_cache import content_cache, content_key
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -62,6 +63,15 @@ async def application_service__revision_metadata(
     flat_body = {}
     data = assemble_nested_body(flat_body)
 
+    # The metadata of a commit never changes, so pinned revisions are served from the content cache
+    cache_key = content_key(
+        "revision_metadata", path_name, path_revision, param_appNamespace, param_project, param_sourceIndex, param_versionId
+    )
+    if cache_key is not None:
+        cached = content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     success, response = await make_api_request(
         f"/api/v1/applications/{path_name}/revisions/{path_revision}/metadata", method="GET", params=params, data=data
     )
@@ -69,4 +79,6 @@ async def application_service__revision_metadata(
     if not success:
         logger.error(f"Request failed: {response.get('error')}")
         return {"error": response.get("error", "Request failed")}
+    if cache_key is not None:
+        content_cache.put(cache_key, response)
     return response
\ No newline at end of file
@@ -6,7 +6,7 @@
 
 import logging
 from typing import Dict, Any, List
-from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import watch_api_request
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -22,10 +22,17 @@ async def application_service__watch(
     param_repo: str = None,
     param_appNamespace: str = None,
     param_project: List[str] = None,
+    max_events: int = 10,
+    max_duration_seconds: int = 30,
+    until_health_status: str = None,
+    until_sync_status: str = None,
 ) -> Dict[str, Any]:
     '''
     Watch returns a stream of application change events.
 
+    Events are collected until max_events is reached, max_duration_seconds elapses,
+    or an application reaches the requested health and/or sync status.
+
     Args:
         param_name (str, optional): The application's name. Defaults to None.
         param_refresh (str, optional): Forces application reconciliation if set to 'hard'. Defaults to None.
@@ -35,9 +42,13 @@ async def application_service__watch(
         param_repo (str, optional): The repoURL to restrict returned list applications. Defaults to None.
         param_appNamespace (str, optional): The application's namespace. Defaults to None.
         param_project (List[str], optional): The project names to restrict returned list applications (legacy name for backwards-compatibility). Defaults to None.
+        max_events (int, optional): Maximum number of events to return. Defaults to 10.
+        max_duration_seconds (int, optional): Maximum time to watch in seconds. Defaults to 30.
+        until_health_status (str, optional): Stop once an application reports this health status (e.g. 'Healthy'). Defaults to None.
+        until_sync_status (str, optional): Stop once an application reports this sync status (e.g. 'Synced'). Defaults to None.
 
     Returns:
-        Dict[str, Any]: The JSON response from the API call.
+        Dict[str, Any]: The collected events, their count and the reason watching stopped.
 
     Raises:
         Exception: If the API request fails or returns an error.
@@ -45,7 +56,6 @@ async def application_service__watch(
     logger.debug("Making GET request to /api/v1/stream/applications")
 
     params = {}
-    data = {}
 
     if param_name is not None:
         params["name"] = str(param_name).lower() if isinstance(param_name, bool) else param_name
@@ -75,10 +85,21 @@ async def application_service__watch(
     if param_project is not None:
         params["project"] = str(param_project).lower() if isinstance(param_project, bool) else param_project
 
-    flat_body = {}
-    data = assemble_nested_body(flat_body)
-
-    success, response = await make_api_request("/api/v1/stream/applications", method="GET", params=params, data=data)
+    def until(event: Dict[str, Any]) -> bool:
+        status = event.get("result", {}).get("application", {}).get("status", {})
+        if until_health_status is not None and status.get("health", {}).get("status") != until_health_status:
+            return False
+        if until_sync_status is not None and status.get("sync", {}).get("status") != until_sync_status:
+            return False
+        return True
+
+    success, response = await watch_api_request(
+        "/api/v1/stream/applications",
+        params=params,
+        max_events=max_events,
+        max_duration=max_duration_seconds,
+        until=until if until_health_status is not None or until_sync_status is not None else None,
+    )
 
     if not success:
         logger.error(f"Request failed: {response.get('error')}")
@@ -6,7 +6,7 @@
 
 import logging
 from typing import Dict, Any
-from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request, assemble_nested_body
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import watch_api_request
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -22,10 +22,16 @@ async def application_service__watch_resource_tree(
     param_kind: str = None,
     param_appNamespace: str = None,
     param_project: str = None,
+    max_events: int = 1,
+    max_duration_seconds: int = 30,
+    until_all_healthy: bool = False,
 ) -> Dict[str, Any]:
     '''
     Watch returns a stream of application resource tree.
 
+    Tree updates are collected until max_events is reached, max_duration_seconds elapses,
+    or, with until_all_healthy, every resource in the tree reports a Healthy status.
+
     Args:
         path_applicationName (str): The name of the application to watch.
         param_namespace (str, optional): The namespace of the resource. Defaults to None.
@@ -35,9 +41,12 @@ async def application_service__watch_resource_tree(
         param_kind (str, optional): The kind of the resource. Defaults to None.
         param_appNamespace (str, optional): The application namespace. Defaults to None.
         param_project (str, optional): The project associated with the resource. Defaults to None.
+        max_events (int, optional): Maximum number of tree updates to return. Defaults to 1.
+        max_duration_seconds (int, optional): Maximum time to watch in seconds. Defaults to 30.
+        until_all_healthy (bool, optional): Stop once every resource with a health status is Healthy. Defaults to False.
 
     Returns:
-        Dict[str, Any]: The JSON response from the API call containing the resource tree.
+        Dict[str, Any]: The collected resource tree updates, their count and the reason watching stopped.
 
     Raises:
         Exception: If the API request fails or returns an error.
@@ -45,7 +54,6 @@ async def application_service__watch_resource_tree(
     logger.debug("Making GET request to /api/v1/stream/applications/{applicationName}/resource-tree")
 
     params = {}
-    data = {}
 
     if param_namespace is not None:
         params["namespace"] = str(param_namespace).lower() if isinstance(param_namespace, bool) else param_namespace
@@ -70,11 +78,16 @@ async def application_service__watch_resource_tree(
     if param_project is not None:
         params["project"] = str(param_project).lower() if isinstance(param_project, bool) else param_project
 
-    flat_body = {}
-    data = assemble_nested_body(flat_body)
+    def all_healthy(event: Dict[str, Any]) -> bool:
+        nodes = event.get("result", {}).get("nodes") or []
+        return all(node.get("health", {}).get("status", "Healthy") == "Healthy" for node in nodes)
 
-    success, response = await make_api_request(
-        f"/api/v1/stream/applications/{path_applicationName}/resource-tree", method="GET", params=params, data=data
+    success, response = await watch_api_request(
+        f"/api/v1/stream/applications/{path_applicationName}/resource-tree",
+        params=params,
+        max_events=max_events,
+        max_duration=max_duration_seconds,
+        until=all_healthy if until_all_healthy else None,
     )
 
     if not success:
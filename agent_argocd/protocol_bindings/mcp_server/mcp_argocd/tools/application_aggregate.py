@@ -0,0 +1,156 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools for fleet-wide application counts"""
+
+import heapq
+import logging
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Tuple
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import get_inventory
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("mcp_tools")
+
+DIMENSIONS = ["health", "sync", "phase", "project", "cluster", "namespace"]
+
+# Only these fields are requested from the list API
+LIST_FIELDS = [
+    "items.metadata.name",
+    "items.spec.project",
+    "items.spec.destination",
+    "items.status.health.status",
+    "items.status.sync.status",
+    "items.status.operationState.phase",
+]
+
+# Severity of a status when ranking offenders; anything not listed counts 0
+SEVERITY = {
+    "health": {"Missing": 4, "Degraded": 4, "Unknown": 2, "Suspended": 1, "Progressing": 1},
+    "sync": {"OutOfSync": 1, "Unknown": 1},
+    "phase": {"Failed": 3, "Error": 3},
+}
+
+NONE = "<none>"
+# Values listed per dimension in the totals, most common first
+TOTALS_LIMIT = 20
+
+
+def _dimensions(app: Dict[str, Any]) -> Tuple[str, ...]:
+    """The value of every dimension of one application, in DIMENSIONS order."""
+    spec = app.get("spec") or {}
+    status = app.get("status") or {}
+    destination = spec.get("destination") or {}
+    return (
+        (status.get("health") or {}).get("status") or NONE,
+        (status.get("sync") or {}).get("status") or NONE,
+        (status.get("operationState") or {}).get("phase") or NONE,
+        spec.get("project") or NONE,
+        destination.get("name") or destination.get("server") or NONE,
+        destination.get("namespace") or NONE,
+    )
+
+
+def aggregate(apps: Iterable[Dict[str, Any]], rows: str, columns: str, top: int) -> Dict[str, Any]:
+    """Count applications by two dimensions and every dimension alone, and rank the worst ones, in one pass."""
+    row_index, column_index = DIMENSIONS.index(rows), DIMENSIONS.index(columns)
+    health, sync, phase = DIMENSIONS.index("health"), DIMENSIONS.index("sync"), DIMENSIONS.index("phase")
+    cells: Counter = Counter()
+    totals = [Counter() for _ in DIMENSIONS]
+    offenders: List[Tuple[int, "_Reversed", Tuple[str, ...]]] = []
+    total = 0
+
+    for app in apps:
+        values = _dimensions(app)
+        total += 1
+        cells[values[row_index], values[column_index]] += 1
+        for counter, value in zip(totals, values):
+            counter[value] += 1
+        score = SEVERITY["health"].get(values[health], 0) + SEVERITY["sync"].get(values[sync], 0) + SEVERITY["phase"].get(values[phase], 0)
+        if score and top > 0:
+            # Min-heap of the `top` highest scores; ties keep the alphabetically first names
+            name = (app.get("metadata") or {}).get("name", "")
+            entry = (score, _Reversed(name), values)
+            if len(offenders) < top:
+                heapq.heappush(offenders, entry)
+            elif entry > offenders[0]:
+                heapq.heapreplace(offenders, entry)
+
+    column_values = sorted(totals[column_index], key=lambda v: (-totals[column_index][v], v))
+    row_values = sorted(totals[row_index], key=lambda v: (-totals[row_index][v], v))
+    return {
+        "total": total,
+        "rows": rows,
+        "columns": columns,
+        "header": [rows, *column_values, "total"],
+        "matrix": [[row, *(cells[row, column] for column in column_values), totals[row_index][row]] for row in row_values],
+        "totals": {dimension: dict(counter.most_common(TOTALS_LIMIT)) for dimension, counter in zip(DIMENSIONS, totals)},
+        "top_offenders": [
+            {"name": name.value, "score": score, **{dimension: value for dimension, value in zip(DIMENSIONS, values)}}
+            for score, name, values in sorted(offenders, reverse=True)
+        ],
+    }
+
+
+class _Reversed:
+    """Inverts the ordering of a string, so the heap keeps the first names among equal scores."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return self.value > other.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.value == other.value
+
+
+async def application_service__aggregate(
+    rows: str = "project",
+    columns: str = "health",
+    project: str = None,
+    top: int = 10,
+) -> Dict[str, Any]:
+    '''
+    Count applications across the fleet by two dimensions and list the worst applications.
+
+    Prefer this over listing applications for questions like "how many apps are
+    degraded per project" or "which clusters have out-of-sync apps". Dimensions:
+    health, sync, phase (last operation phase), project, cluster (destination
+    name or server) and namespace (destination namespace).
+
+    Args:
+        rows (str, optional): Dimension for the matrix rows. Defaults to 'project'.
+        columns (str, optional): Dimension for the matrix columns. Defaults to 'health'.
+        project (str, optional): Only count applications in these projects, comma-separated. Defaults to None.
+        top (int, optional): Number of worst applications to return, ranked by health, sync and operation phase. Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: The count matrix with a header row, per-dimension totals and the top offenders.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    for dimension in (rows, columns):
+        if dimension not in DIMENSIONS:
+            return {"error": f"Unknown dimension {dimension!r}, expected one of {', '.join(DIMENSIONS)}"}
+    projects = [p.strip() for p in project.split(",") if p.strip()] if project else None
+
+    inventory = get_inventory()
+    if inventory is not None:
+        apps = inventory.list(projects=projects, full=False)["items"]
+    else:
+        params = {"fields": ",".join(LIST_FIELDS)}
+        if projects:
+            params["projects"] = projects
+        success, response = await make_api_request("/api/v1/applications", params=params)
+        if not success:
+            logger.error(f"Request failed: {response.get('error')}")
+            return {"error": response.get("error", "Request failed")}
+        apps = response.get("items") or []
+
+    return aggregate(apps, rows, columns, top)
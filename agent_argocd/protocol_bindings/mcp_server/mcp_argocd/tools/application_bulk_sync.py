@@ -0,0 +1,204 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools for syncing many applications in one call"""
+
+import re
+import asyncio
+import fnmatch
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from mcp.server.fastmcp import Context
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import ApplicationInventory, get_inventory
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("mcp_tools")
+
+MAX_CONCURRENCY = 50
+RETRY_BACKOFF = 1.0
+# Failures that another attempt cannot fix; 409 means an operation is already in progress
+PERMANENT_ERROR = re.compile(r"API request failed: (400|401|403|404|409)\b")
+# Allowed difference between our clock and the ArgoCD server's when matching an operation to our request
+CLOCK_SKEW = timedelta(seconds=5)
+
+
+async def select_applications(
+    names: Optional[List[str]] = None,
+    project: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    name_glob: Optional[str] = None,
+    app_namespace: Optional[str] = None,
+) -> Tuple[Optional[List[Tuple[str, str]]], Optional[str]]:
+    """
+    Resolve a selector to sorted (namespace, name) pairs, all criteria combined with AND.
+
+    Uses the local inventory when it is running, otherwise one list call. An
+    explicit name list alone needs no lookup; its namespace is then ''.
+
+    Returns:
+        Tuple of (applications, error) where exactly one is None
+    """
+    if names and not (project or label_selector or name_glob):
+        return sorted((app_namespace or "", name) for name in set(names)), None
+
+    inventory = get_inventory()
+    if inventory is None:
+        params = {"projects": [p.strip() for p in project.split(",")] if project else None, "selector": label_selector}
+        success, response = await make_api_request("/api/v1/applications", params={k: v for k, v in params.items() if v})
+        if not success:
+            return None, response.get("error", "Failed to list applications")
+        inventory = ApplicationInventory()
+        inventory.replace(response.get("items") or [], response.get("metadata", {}).get("resourceVersion"))
+
+    try:
+        keys = inventory.index.query({"project": project}, selector=label_selector)
+    except ValueError as e:
+        return None, str(e)
+    if names:
+        wanted = set(names)
+        keys = {key for key in keys if key[1] in wanted}
+    if name_glob:
+        keys = {key for key in keys if fnmatch.fnmatchcase(key[1], name_glob)}
+    if app_namespace:
+        keys = {key for key in keys if key[0] == app_namespace}
+    return sorted(keys), None
+
+
+async def _started_operation(namespace: str, name: str, since: datetime) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """The operation state of an application if an operation started after `since`; returns (state, error)."""
+    params = {"appNamespace": namespace} if namespace else {}
+    success, response = await make_api_request(f"/api/v1/applications/{name}", params=params)
+    if not success:
+        return None, response.get("error", "Request failed")
+    state = response.get("status", {}).get("operationState") or {}
+    try:
+        started_at = datetime.fromisoformat(state["startedAt"].replace("Z", "+00:00"))
+    except (KeyError, AttributeError, ValueError):
+        return None, None
+    return (state, None) if started_at >= since - CLOCK_SKEW else (None, None)
+
+
+async def _sync_one(namespace: str, name: str, body: Dict[str, Any], retries: int) -> Dict[str, Any]:
+    """
+    Start the sync of one application, retrying failures that another attempt can fix.
+
+    The sync POST is not idempotent: a request that failed after it was sent
+    (timeout, 5xx, dropped connection) may still have started a sync. Before
+    sending it again, the application is read and the attempt counts as
+    started if an operation began since the first one. Only requests that
+    never reached the server are resent without that check.
+    """
+    data = {**body, "name": name}
+    if namespace:
+        data["appNamespace"] = namespace
+    since = datetime.now(timezone.utc)
+    attempt = 0
+    while True:
+        attempt += 1
+        success, response = await make_api_request(f"/api/v1/applications/{name}/sync", method="POST", data=data)
+        if success:
+            operation = response.get("operation", {}).get("sync", {})
+            return {"name": name, "result": "started", "attempts": attempt, "revision": operation.get("revision") or response.get("status", {}).get("sync", {}).get("revision")}
+        error = response.get("error", "Request failed")
+        if attempt > retries or PERMANENT_ERROR.search(error):
+            logger.error(f"Sync of {name} failed after {attempt} attempt(s): {error}")
+            return {"name": name, "result": "failed", "attempts": attempt, "error": error}
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        if response.get("request_sent") is False:
+            continue
+        state, check_error = await _started_operation(namespace, name, since)
+        if check_error is not None:
+            logger.error(f"Sync of {name} failed and its state could not be checked: {check_error}")
+            return {"name": name, "result": "failed", "attempts": attempt, "error": f"{error}; not retried, the application could not be read to check whether the sync started: {check_error}"}
+        if state is not None:
+            logger.debug(f"Sync of {name} reported {error!r} but an operation started ({state.get('phase')}), not sending it again")
+            revision = state.get("operation", {}).get("sync", {}).get("revision") or state.get("syncResult", {}).get("revision")
+            return {"name": name, "result": "started", "attempts": attempt, "revision": revision}
+
+
+async def application_service__sync_many(
+    names: List[str] = None,
+    project: str = None,
+    label_selector: str = None,
+    name_glob: str = None,
+    app_namespace: str = None,
+    revision: str = None,
+    prune: bool = False,
+    dry_run: bool = False,
+    concurrency: int = 10,
+    retries: int = 2,
+    max_apps: int = 300,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    '''
+    Sync many applications in one call and return a summary table.
+
+    Prefer this over calling application_service__sync once per application.
+    Select applications by any combination of explicit names, project, label
+    selector and name glob (combined with AND); at least one is required. Syncs
+    run concurrently, and progress is reported per application as it finishes.
+    A failed sync is retried with backoff, unless the application shows that
+    the failed request started an operation anyway.
+
+    Args:
+        names (List[str], optional): Explicit application names. Defaults to None.
+        project (str, optional): Project name(s), comma-separated. Defaults to None.
+        label_selector (str, optional): Label requirements such as 'team=payments,tier!=db'. Defaults to None.
+        name_glob (str, optional): Shell-style pattern on application names, e.g. 'payments-*'. Defaults to None.
+        app_namespace (str, optional): Only applications in this namespace. Defaults to None.
+        revision (str, optional): Revision to sync every application to. Defaults to None (the target revision).
+        prune (bool, optional): Prune resources that are no longer in git. Defaults to False.
+        dry_run (bool, optional): Preview the syncs without applying them. Defaults to False.
+        concurrency (int, optional): Maximum syncs in flight at once, up to 50. Defaults to 10.
+        retries (int, optional): Extra attempts per application after a failure. Defaults to 2.
+        max_apps (int, optional): Refuse to run if the selector matches more applications than this. Defaults to 300.
+
+    Returns:
+        Dict[str, Any]: Counts of started and failed syncs and a table with one row per application.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    if not (names or project or label_selector or name_glob):
+        return {"error": "A selector is required: names, project, label_selector or name_glob"}
+
+    apps, error = await select_applications(names, project, label_selector, name_glob, app_namespace)
+    if error:
+        logger.error(f"Selecting applications failed: {error}")
+        return {"error": error}
+    if not apps:
+        return {"total": 0, "started": 0, "failed": 0, "columns": [], "rows": []}
+    if len(apps) > max_apps:
+        return {"error": f"Selector matches {len(apps)} applications, more than max_apps={max_apps}", "matched": len(apps)}
+
+    body: Dict[str, Any] = {"prune": prune, "dryRun": dry_run}
+    if revision:
+        body["revision"] = revision
+    semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_CONCURRENCY)))
+    done = 0
+
+    async def run(namespace: str, name: str) -> Dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            outcome = await _sync_one(namespace, name, body, retries)
+        done += 1
+        if ctx is not None:
+            await ctx.report_progress(done, len(apps), f"{name}: {outcome['result']}")
+        return outcome
+
+    logger.debug(f"Syncing {len(apps)} applications with concurrency {concurrency}")
+    outcomes = await asyncio.gather(*(run(namespace, name) for namespace, name in apps))
+
+    columns = ["name", "result", "attempts", "revision", "error"]
+    started = sum(1 for outcome in outcomes if outcome["result"] == "started")
+    return {
+        "total": len(outcomes),
+        "started": started,
+        "failed": len(outcomes) - started,
+        "dry_run": dry_run,
+        "columns": columns,
+        "rows": [[outcome.get(column) for column in columns] for outcome in outcomes],
+    }
@@ -0,0 +1,83 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools for fetching many applications in one call"""
+
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import get_inventory
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils.shaping import field_value
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("mcp_tools")
+
+DEFAULT_COLUMNS = ["metadata.name", "spec.project", "status.health.status", "status.sync.status", "status.sync.revision"]
+MAX_CONCURRENCY = 50
+
+
+async def application_service__get_many(
+    names: List[str],
+    columns: List[str] = None,
+    app_namespace: str = None,
+    concurrency: int = 10,
+) -> Dict[str, Any]:
+    '''
+    Get many applications at once and return selected fields as one table.
+
+    Prefer this over calling application_service__get once per application when
+    comparing applications, e.g. "show health and revision of apps a, b and c".
+    Applications are served from the local inventory when it is running and
+    otherwise fetched concurrently.
+
+    Args:
+        names (List[str]): Application names.
+        columns (List[str], optional): Dotted field paths, one per table column, e.g. ['status.health.status', 'spec.source.targetRevision']. Defaults to name, project, health, sync status and synced revision.
+        app_namespace (str, optional): The namespace of the applications. Defaults to None.
+        concurrency (int, optional): Maximum requests in flight when fetching from the API, up to 50. Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: The column paths, one row of values per application in the order requested, and errors by application name.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    names = list(dict.fromkeys(names or []))
+    columns = columns or DEFAULT_COLUMNS
+    if not names:
+        return {"error": "At least one application name is required"}
+
+    inventory = get_inventory()
+    semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_CONCURRENCY)))
+
+    async def fetch(name: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if inventory is not None:
+            app = inventory.get(name, app_namespace)
+            if app is not None:
+                return app, None
+        params = {"appNamespace": app_namespace} if app_namespace else {}
+        async with semaphore:
+            success, response = await make_api_request(f"/api/v1/applications/{name}", params=params)
+        if not success:
+            return None, response.get("error", "Request failed")
+        return response, None
+
+    logger.debug(f"Fetching {len(names)} applications")
+    results = await asyncio.gather(*(fetch(name) for name in names))
+
+    rows, errors = [], {}
+    for name, (app, error) in zip(names, results):
+        if error is not None:
+            errors[name] = error
+            rows.append([name if column == "metadata.name" else None for column in columns])
+        else:
+            rows.append([field_value(app, column) for column in columns])
+    return {
+        "count": len(rows),
+        "source": "inventory" if inventory is not None else "api",
+        "columns": columns,
+        "rows": rows,
+        "errors": errors,
+    }
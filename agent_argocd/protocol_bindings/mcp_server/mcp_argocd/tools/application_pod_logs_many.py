@@ -0,0 +1,156 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools for reading the logs of many pods of an application as one stream"""
+
+import asyncio
+import fnmatch
+import logging
+from typing import Dict, Any, List, Optional, Union
+
+import httpx
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import StreamRequestError
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.compact import ResourceNode
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.resource_graph import ResourceGraph
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools.application_resource_graph import load_graph
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils.logs import LogBudget, LogFilter, LogTail, merge_tails, read_pod_logs, tail_result
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("mcp_tools")
+
+MAX_CONCURRENCY = 20
+
+
+def find_pods(
+    nodes: Union[List[Dict[str, Any]], ResourceGraph],
+    kind: Optional[str] = None,
+    resource_name: Optional[str] = None,
+    pod_glob: Optional[str] = None,
+) -> List[ResourceNode]:
+    """
+    Pod nodes of a resource tree or graph, optionally only those owned by a given resource.
+
+    A pod matches `kind` / `resource_name` when it or any of its ancestors
+    (through parentRefs, e.g. Pod -> ReplicaSet -> Deployment) has that kind and name.
+    """
+    graph = nodes if isinstance(nodes, ResourceGraph) else ResourceGraph(nodes)
+    if kind or resource_name:
+        owners = [
+            node_id
+            for node_id, node in graph.items()
+            if (not kind or node.kind == kind) and (not resource_name or node.name == resource_name)
+        ]
+        candidates = {node_id for owner in owners for node_id, _ in graph.subtree(owner)}
+    else:
+        candidates = {node_id for node_id, _ in graph.items()}
+
+    pods = [graph.get(node_id) for node_id in candidates]
+    pods = [pod for pod in pods if pod.kind == "Pod" and pod.group == ""]
+    if pod_glob:
+        pods = [pod for pod in pods if fnmatch.fnmatchcase(pod.name, pod_glob)]
+    return sorted(pods, key=lambda pod: (pod.namespace, pod.name))
+
+
+async def application_service__pod_logs_many(
+    path_name: str,
+    kind: str = None,
+    resource_name: str = None,
+    pod_glob: str = None,
+    container: str = None,
+    app_namespace: str = None,
+    since_seconds: int = None,
+    tail_lines: int = 1000,
+    match: str = None,
+    level: str = None,
+    dedup: bool = True,
+    limit: int = 500,
+    max_output_bytes: int = 64 * 1024,
+    max_pods: int = 50,
+    concurrency: int = 5,
+    max_lines: int = 500_000,
+    max_bytes: int = 128 * 1024 * 1024,
+    max_duration_seconds: int = 30,
+) -> Dict[str, Any]:
+    '''
+    Read the logs of all pods of an application, or of one of its workloads, as one time-ordered stream.
+
+    Prefer this over calling application_service__pod_logs once per pod, e.g. for
+    a Deployment with many replicas. Pods are found in the application resource
+    tree; their logs are fetched concurrently, filtered while reading, merged by
+    timestamp and capped in size. Each line is prefixed with its pod name.
+
+    Args:
+        path_name (str): The name of the application.
+        kind (str, optional): Only pods owned by a resource of this kind, e.g. 'Deployment', 'StatefulSet'. Defaults to None.
+        resource_name (str, optional): Only pods owned by a resource with this name. Defaults to None.
+        pod_glob (str, optional): Shell-style pattern on pod names, e.g. 'web-*'. Defaults to None.
+        container (str, optional): The container to read; the pod default container otherwise. Defaults to None.
+        app_namespace (str, optional): The namespace of the application. Defaults to None.
+        since_seconds (int, optional): Only logs newer than this many seconds. Defaults to None.
+        tail_lines (int, optional): Lines per pod requested from the end of each log. Defaults to 1000.
+        match (str, optional): Regular expression a line must contain, applied while reading. Defaults to None.
+        level (str, optional): Minimum level (debug, info, warn, error, fatal); lines naming no level are dropped. Defaults to None.
+        dedup (bool, optional): Collapse repeated lines of a pod into one with a repeat count. Defaults to True.
+        limit (int, optional): Number of most recent merged lines to return. Defaults to 500.
+        max_output_bytes (int, optional): Drop the oldest merged lines beyond this output size. Defaults to 65536.
+        max_pods (int, optional): Refuse to run if more pods match than this. Defaults to 50.
+        concurrency (int, optional): Pods read at once, up to 20. Defaults to 5.
+        max_lines (int, optional): Stop after reading this many lines across all pods. Defaults to 500000.
+        max_bytes (int, optional): Stop after reading this many bytes of log content across all pods. Defaults to 134217728.
+        max_duration_seconds (int, optional): Stop reading after this many seconds. Defaults to 30.
+
+    Returns:
+        Dict[str, Any]: The merged log lines, oldest first, how each pod's read ended and how much was read.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    try:
+        log_filter = LogFilter(match, level)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    graph, error = await load_graph(path_name, app_namespace)
+    if error is not None:
+        return {"error": error}
+
+    pods = find_pods(graph, kind, resource_name, pod_glob)
+    if not pods:
+        return {"error": f"No pods found in application {path_name} for the given filters"}
+    if len(pods) > max_pods:
+        return {"error": f"{len(pods)} pods match, more than max_pods={max_pods}", "matched": len(pods)}
+
+    budget = LogBudget(max_lines, max_bytes, max_duration_seconds)
+    semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_CONCURRENCY)))
+    tails = [LogTail(limit, dedup) for _ in pods]
+
+    async def read(pod: ResourceNode, tail: LogTail) -> str:
+        params = {"namespace": pod.namespace, "tailLines": tail_lines, "container": container, "sinceSeconds": since_seconds, "appNamespace": app_namespace}
+        path = f"/api/v1/applications/{path_name}/pods/{pod.name}/logs"
+        async with semaphore:
+            if budget.remaining() <= 0 or budget.lines >= budget.max_lines or budget.bytes >= budget.max_bytes:
+                return "skipped"
+            try:
+                return await read_pod_logs(path, {k: v for k, v in params.items() if v is not None}, log_filter, tail, budget, pod.name)
+            except (StreamRequestError, httpx.RequestError) as e:
+                logger.error(f"Reading logs of pod {pod.name} failed: {e}")
+                return f"error: {e}"
+
+    logger.debug(f"Reading logs of {len(pods)} pods of {path_name}")
+    outcomes = await asyncio.gather(*(read(pod, tail) for pod, tail in zip(pods, tails)))
+
+    lines, truncated = merge_tails(tails, limit, max_output_bytes)
+    result = tail_result(lines, tails, budget, stop_reason=_overall_reason(outcomes), with_pod=True)
+    result["truncated"] = truncated
+    result["pods"] = {pod.name: outcome for pod, outcome in zip(pods, outcomes)}
+    return result
+
+
+def _overall_reason(outcomes: List[str]) -> str:
+    """The budget that stopped reading, if any, otherwise 'end'."""
+    for reason in ("max_duration", "max_bytes", "max_lines"):
+        if reason in outcomes:
+            return reason
+    return "end"
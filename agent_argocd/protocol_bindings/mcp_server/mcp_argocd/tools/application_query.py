@@ -0,0 +1,85 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools for indexed application queries over the local inventory"""
+
+import logging
+from typing import Dict, Any
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.indexes import ApplicationIndex
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import ApplicationInventory, get_inventory
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("mcp_tools")
+
+
+async def application_service__query(
+    project: str = None,
+    health_status: str = None,
+    sync_status: str = None,
+    repo_url: str = None,
+    destination_server: str = None,
+    destination_namespace: str = None,
+    label_selector: str = None,
+    limit: int = 200,
+) -> Dict[str, Any]:
+    '''
+    Find applications matching compound filters and return only their count and names.
+
+    Prefer this over listing applications when the question is "which/how many apps
+    match X". Each filter accepts a comma-separated list of values (any of), and a
+    leading '!' negates it, e.g. health_status='!Healthy' for unhealthy apps.
+    All filters are combined with AND.
+
+    Args:
+        project (str, optional): Project name(s), e.g. 'jarvis-agent-dev'. Defaults to None.
+        health_status (str, optional): Health status(es): Healthy, Progressing, Degraded, Suspended, Missing, Unknown. Defaults to None.
+        sync_status (str, optional): Sync status(es): Synced, OutOfSync, Unknown. Defaults to None.
+        repo_url (str, optional): Source repository URL(s). Defaults to None.
+        destination_server (str, optional): Destination cluster server URL(s) or cluster name(s). Defaults to None.
+        destination_namespace (str, optional): Destination namespace(s). Defaults to None.
+        label_selector (str, optional): Label requirements such as 'team=payments,tier!=db'. Defaults to None.
+        limit (int, optional): Maximum number of names to return. Defaults to 200.
+
+    Returns:
+        Dict[str, Any]: The number of matching applications and their sorted names.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    inventory = get_inventory()
+    source = "inventory"
+    if inventory is None:
+        logger.debug("Inventory not available, building a temporary index from /api/v1/applications")
+        success, response = await make_api_request("/api/v1/applications", method="GET")
+        if not success:
+            logger.error(f"Request failed: {response.get('error')}")
+            return {"error": response.get("error", "Request failed")}
+        inventory = ApplicationInventory()
+        inventory.replace(response.get("items") or [], response.get("metadata", {}).get("resourceVersion"))
+        source = "api"
+
+    index: ApplicationIndex = inventory.index
+    try:
+        keys = index.query(
+            {
+                "project": project,
+                "health": health_status,
+                "sync": sync_status,
+                "repo": repo_url,
+                "server": destination_server,
+                "namespace": destination_namespace,
+            },
+            selector=label_selector,
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+
+    names = sorted(name for _, name in keys)
+    return {
+        "count": len(names),
+        "names": names[:limit],
+        "truncated": len(names) > limit,
+        "source": source,
+    }
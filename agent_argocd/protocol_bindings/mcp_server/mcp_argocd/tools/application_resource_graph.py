@@ -0,0 +1,179 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools for targeted queries on an application resource tree"""
+
+import logging
+from typing import Dict, Any, Optional, Tuple
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import make_api_request
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.resource_graph import ResourceGraph, summarize
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.tree_cache import get_tree_cache
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("mcp_tools")
+
+
+async def load_graph(path_name: str, app_namespace: Optional[str] = None) -> Tuple[Optional[ResourceGraph], Optional[str]]:
+    """The indexed resource tree of an application, from the watched tree cache or the API; returns (graph, error)."""
+    cache = get_tree_cache()
+    if cache is not None:
+        graph = await cache.get(path_name, app_namespace)
+        if graph is not None:
+            return graph, None
+    params = {"appNamespace": app_namespace} if app_namespace else {}
+    success, response = await make_api_request(f"/api/v1/applications/{path_name}/resource-tree", params=params)
+    if not success:
+        logger.error(f"Request failed: {response.get('error')}")
+        return None, response.get("error", "Request failed")
+    return ResourceGraph(response.get("nodes") or []), None
+
+
+def locate(graph: ResourceGraph, kind: str, name: str, namespace: Optional[str] = None, group: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """The id of the one node matching kind and name; returns (id, error response)."""
+    matches = graph.find(kind, name, namespace, group)
+    if not matches:
+        return None, {"error": f"No {kind} {name!r} in the resource tree"}
+    if len(matches) > 1:
+        return None, {
+            "error": f"{len(matches)} resources named {kind} {name!r}, pass namespace or group",
+            "candidates": [summarize(graph.get(node_id), group=graph.get(node_id).group) for node_id in matches],
+        }
+    return matches[0], None
+
+
+async def application_service__resource_subtree(
+    path_name: str,
+    kind: str,
+    resource_name: str,
+    namespace: str = None,
+    group: str = None,
+    max_depth: int = None,
+    limit: int = 200,
+    app_namespace: str = None,
+) -> Dict[str, Any]:
+    '''
+    List a resource of an application and everything it owns, e.g. a Deployment with its ReplicaSets and Pods.
+
+    Prefer this over reading the whole resource tree when the question is about
+    one workload. Only the matching branch is returned, with the kind, name,
+    namespace, health and depth below the resource of every node.
+
+    Args:
+        path_name (str): The name of the application.
+        kind (str): The kind of the resource, e.g. 'Deployment'.
+        resource_name (str): The name of the resource.
+        namespace (str, optional): The namespace of the resource, when the name is ambiguous. Defaults to None.
+        group (str, optional): The API group of the resource, when the name is ambiguous. Defaults to None.
+        max_depth (int, optional): Only descendants up to this many levels below the resource. Defaults to None.
+        limit (int, optional): Maximum number of nodes returned. Defaults to 200.
+        app_namespace (str, optional): The namespace of the application. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The nodes of the subtree in breadth-first order.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    graph, error = await load_graph(path_name, app_namespace)
+    if error is not None:
+        return {"error": error}
+    node_id, failure = locate(graph, kind, resource_name, namespace, group)
+    if failure is not None:
+        return failure
+    subtree = graph.subtree(node_id, max_depth)
+    return {
+        "count": len(subtree),
+        "truncated": len(subtree) > limit,
+        "nodes": [summarize(graph.get(current), depth=depth) for current, depth in subtree[:limit]],
+    }
+
+
+async def application_service__resource_ancestry(
+    path_name: str,
+    kind: str,
+    resource_name: str,
+    namespace: str = None,
+    group: str = None,
+    app_namespace: str = None,
+) -> Dict[str, Any]:
+    '''
+    Find what owns a resource of an application, e.g. the ReplicaSet and Deployment above a Pod.
+
+    Args:
+        path_name (str): The name of the application.
+        kind (str): The kind of the resource, e.g. 'Pod'.
+        resource_name (str): The name of the resource.
+        namespace (str, optional): The namespace of the resource, when the name is ambiguous. Defaults to None.
+        group (str, optional): The API group of the resource, when the name is ambiguous. Defaults to None.
+        app_namespace (str, optional): The namespace of the application. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The resource and its owners, nearest first.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    graph, error = await load_graph(path_name, app_namespace)
+    if error is not None:
+        return {"error": error}
+    node_id, failure = locate(graph, kind, resource_name, namespace, group)
+    if failure is not None:
+        return failure
+    return {
+        "resource": summarize(graph.get(node_id)),
+        "owners": [summarize(graph.get(owner)) for owner in graph.ancestors(node_id)],
+    }
+
+
+async def application_service__unhealthy_resources(
+    path_name: str,
+    kind: str = None,
+    resource_name: str = None,
+    namespace: str = None,
+    group: str = None,
+    limit: int = 50,
+    app_namespace: str = None,
+) -> Dict[str, Any]:
+    '''
+    Find the resources where an application's health problems originate.
+
+    Returns the unhealthy resources that own no other unhealthy resource, e.g. a
+    crash-looping Pod rather than the Degraded ReplicaSet and Deployment above
+    it, each with its health message and owners. Use this to answer "why is
+    this application degraded" without reading the whole resource tree.
+
+    Args:
+        path_name (str): The name of the application.
+        kind (str, optional): The kind of the resource to search below, with resource_name. Defaults to None.
+        resource_name (str, optional): Only search below the resource with this name. Defaults to None.
+        namespace (str, optional): The namespace of that resource, when the name is ambiguous. Defaults to None.
+        group (str, optional): The API group of that resource, when the name is ambiguous. Defaults to None.
+        limit (int, optional): Maximum number of resources returned. Defaults to 50.
+        app_namespace (str, optional): The namespace of the application. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The unhealthy leaf resources with their health, message and owners.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    '''
+    if bool(kind) != bool(resource_name):
+        return {"error": "kind and resource_name must be given together"}
+    graph, error = await load_graph(path_name, app_namespace)
+    if error is not None:
+        return {"error": error}
+    node_id = None
+    if kind and resource_name:
+        node_id, failure = locate(graph, kind, resource_name, namespace, group)
+        if failure is not None:
+            return failure
+    leaves = graph.unhealthy_leaves(node_id)
+    return {
+        "count": len(leaves),
+        "truncated": len(leaves) > limit,
+        "resources": [
+            summarize(graph.get(leaf), owners=[f"{graph.get(owner).kind}/{graph.get(owner).name}" for owner in graph.ancestors(leaf)])
+            for leaf in leaves[:limit]
+        ],
+    }
@@ -0,0 +1,4 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared helpers for the MCP tool layer."""
@@ -0,0 +1,71 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""JSON codec used on the hot path: orjson or msgspec when installed, the standard library otherwise"""
+
+import os
+import json
+import logging
+import importlib.util
+from typing import Any, Callable, Tuple, Union
+
+# auto picks the fastest installed backend; orjson, msgspec or json force one
+JSON_CODEC = os.getenv("ARGOCD_JSON_CODEC", "auto").lower()
+
+logger = logging.getLogger("mcp_argocd")
+
+
+def _orjson() -> Tuple[Callable[[Union[bytes, str]], Any], Callable[[Any], bytes]]:
+    import orjson
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    # orjson.JSONDecodeError is a ValueError
+    return orjson.loads, dumps
+
+
+def _msgspec() -> Tuple[Callable[[Union[bytes, str]], Any], Callable[[Any], bytes]]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder(enc_hook=str)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return loads, encoder.encode
+
+
+def _stdlib() -> Tuple[Callable[[Union[bytes, str]], Any], Callable[[Any], bytes]]:
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), default=str).encode()
+
+    return json.loads, dumps
+
+
+BACKENDS = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+def select_backend(name: str = JSON_CODEC) -> str:
+    """Name of the backend to use for `name`, falling back to json when it is not installed."""
+    if name == "auto":
+        return next((backend for backend in ("orjson", "msgspec") if importlib.util.find_spec(backend)), "json")
+    if name not in BACKENDS:
+        logger.warning(f"Unknown ARGOCD_JSON_CODEC {name!r}, using json")
+        return "json"
+    if name != "json" and importlib.util.find_spec(name) is None:
+        logger.warning(f"ARGOCD_JSON_CODEC is {name} but it is not installed, using json")
+        return "json"
+    return name
+
+
+CODEC = select_backend()
+# Whether a compiled codec is in use; tool results are then encoded by it instead of by FastMCP
+FAST_CODEC = CODEC != "json"
+
+# loads(bytes | str) raises ValueError on invalid input; dumps(value) returns compact UTF-8 bytes
+loads, dumps = BACKENDS[CODEC]()
@@ -0,0 +1,286 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental pod log reading with filtering, deduplication and a bounded tail"""
+
+import re
+import time
+import heapq
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from contextlib import aclosing
+from typing import Optional, Dict, Any, List, Deque, Tuple
+
+import httpx
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import stream_api_request, StreamRequestError
+
+LEVELS = {
+    "trace": 0,
+    "debug": 1,
+    "info": 2,
+    "notice": 2,
+    "warn": 3,
+    "warning": 3,
+    "error": 4,
+    "err": 4,
+    "fatal": 5,
+    "panic": 5,
+    "critical": 5,
+}
+# klog / glog prefix letter, e.g. "E0612 10:00:00.000000 ..."
+KLOG_LEVELS = {"I": "info", "W": "warn", "E": "error", "F": "fatal"}
+
+_LEVEL_NAMES = "|".join(sorted(LEVELS, key=len, reverse=True))
+# level=error, "level":"error", severity: ERROR, [ERROR], or a leading ERROR / E0612
+LEVEL_PATTERN = re.compile(
+    rf"""(?ix)
+    \b(?:level|lvl|severity)["']?\s*[=:]\s*["']?(?P<field>{_LEVEL_NAMES})\b
+    | \[(?P<bracket>{_LEVEL_NAMES})\]
+    | ^\W*(?P<leading>{_LEVEL_NAMES})\b
+    | ^(?P<klog>[IWEF])\d{{4}}\s
+    """
+)
+
+logger = logging.getLogger("mcp_argocd")
+
+
+def log_level(content: str) -> Optional[int]:
+    """Severity of a log line (see LEVELS), or None when it names no level."""
+    match = LEVEL_PATTERN.search(content)
+    if match is None:
+        return None
+    if match.group("klog"):
+        return LEVELS[KLOG_LEVELS[match.group("klog")]]
+    return LEVELS[(match.group("field") or match.group("bracket") or match.group("leading")).lower()]
+
+
+def timestamp_key(timestamp: str) -> str:
+    """RFC 3339 timestamp with the fraction padded to nanoseconds, so timestamps from any pod sort as strings."""
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return f"{seconds}.{fraction:0<9}"
+
+
+class LogFilter:
+    """
+    Accepts log lines matching a regular expression and a minimum level.
+
+    With a level set, lines that name no level are rejected.
+
+    Raises:
+        ValueError: If the pattern does not compile or the level is unknown
+    """
+
+    def __init__(self, match: Optional[str] = None, level: Optional[str] = None, match_case: bool = False):
+        try:
+            self.pattern = re.compile(match, 0 if match_case else re.IGNORECASE) if match else None
+        except re.error as e:
+            raise ValueError(f"Invalid match pattern {match!r}: {e}") from e
+        if level and level.lower() not in LEVELS:
+            raise ValueError(f"Unknown log level {level!r}, expected one of {', '.join(LEVELS)}")
+        self.min_level = LEVELS[level.lower()] if level else None
+
+    def accepts(self, content: str) -> bool:
+        if self.pattern is not None and not self.pattern.search(content):
+            return False
+        if self.min_level is not None:
+            level = log_level(content)
+            return level is not None and level >= self.min_level
+        return True
+
+
+class LogLine:
+    """One retained log line and how many times it was seen."""
+
+    __slots__ = ("timestamp", "pod", "content", "count")
+
+    def __init__(self, timestamp: str, pod: str, content: str):
+        self.timestamp = timestamp
+        self.pod = pod
+        self.content = content
+        self.count = 1
+
+    def render(self, with_pod: bool = False) -> str:
+        prefix = f"{self.timestamp} {self.pod} " if with_pod else f"{self.timestamp} "
+        suffix = f" [x{self.count}]" if self.count > 1 else ""
+        return f"{prefix}{self.content}{suffix}"
+
+
+class LogBudget:
+    """Limits on lines and bytes read and on wall time, shareable between several streams."""
+
+    def __init__(self, max_lines: int, max_bytes: int, max_duration: float, clock=time.monotonic):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.deadline = clock() + max_duration
+        self.lines = 0
+        self.bytes = 0
+
+    def charge(self, size: int) -> Optional[str]:
+        """Count one line read; returns why reading must stop, or None."""
+        self.lines += 1
+        self.bytes += size
+        if self.lines >= self.max_lines:
+            return "max_lines"
+        if self.bytes >= self.max_bytes:
+            return "max_bytes"
+        return None
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - self.clock())
+
+
+class LogTail:
+    """
+    The last `limit` accepted lines, oldest first.
+
+    With `dedup`, a line whose content equals a line still in the tail is
+    counted on that line, which takes the timestamp of the repeat and moves to
+    the newest end, so the tail always holds the most recently seen lines.
+    """
+
+    def __init__(self, limit: int, dedup: bool = True):
+        self.limit = max(1, limit)
+        self.dedup = dedup
+        # Keyed by content with dedup, otherwise by arrival number
+        self._lines: "OrderedDict[Any, LogLine]" = OrderedDict()
+        self.matched = 0
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @property
+    def lines(self) -> List[LogLine]:
+        return list(self._lines.values())
+
+    def add(self, timestamp: str, pod: str, content: str) -> None:
+        self.matched += 1
+        key = content if self.dedup else self.matched
+        seen = self._lines.get(key)
+        if seen is not None:
+            seen.count += 1
+            seen.timestamp, seen.pod = timestamp, pod
+            self._lines.move_to_end(key)
+            self.duplicates += 1
+            return
+        self._lines[key] = LogLine(timestamp, pod, content)
+        if len(self._lines) > self.limit:
+            self._lines.popitem(last=False)
+
+
+async def read_pod_logs(
+    path: str,
+    params: Dict[str, Any],
+    log_filter: LogFilter,
+    tail: LogTail,
+    budget: LogBudget,
+    pod: str = "",
+) -> str:
+    """
+    Stream log entries from a logs endpoint into `tail` until it ends or `budget` runs out.
+
+    Only the lines in the tail are kept, so memory stays bounded however
+    much the pod logged.
+
+    Returns:
+        Why reading stopped: 'end', 'max_lines', 'max_bytes' or 'max_duration'
+
+    Raises:
+        StreamRequestError: If the server rejects the request or reports an error
+        httpx.RequestError: If the connection fails
+    """
+    stop_reason = "end"
+    try:
+        async with asyncio.timeout(budget.remaining()), aclosing(stream_api_request(path, params=params)) as stream:
+            async for event in stream:
+                entry = event.get("result", event)
+                if entry.get("last"):
+                    break
+                content = entry.get("content") or ""
+                if log_filter.accepts(content):
+                    tail.add(entry.get("timeStampStr") or entry.get("timeStamp") or "", entry.get("podName") or pod, content)
+                exhausted = budget.charge(len(content) + 1)
+                if exhausted:
+                    stop_reason = exhausted
+                    break
+    except TimeoutError:
+        stop_reason = "max_duration"
+    return stop_reason
+
+
+def merge_tails(tails: List[LogTail], limit: int, max_output_bytes: int) -> Tuple[List[LogLine], bool]:
+    """
+    K-way merge of per-pod tails into one timestamp-ordered list.
+
+    Each tail is already in time order, so a heap merge yields the combined
+    order without sorting everything. Only the newest `limit` lines are kept,
+    and older lines are dropped further until the rendered output fits in
+    `max_output_bytes`.
+
+    Returns:
+        The merged lines, oldest first, and whether any line was dropped
+    """
+    merged: Deque[LogLine] = deque(heapq.merge(*(tail.lines for tail in tails), key=lambda line: timestamp_key(line.timestamp)), maxlen=max(1, limit))
+    truncated = len(merged) < sum(len(tail) for tail in tails)
+    kept: List[LogLine] = []
+    size = 0
+    for line in reversed(merged):
+        size += len(line.render(with_pod=True)) + 1
+        if size > max_output_bytes:
+            truncated = True
+            break
+        kept.append(line)
+    kept.reverse()
+    return kept, truncated
+
+
+def tail_result(lines: List[LogLine], tails: List[LogTail], budget: LogBudget, stop_reason: str, with_pod: bool = False) -> Dict[str, Any]:
+    """Summary of a read: the retained lines rendered in order and what was read to find them."""
+    return {
+        "count": len(lines),
+        "lines": [line.render(with_pod) for line in lines],
+        "scanned": budget.lines,
+        "bytes_read": budget.bytes,
+        "matched": sum(tail.matched for tail in tails),
+        "duplicates": sum(tail.duplicates for tail in tails),
+        "stop_reason": stop_reason,
+    }
+
+
+async def tail_logs(
+    path: str,
+    params: Dict[str, Any],
+    match: Optional[str] = None,
+    level: Optional[str] = None,
+    match_case: bool = False,
+    dedup: bool = True,
+    limit: int = 200,
+    max_lines: int = 100_000,
+    max_bytes: int = 64 * 1024 * 1024,
+    max_duration: float = 30,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Read one pod's logs into a filtered, deduplicated tail of at most `limit` lines.
+
+    Returns:
+        Tuple of (success, data) where data is the `tail_result` summary or an error dict
+    """
+    try:
+        log_filter = LogFilter(match, level, match_case)
+    except ValueError as e:
+        return (False, {"error": str(e)})
+    tail = LogTail(limit, dedup)
+    budget = LogBudget(max_lines, max_bytes, max_duration)
+    try:
+        stop_reason = await read_pod_logs(path, params, log_filter, tail, budget)
+    except StreamRequestError as e:
+        logger.error(str(e))
+        return (False, {"error": str(e)})
+    except httpx.RequestError as e:
+        logger.error(f"Request error: {e}")
+        return (False, {"error": f"Request error: {e}"})
+    logger.debug(f"Read {budget.lines} log lines from {path}, kept {len(tail)} ({stop_reason})")
+    return (True, tail_result(tail.lines, [tail], budget, stop_reason))
@@ -0,0 +1,187 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Field projection and noise removal applied to every MCP tool result"""
+
+import os
+import re
+import inspect
+import logging
+import itertools
+import functools
+from typing import Any, Callable, Dict, List, Optional
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils import codec
+
+STRIP_NOISE = os.getenv("ARGOCD_STRIP_NOISE", "true").lower() == "true"
+
+# Keys dropped wherever they appear
+NOISE_KEYS = {"managedFields"}
+# Annotation keys dropped from any `annotations` map
+NOISE_ANNOTATIONS = {"kubectl.kubernetes.io/last-applied-configuration"}
+
+FIELDS_DOC = """
+    Response shaping:
+        fields (List[str], optional): Dotted paths to keep in the response, e.g. ['items.metadata.name', 'items.status.health.status']. Lists are traversed implicitly. Defaults to None (full response).
+"""
+
+logger = logging.getLogger("mcp_tools")
+
+_INDEX = re.compile(r"\[(\*|\d*)\]")
+
+
+def parse_field_path(path: str) -> List[str]:
+    """Split a dotted or JSONPath-like path (`$.items[*].metadata.name`) into segments."""
+    path = path.strip()
+    if path.startswith("$"):
+        path = path[1:]
+    path = _INDEX.sub(lambda m: f".{m.group(1)}" if m.group(1).isdigit() else "", path)
+    return [segment for segment in path.split(".") if segment]
+
+
+def _build_tree(fields: List[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        segments = parse_field_path(field)
+        for i, segment in enumerate(segments):
+            if i == len(segments) - 1:
+                node[segment] = None
+            elif node.get(segment, {}) is None:
+                break  # a parent path is already selected in full
+            else:
+                node = node.setdefault(segment, {})
+    return tree
+
+
+def _project(value: Any, tree: Optional[Dict[str, Any]], removed: Optional[list]) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        indexes = [int(segment) for segment in tree if segment.isdigit()]
+        if indexes:
+            if removed is not None:
+                kept = {i % len(value) for i in indexes if -len(value) <= i < len(value)}
+                removed.extend((None, item) for i, item in enumerate(value) if i not in kept)
+            return [_project(value[i], tree[str(i)], removed) for i in indexes if -len(value) <= i < len(value)]
+        return [_project(item, tree, removed) for item in value]
+    if isinstance(value, dict):
+        if removed is not None:
+            removed.extend((key, item) for key, item in value.items() if key not in tree)
+        return {key: _project(value[key], subtree, removed) for key, subtree in tree.items() if key in value}
+    return value
+
+
+def project_fields(value: Any, fields: List[str], removed: Optional[list] = None) -> Any:
+    """Keep only the given dotted paths of a JSON value; dropped (key, value) pairs are appended to `removed`."""
+    return _project(value, _build_tree(fields), removed)
+
+
+def _value_at(value: Any, segments: List[str]) -> Any:
+    if not segments:
+        return value
+    if isinstance(value, list):
+        if segments[0].isdigit():
+            i = int(segments[0])
+            return _value_at(value[i], segments[1:]) if i < len(value) else None
+        return [_value_at(item, segments) for item in value]
+    if isinstance(value, dict) and segments[0] in value:
+        return _value_at(value[segments[0]], segments[1:])
+    return None
+
+
+def field_value(value: Any, path: str) -> Any:
+    """Value at one dotted path of a JSON value, None when absent. Lists are traversed implicitly."""
+    return _value_at(value, parse_field_path(path))
+
+
+def strip_noise(value: Any, removed: Optional[list] = None) -> Any:
+    """
+    Return a JSON value without managedFields and last-applied-configuration annotations.
+
+    Only the containers on the way to a removed key are copied, so a value
+    without noise is returned as is. Removed (key, value) pairs are appended
+    to `removed` when it is given.
+    """
+    if isinstance(value, dict):
+        result = None
+        for i, (key, item) in enumerate(value.items()):
+            if key in NOISE_KEYS:
+                if removed is not None:
+                    removed.append((key, item))
+                if result is None:
+                    result = dict(itertools.islice(value.items(), i))
+                continue
+            if key == "annotations" and isinstance(item, dict) and not NOISE_ANNOTATIONS.isdisjoint(item):
+                stripped = {k: v for k, v in item.items() if k not in NOISE_ANNOTATIONS}
+                if removed is not None:
+                    removed.extend((k, v) for k, v in item.items() if k in NOISE_ANNOTATIONS)
+            elif isinstance(item, (dict, list)):
+                stripped = strip_noise(item, removed)
+            else:
+                stripped = item
+            if result is None and stripped is not item:
+                result = dict(itertools.islice(value.items(), i))
+            if result is not None:
+                result[key] = stripped
+        return value if result is None else result
+    if isinstance(value, list):
+        result = None
+        for i, item in enumerate(value):
+            stripped = strip_noise(item, removed) if isinstance(item, (dict, list)) else item
+            if result is None and stripped is not item:
+                result = value[:i]
+            if result is not None:
+                result.append(stripped)
+        return value if result is None else result
+    return value
+
+
+def _removed_size(removed: list) -> int:
+    """Approximate JSON size of removed dict entries and list items, separators included."""
+    keys = [key for key, _ in removed if key is not None]
+    return len(codec.dumps([item for _, item in removed])) + len(codec.dumps(keys)) + len(removed) - len(keys)
+
+
+def shape_result(result: Any, fields: Optional[List[str]] = None) -> Any:
+    """
+    Apply noise removal and optional field projection to a tool result.
+
+    Error results are returned untouched, and so is a result without noise
+    when no fields are requested. When something was removed, a
+    `_response_shaping` entry reports the approximate bytes saved, measured
+    on the removed parts only.
+    """
+    if not isinstance(result, dict) or "error" in result or not (fields or STRIP_NOISE):
+        return result
+
+    # Projecting first leaves only the kept parts to be walked for noise
+    removed: list = []
+    shaped = project_fields(result, fields, removed) if fields else result
+    if STRIP_NOISE:
+        shaped = strip_noise(shaped, removed)
+
+    if removed:
+        bytes_saved = _removed_size(removed)
+        logger.debug(f"Response shaping saved about {bytes_saved} bytes")
+        shaped["_response_shaping"] = {"bytes_saved": bytes_saved}
+    return shaped
+
+
+def shape_response(fn: Callable) -> Callable:
+    """
+    Wrap an async tool so its result is shaped by `shape_result`.
+
+    Adds a `fields` parameter to the tool signature (and therefore to its MCP
+    input schema) and documents it in the tool description.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args, fields: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
+        return shape_result(await fn(*args, **kwargs), fields)
+
+    signature = inspect.signature(fn)
+    fields_param = inspect.Parameter("fields", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=List[str])
+    wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), fields_param])
+    wrapper.__doc__ = (fn.__doc__ or "").rstrip() + "\n" + FIELDS_DOC
+    return wrapper
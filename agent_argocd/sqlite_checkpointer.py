@@ -0,0 +1,120 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+SQLite conversation checkpointer with the thread bounds of BoundedMemorySaver.
+
+Needs the `sqlite` extra (langgraph-checkpoint-sqlite). Threads are deleted
+least-recently-used beyond `max_threads` and after `ttl_seconds` idle. Access
+times are kept in memory; threads already in the database when the saver
+starts count as accessed at that moment.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedSqliteSaver(AsyncSqliteSaver):
+  """AsyncSqliteSaver with LRU/TTL eviction by thread."""
+
+  def __init__(
+    self,
+    conn: aiosqlite.Connection,
+    max_threads: int,
+    ttl_seconds: Optional[float],
+    clock=time.monotonic,
+    **kwargs: Any,
+  ):
+    super().__init__(conn, **kwargs)
+    self.max_threads = max_threads
+    self.ttl_seconds = ttl_seconds
+    self.clock = clock
+    # thread_id -> last access time, least recently used first
+    self._last_access: "OrderedDict[str, float]" = OrderedDict()
+    self.stats = {"evictions": 0, "expirations": 0}
+
+  def _touch(self, thread_id: str) -> None:
+    self._last_access[thread_id] = self.clock()
+    self._last_access.move_to_end(thread_id)
+
+  async def _enforce(self, thread_id: str) -> None:
+    self._touch(thread_id)
+    await self.evict_expired()
+    while len(self._last_access) > self.max_threads:
+      await self.adelete_thread(next(iter(self._last_access)))
+      self.stats["evictions"] += 1
+
+  async def evict_expired(self) -> int:
+    """Delete threads idle for longer than ttl_seconds; returns how many were dropped."""
+    if self.ttl_seconds is None:
+      return 0
+    deadline = self.clock() - self.ttl_seconds
+    expired = []
+    for thread_id, last_access in self._last_access.items():
+      if last_access > deadline:
+        break
+      expired.append(thread_id)
+    for thread_id in expired:
+      await self.adelete_thread(thread_id)
+    self.stats["expirations"] += len(expired)
+    return len(expired)
+
+  async def aclose(self) -> None:
+    await self.conn.close()
+
+  def metrics(self) -> Dict[str, Any]:
+    return {
+      "backend": "sqlite",
+      "threads": len(self._last_access),
+      **self.stats,
+    }
+
+  # AsyncSqliteSaver
+
+  async def setup(self) -> None:
+    if self.is_setup:
+      return
+    await super().setup()
+    async with self.lock, self.conn.execute("SELECT DISTINCT thread_id FROM checkpoints") as cursor:
+      for (thread_id,) in await cursor.fetchall():
+        self._touch(thread_id)
+
+  async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+    result = await super().aget_tuple(config)
+    if result is not None:
+      self._touch(str(config["configurable"]["thread_id"]))
+    return result
+
+  async def aput(
+    self,
+    config: RunnableConfig,
+    checkpoint: Checkpoint,
+    metadata: CheckpointMetadata,
+    new_versions: ChannelVersions,
+  ) -> RunnableConfig:
+    result = await super().aput(config, checkpoint, metadata, new_versions)
+    await self._enforce(str(config["configurable"]["thread_id"]))
+    return result
+
+  async def aput_writes(
+    self,
+    config: RunnableConfig,
+    writes: Sequence[Tuple[str, Any]],
+    task_id: str,
+    task_path: str = "",
+  ) -> None:
+    await super().aput_writes(config, writes, task_id, task_path)
+    self._touch(str(config["configurable"]["thread_id"]))
+
+  async def adelete_thread(self, thread_id: str) -> None:
+    await super().adelete_thread(thread_id)
+    self._last_access.pop(str(thread_id), None)
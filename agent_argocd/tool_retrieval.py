@@ -0,0 +1,209 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline tool retrieval for the agent graph.
+
+Binding all ~100 ArgoCD tool schemas costs tens of thousands of prompt tokens
+per LLM turn, most of it in the flattened `body_*` parameters of a handful of
+write tools. `ToolIndex` ranks tools for a query with BM25 over their names,
+descriptions and parameter names, boosted by the category encoded in the
+`<category>_service__` prefix, and `ToolSelectingModel` binds only the top-k
+tools on each model call. When nothing matches confidently the full tool set is
+bound, and tools already called in the conversation stay bound.
+"""
+
+import logging
+import math
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableBinding
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+logger = logging.getLogger(__name__)
+
+RETRIEVAL_ENABLED = os.getenv("AGENT_TOOL_RETRIEVAL", "true").lower() == "true"
+TOP_K = int(os.getenv("AGENT_TOOL_TOP_K", "12"))
+MIN_SCORE = float(os.getenv("AGENT_TOOL_MIN_SCORE", "2.0"))
+
+NAME_WEIGHT = 2.0
+CATEGORY_BOOST = 2.0
+
+STOPWORDS = {
+  "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for", "from", "get", "how", "i", "in", "is",
+  "it", "me", "my", "of", "on", "or", "please", "show", "the", "this", "to", "what", "which", "with", "you", "all",
+  # Docstring boilerplate shared by every generated tool
+  "any", "arg", "dict", "openapi", "param", "str",
+}
+
+# Query words that name a tool category, keyed by the category in `<category>_service__`
+CATEGORY_ALIASES: Dict[str, Sequence[str]] = {
+  "account": ("account", "password", "rbac", "permission"),
+  "application": ("app", "application", "deployment", "sync", "health", "rollback", "manifest", "log", "pod", "resource"),
+  "application_set": ("appset", "applicationset", "generator"),
+  "certificate": ("cert", "certificate", "tls", "ssh", "known_host"),
+  "cluster": ("cluster", "destination"),
+  "gpg_key": ("gpg", "gpgkey", "signature"),
+  "notification": ("notification", "notify", "trigger", "template"),
+  "project": ("project", "appproject", "role", "window"),
+  "repo_creds": ("credential", "cred", "creds", "repocred"),
+  "repository": ("repo", "repository", "git", "helm", "chart", "ref", "branch"),
+  "session": ("session", "login", "logout", "userinfo", "whoami"),
+  "settings": ("setting", "settings", "plugin", "config"),
+  "version": ("version",),
+}
+
+# Read tools bound whenever their category is mentioned, whatever their rank
+CORE_ACTIONS = ("list", "get")
+
+# Word forms that should match the vocabulary of the tool descriptions
+NORMALIZE = {"healthy": "health", "unhealthy": "health", "logged": "login", "synced": "sync", "syncing": "sync", "deployed": "deploy"}
+
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+  """Lowercase word tokens with camelCase split, stopwords dropped and plural 's' trimmed."""
+  words = _WORD.findall(_CAMEL.sub(r"\1 \2", text or "").lower())
+  words = [NORMALIZE.get(w, w) for w in words if w not in STOPWORDS]
+  return [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w for w in words]
+
+
+def tool_category(name: str) -> Optional[str]:
+  prefix, sep, _ = name.partition("_service__")
+  return prefix if sep else None
+
+
+def query_categories(tokens: Iterable[str]) -> set:
+  aliases = {tokenize(alias)[0]: category for category, names in CATEGORY_ALIASES.items() for alias in names if tokenize(alias)}
+  return {aliases[t] for t in tokens if t in aliases}
+
+
+def _parameters(tool: Any) -> Dict[str, Any]:
+  schema = tool.args_schema
+  if schema is None:
+    return {}
+  if not isinstance(schema, dict):
+    schema = schema.model_json_schema()
+  return schema.get("properties", {})
+
+
+class ToolIndex:
+  """BM25 over tool descriptions and parameter names, plus name matches and category tags."""
+
+  def __init__(self, tools: Sequence[BaseTool], k1: float = 1.2, b: float = 0.75):
+    self.tools = list(tools)
+    self.k1, self.b = k1, b
+    self.categories = [tool_category(tool.name) for tool in self.tools]
+    self.names = [set(tokenize(tool.name.replace("_service__", " "))) for tool in self.tools]
+    self.docs: List[Counter] = []
+    for tool in self.tools:
+      tokens = tokenize(tool.description)
+      # Parameter names count once each, so write tools with hundreds of body_* fields do not dominate
+      tokens += sorted({t for param in _parameters(tool) for t in tokenize(param)})
+      self.docs.append(Counter(tokens))
+    self.lengths = [sum(doc.values()) for doc in self.docs]
+    self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+    df = Counter(term for doc, name in zip(self.docs, self.names) for term in set(doc) | name)
+    n = len(self.docs)
+    self.idf = {term: math.log(1 + (n - count + 0.5) / (count + 0.5)) for term, count in df.items()}
+
+  def scores(self, query: str) -> List[float]:
+    tokens = set(tokenize(query))
+    categories = query_categories(tokens)
+    scores = []
+    for doc, length, name, category in zip(self.docs, self.lengths, self.names, self.categories):
+      score = 0.0
+      norm = self.k1 * (1 - self.b + self.b * length / self.avg_length)
+      for term in tokens:
+        tf = doc.get(term)
+        if tf:
+          score += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+        if term in name:
+          score += NAME_WEIGHT * self.idf[term]
+      if category in categories:
+        score += CATEGORY_BOOST
+      scores.append(score)
+    return scores
+
+  def search(self, query: str, k: int = TOP_K, min_score: float = MIN_SCORE) -> Optional[List[BaseTool]]:
+    """Top-k tools for a query plus the list/get tools of each mentioned category, or None when no tool scores at least min_score."""
+    ranked = sorted(zip(self.scores(query), range(len(self.tools))), key=lambda pair: (-pair[0], pair[1]))
+    if not ranked or ranked[0][0] < min_score:
+      return None
+    selected = [self.tools[i] for score, i in ranked[:k] if score > 0]
+    core = {f"{category}_service__{action}" for category in query_categories(tokenize(query)) for action in CORE_ACTIONS}
+    selected += [tool for tool in self.tools if tool.name in core and tool not in selected]
+    return selected
+
+  def select(self, messages: Sequence[BaseMessage], k: int = TOP_K, min_score: float = MIN_SCORE) -> List[BaseTool]:
+    """Tools to bind for a conversation: top-k for the latest user message plus every tool already called."""
+    query = next((_text(m) for m in reversed(messages) if isinstance(m, HumanMessage)), "")
+    selected = self.search(query, k, min_score)
+    if selected is None:
+      logger.debug(f"No confident tool match for {query!r}, binding all {len(self.tools)} tools")
+      return self.tools
+    called = {call["name"] for m in messages if isinstance(m, AIMessage) for call in m.tool_calls}
+    names = {tool.name for tool in selected} | called
+    return [tool for tool in self.tools if tool.name in names]
+
+
+def _text(message: BaseMessage) -> str:
+  if isinstance(message.content, str):
+    return message.content
+  return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in message.content)
+
+
+class ToolSelectingModel(RunnableBinding):
+  """
+  A chat model binding that re-binds a per-call subset of its tools.
+
+  create_react_agent accepts a model that already has tools bound when the bound
+  names match its tools, so the full set is declared in `kwargs` for that check
+  while each call binds only `index.select(messages)`.
+  """
+
+  index: Any
+  top_k: int = TOP_K
+  min_score: float = MIN_SCORE
+
+  def __init__(self, model: Any, tools: Sequence[BaseTool], top_k: int = TOP_K, min_score: float = MIN_SCORE):
+    super().__init__(
+      bound=model,
+      kwargs={"tools": [convert_to_openai_tool(tool) for tool in tools]},
+      index=ToolIndex(tools),
+      top_k=top_k,
+      min_score=min_score,
+    )
+
+  def _select(self, input: Any) -> Any:
+    messages = input.to_messages() if hasattr(input, "to_messages") else input
+    tools = self.index.select(messages, self.top_k, self.min_score)
+    logger.debug(f"Binding {len(tools)} of {len(self.index.tools)} tools")
+    return self.bound.bind_tools(tools)
+
+  def invoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+    return self._select(input).invoke(input, self._merge_configs(config), **kwargs)
+
+  async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+    return await self._select(input).ainvoke(input, self._merge_configs(config), **kwargs)
+
+  def stream(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+    yield from self._select(input).stream(input, self._merge_configs(config), **kwargs)
+
+  async def astream(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+    async for chunk in self._select(input).astream(input, self._merge_configs(config), **kwargs):
+      yield chunk
+
+
+def with_tool_retrieval(model: Any, tools: Sequence[BaseTool], enabled: bool = RETRIEVAL_ENABLED, top_k: int = TOP_K) -> Any:
+  """Wrap a chat model for create_react_agent so each call binds only the relevant tools."""
+  if not enabled or len(tools) <= top_k:
+    return model
+  return ToolSelectingModel(model, tools, top_k=top_k)
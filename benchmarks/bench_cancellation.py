@@ -0,0 +1,102 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Capacity freed by task cancellation under load.
+
+Submits a burst of tasks to ArgoCDAgentExecutor behind an admission controller
+with a small concurrency cap. The agent is a stand-in whose every step sleeps
+like an LLM or ArgoCD call. Clients abandon half of the tasks shortly after
+submitting them. Without cancellation the abandoned tasks run to completion
+and hold their slots; with it they are cancelled, their slots go to the queued
+tasks and their remaining steps are never executed.
+
+Usage:
+    python benchmarks/bench_cancellation.py [--tasks 16] [--concurrency 4] [--steps 10] [--step-ms 100]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ARGOCD_API_URL", "http://127.0.0.1:1")
+os.environ.setdefault("ARGOCD_TOKEN", "benchmark-token")
+
+
+class SteppingAgent:
+    """Stand-in for ArgoCDAgent: `steps` sleeps of `step_s` seconds, each counted as one upstream call."""
+
+    def __init__(self, steps: int, step_s: float):
+        self.steps = steps
+        self.step_s = step_s
+        self.calls = 0
+
+    async def stream(self, query, context_id):
+        for _ in range(self.steps):
+            await asyncio.sleep(self.step_s)
+            self.calls += 1
+            yield {"is_task_complete": False, "require_user_input": False, "content": "working"}
+        yield {"is_task_complete": True, "require_user_input": False, "content": "done"}
+
+
+async def run(tasks: int, concurrency: int, steps: int, step_s: float, cancel: bool):
+    from a2a.server.agent_execution import RequestContext
+    from a2a.server.events.event_queue import EventQueue
+    from a2a.types import Message, MessageSendParams, Part, Role, TextPart
+
+    from agent_argocd.protocol_bindings.a2a_server.admission import AdmissionController
+    from agent_argocd.protocol_bindings.a2a_server.agent_executor import ArgoCDAgentExecutor
+
+    agent = SteppingAgent(steps, step_s)
+    executor = ArgoCDAgentExecutor(admission=AdmissionController(concurrency, max_per_context=1, max_queued=tasks, queue_timeout=600), agent=agent)
+    start = time.perf_counter()
+    finished = {}
+
+    async def submit(i: int):
+        message = Message(role=Role.user, parts=[Part(root=TextPart(text="status"))], messageId=f"m{i}", contextId=f"c{i}")
+        queue = EventQueue()
+        await executor.execute(RequestContext(request=MessageSendParams(message=message)), queue)
+        finished[i] = time.perf_counter() - start
+
+    executions = [asyncio.create_task(submit(i)) for i in range(tasks)]
+    await asyncio.sleep(0)
+    # The first half of the tasks is abandoned by its clients shortly after starting
+    await asyncio.sleep(2 * step_s)
+    if cancel:
+        for task_id in list(executor._runs)[: tasks // 2]:
+            await executor.cancel(RequestContext(None, task_id=task_id, context_id="", task=None), EventQueue())
+    await asyncio.gather(*executions)
+
+    kept = [finished[i] for i in range(tasks // 2, tasks)]
+    return {
+        "p50": statistics.median(kept),
+        "max": max(kept),
+        "calls": agent.calls,
+        "canceled": executor.canceled,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--step-ms", type=int, default=100)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    step_s = args.step_ms / 1000
+    print(f"{args.tasks} tasks, {args.tasks // 2} abandoned, concurrency {args.concurrency}, {args.steps} steps of {args.step_ms}ms per task")
+    print(f"{'mode':<16} {'kept p50':>10} {'kept max':>10} {'upstream calls':>15} {'canceled':>9}")
+    for label, cancel in (("no cancellation", False), ("cancellation", True)):
+        result = asyncio.run(run(args.tasks, args.concurrency, args.steps, step_s, cancel))
+        print(f"{label:<16} {result['p50']:9.2f}s {result['max']:9.2f}s {result['calls']:>15} {result['canceled']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-call latency of make_api_request with a fresh AsyncClient per call versus the
+shared pooled client.
+
+Usage:
+    python benchmarks/bench_client_pool.py [--calls 500]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_argocd import FakeArgoCD  # noqa: E402
+
+
+def _report(label: str, samples: list) -> None:
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(f"{label:<28} mean={statistics.mean(samples_ms):7.3f}ms  p50={statistics.median(samples_ms):7.3f}ms  p95={p95:7.3f}ms")
+
+
+async def _per_call_client(url: str, token: str, calls: int) -> list:
+    import httpx
+
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.get(f"{url}/api/v1/applications/app-00001", headers={"Authorization": f"Bearer {token}"})
+            response.json()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def _pooled_client(calls: int) -> list:
+    from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import close_client, make_api_request
+
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await make_api_request("/api/v1/applications/app-00001")
+        samples.append(time.perf_counter() - start)
+    await close_client()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    with FakeArgoCD(app_count=10) as server:
+        os.environ["ARGOCD_API_URL"] = server.url
+        os.environ.setdefault("ARGOCD_TOKEN", "benchmark-token")
+
+        import logging
+
+        logging.disable(logging.CRITICAL)
+
+        baseline = asyncio.run(_per_call_client(server.url, os.environ["ARGOCD_TOKEN"], args.calls))
+        pooled = asyncio.run(_pooled_client(args.calls))
+
+    print(f"{args.calls} sequential GET /api/v1/applications/{{name}} calls against {server.url}")
+    _report("new AsyncClient per call", baseline)
+    _report("shared pooled client", pooled)
+    print(f"speedup (mean): {statistics.mean(baseline) / statistics.mean(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Upstream load and latency of concurrent identical GETs with and without
+single-flight coalescing in make_api_request.
+
+Each round fires `--concurrency` identical GET /api/v1/applications calls at
+once, as happens when several conversations ask about the fleet at the same
+moment.
+
+Usage:
+    python benchmarks/bench_coalescing.py [--apps 1000] [--concurrency 20] [--rounds 10]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_argocd import FakeArgoCD  # noqa: E402
+
+
+async def _rounds(concurrency: int, rounds: int) -> float:
+    from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.client import close_client, make_api_request
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        results = await asyncio.gather(*[make_api_request("/api/v1/applications") for _ in range(concurrency)])
+        assert all(success for success, _ in results)
+    elapsed = time.perf_counter() - start
+    await close_client()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    with FakeArgoCD(app_count=args.apps) as server:
+        os.environ["ARGOCD_API_URL"] = server.url
+        os.environ.setdefault("ARGOCD_TOKEN", "benchmark-token")
+        logging.disable(logging.CRITICAL)
+        from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api import client
+
+        calls = args.concurrency * args.rounds
+        print(f"{args.rounds} rounds of {args.concurrency} concurrent GET /api/v1/applications ({args.apps} apps)")
+        for label, enabled in (("without coalescing", False), ("with coalescing", True)):
+            client.COALESCE_GETS = enabled
+            client.request_stats.update(upstream=0, deduplicated=0)
+            server.request_count = 0
+            elapsed = asyncio.run(_rounds(args.concurrency, args.rounds))
+            print(
+                f"{label:<20} {calls} calls -> {server.request_count:4d} upstream requests, "
+                f"{client.request_stats['deduplicated']:4d} deduplicated, {elapsed * 1000 / args.rounds:8.1f}ms per round"
+            )
+
+
+if __name__ == "__main__":
+    main()
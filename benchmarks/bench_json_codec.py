@@ -0,0 +1,69 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+JSON cost of one list-applications tool call on a synthetic fleet, per codec.
+
+Measures the three places a large response is (de)serialized on the MCP
+server: decoding the ArgoCD response body, sizing the result for response
+shaping, and converting the tool result into MCP content (FastMCP's pydantic
+conversion vs one compact encode with the selected codec).
+
+Usage:
+    python benchmarks/bench_json_codec.py [--apps 3000] [--repeat 5]
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ARGOCD_API_URL", "http://127.0.0.1:1")
+os.environ.setdefault("ARGOCD_TOKEN", "benchmark-token")
+
+from benchmarks.fake_argocd import make_fleet  # noqa: E402
+
+
+def _best_ms(fn, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    from agent_argocd.protocol_bindings.mcp_server.mcp_argocd import registry
+    from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils import codec
+
+    fleet = {"metadata": {"resourceVersion": "1"}, "items": make_fleet(args.apps)}
+    body = json.dumps(fleet).encode()
+    tool = registry.CodecTool.from_function(registry.load_tool("application_service__list"), name="application_service__list")
+    print(f"{args.apps} applications, {len(body) / 1e6:.1f} MB response body (best of {args.repeat})")
+    print(f"{'codec':<10} {'decode':>10} {'size':>10} {'to MCP':>10} {'total':>10}")
+
+    fastmcp_ms = _best_ms(lambda: tool.fn_metadata.convert_result(fleet), args.repeat)
+    for name in ("json", "orjson", "msgspec"):
+        if name != "json" and importlib.util.find_spec(name) is None:
+            print(f"{name:<10} not installed")
+            continue
+        loads, dumps = codec.BACKENDS[name]()
+        decode_ms = _best_ms(lambda: loads(body), args.repeat)
+        size_ms = _best_ms(lambda: len(dumps(fleet)), args.repeat)
+        if name == "json":
+            # Without a fast codec, FastMCP converts the result itself
+            convert_ms = fastmcp_ms
+        else:
+            registry.codec.dumps, registry.codec.FAST_CODEC = dumps, True
+            convert_ms = _best_ms(lambda: registry.encode_tool_result(fleet, tool), args.repeat)
+        print(f"{name:<10} {decode_ms:8.1f}ms {size_ms:8.1f}ms {convert_ms:8.1f}ms {decode_ms + size_ms + convert_ms:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
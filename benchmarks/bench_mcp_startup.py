@@ -0,0 +1,73 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Time from interpreter start to the first list_tools response of the MCP server.
+
+Each sample runs in a fresh interpreter that hosts the server in-process and
+talks to it over an in-memory MCP session, comparing eager registration with
+lazy registration from the tool schema cache.
+
+Usage:
+    python benchmarks/bench_mcp_startup.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = """
+import time
+start = time.perf_counter()
+import asyncio, logging
+logging.disable(logging.CRITICAL)
+from mcp.shared.memory import create_connected_server_and_client_session
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.server import create_server
+
+async def first_list_tools():
+    server = create_server()
+    async with create_connected_server_and_client_session(server._mcp_server) as session:
+        result = await session.list_tools()
+    return len(result.tools)
+
+count = asyncio.run(first_list_tools())
+print(time.perf_counter() - start, count)
+"""
+
+
+def _sample(env: dict) -> tuple:
+    output = subprocess.run([sys.executable, "-W", "ignore", "-c", SAMPLE], env=env, cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    elapsed, count = output.stdout.split()
+    return float(elapsed), int(count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    base_env = dict(os.environ, ARGOCD_API_URL="http://127.0.0.1:1", ARGOCD_TOKEN="benchmark-token", PYTHONPATH=REPO_ROOT)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "tool_schemas.json")
+        modes = {
+            "eager registration": dict(base_env, ARGOCD_LAZY_TOOLS="false"),
+            "lazy, cold schema cache": dict(base_env, ARGOCD_LAZY_TOOLS="true", ARGOCD_TOOL_SCHEMA_CACHE=cache_path),
+            "lazy, warm schema cache": dict(base_env, ARGOCD_LAZY_TOOLS="true", ARGOCD_TOOL_SCHEMA_CACHE=cache_path),
+        }
+        for label, env in modes.items():
+            samples = []
+            for _ in range(args.runs):
+                if label.startswith("lazy, cold") and os.path.exists(cache_path):
+                    os.remove(cache_path)
+                elapsed, count = _sample(env)
+                samples.append(elapsed * 1000)
+            print(f"{label:<26} tools={count:<4} mean={statistics.mean(samples):8.1f}ms  min={min(samples):8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
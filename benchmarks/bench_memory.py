@@ -0,0 +1,121 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Memory held by the application inventory and resource tree graphs, raw decoded JSON vs compact records.
+
+Decodes a synthetic fleet from a JSON body, as the client does, and measures
+with tracemalloc what each representation keeps alive: the inventory with
+full application dicts vs CompactApplication records, and the resource trees
+of every application (its status.resources expanded into Deployment ->
+ReplicaSet -> Pod nodes) as dicts vs ResourceGraph's ResourceNode records.
+
+Usage:
+    python benchmarks/bench_memory.py [--apps 3000]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ARGOCD_API_URL", "http://127.0.0.1:1")
+os.environ.setdefault("ARGOCD_TOKEN", "benchmark-token")
+
+from benchmarks.fake_argocd import make_fleet  # noqa: E402
+
+
+def make_tree(app: Dict[str, Any]) -> Dict[str, Any]:
+    """Resource tree of one synthetic application: each Deployment owns a ReplicaSet with two Pods."""
+    nodes = []
+    for resource in app["status"]["resources"]:
+        namespace, name = resource["namespace"], resource["name"]
+        deployment = {**resource, "uid": f"{name}-d", "resourceVersion": "1", "createdAt": "2025-01-01T00:00:00Z", "info": [{"name": "Revision", "value": "Rev:1"}]}
+        replica_set = {
+            "group": "apps",
+            "version": "v1",
+            "kind": "ReplicaSet",
+            "namespace": namespace,
+            "name": f"{name}-7d9f",
+            "uid": f"{name}-r",
+            "parentRefs": [{"group": "apps", "kind": "Deployment", "namespace": namespace, "name": name, "uid": f"{name}-d"}],
+            "health": {"status": "Healthy"},
+            "createdAt": "2025-01-01T00:00:00Z",
+        }
+        pods = [
+            {
+                "version": "v1",
+                "kind": "Pod",
+                "namespace": namespace,
+                "name": f"{name}-7d9f-{n}",
+                "uid": f"{name}-p{n}",
+                "parentRefs": [{"group": "apps", "kind": "ReplicaSet", "namespace": namespace, "name": f"{name}-7d9f", "uid": f"{name}-r"}],
+                "health": resource["health"],
+                "images": [f"registry.example.com/{app['metadata']['name']}:1.0"],
+                "info": [{"name": "Status Reason", "value": "Running"}, {"name": "Containers", "value": "1/1"}],
+                "networkingInfo": {"labels": {"app": name}},
+                "createdAt": "2025-01-01T00:00:00Z",
+            }
+            for n in range(2)
+        ]
+        nodes += [deployment, replica_set, *pods]
+    return {"nodes": nodes}
+
+
+def _retained(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by `build` once its result is the only thing kept."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=3000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import ApplicationInventory
+    from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.resource_graph import ResourceGraph
+
+    fleet = make_fleet(args.apps)
+    fleet_body = json.dumps({"items": fleet}).encode()
+    tree_bodies = [json.dumps(make_tree(app)).encode() for app in fleet]
+    del fleet
+
+    def inventory(compact: bool) -> ApplicationInventory:
+        store = ApplicationInventory(compact=compact)
+        store.replace(json.loads(fleet_body)["items"], "1")
+        return store
+
+    def trees(compact: bool) -> List[Any]:
+        if compact:
+            return [ResourceGraph(json.loads(body)["nodes"]) for body in tree_bodies]
+        return [json.loads(body)["nodes"] for body in tree_bodies]
+
+    node_count = sum(len(json.loads(body)["nodes"]) for body in tree_bodies)
+    print(f"{args.apps} applications, {len(fleet_body) / 1e6:.1f} MB list body, {node_count} resource tree nodes")
+    print(f"{'store':<36} {'raw dicts':>12} {'compact':>12} {'saved':>8}")
+    rows = [
+        ("inventory (with indexes)", lambda compact: inventory(compact)),
+        ("resource trees (raw list vs graph)", lambda compact: trees(compact)),
+    ]
+    for label, build in rows:
+        raw = _retained(lambda: build(False))
+        compact = _retained(lambda: build(True))
+        print(f"{label:<36} {raw / 1e6:10.1f}MB {compact / 1e6:10.1f}MB {1 - compact / raw:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
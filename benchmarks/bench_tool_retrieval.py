@@ -0,0 +1,115 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Prompt tokens spent on tool schemas per LLM turn, all tools vs retrieved tools.
+
+Loads the real MCP tool set from an in-process server, then for a set of sample
+queries compares the size of the bound tool schemas with and without
+`ToolIndex` selection, and checks that the tool a query needs is selected.
+Tokens are counted with tiktoken (cl100k_base) when it is installed, otherwise
+estimated as characters / 4.
+
+Usage:
+    python benchmarks/bench_tool_retrieval.py [--top-k 12]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.environ.setdefault("ARGOCD_API_URL", "http://127.0.0.1:1")
+os.environ.setdefault("ARGOCD_TOKEN", "benchmark-token")
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+from langchain_core.utils.function_calling import convert_to_openai_tool  # noqa: E402
+from langchain_mcp_adapters.tools import load_mcp_tools  # noqa: E402
+
+from agent_argocd.mcp_session import PersistentMCPSession  # noqa: E402
+from agent_argocd.tool_retrieval import ToolIndex  # noqa: E402
+
+# Sample query -> the tool it needs
+QUERIES = {
+  "list all applications": "application_service__list",
+  "sync the guestbook app": "application_service__sync",
+  "show pod logs for frontend": "application_service__pod_logs",
+  "which clusters are registered?": "cluster_service__list",
+  "add a git repository": "repository_service__create_repository",
+  "what version of argocd is running": "version_service__version",
+  "delete project team-a": "project_service__delete",
+  "rollback backend to previous revision": "application_service__rollback",
+  "show unhealthy apps in project payments": "application_service__query",
+  "get details of the guestbook application": "application_service__get",
+  "what resources does guestbook deploy": "application_service__resource_tree",
+  "list gpg keys": "gpg_key_service__list",
+  "who am i logged in as": "session_service__get_user_info",
+  "list applicationsets": "application_set_service__list",
+  "show the events for app guestbook": "application_service__list_resource_events",
+  "create a project named team-b": "project_service__create",
+  "is the frontend app healthy": "application_service__get",
+  "refresh cluster cache for prod": "cluster_service__invalidate_cache",
+  "sync all apps in project payments": "application_service__sync_many",
+  "compare health and revision of apps frontend, backend and worker": "application_service__get_many",
+  "how many apps are degraded per cluster": "application_service__aggregate",
+  "show error logs from all pods of the checkout deployment": "application_service__pod_logs_many",
+  "which pods belong to the checkout deployment": "application_service__resource_subtree",
+  "which deployment owns pod web-7d9f-abc": "application_service__resource_ancestry",
+  "why is the guestbook app degraded": "application_service__unhealthy_resources",
+}
+
+
+def _token_counter():
+  try:
+    import tiktoken
+  except ImportError:
+    return lambda text: len(text) // 4, "estimated (chars / 4)"
+  encoding = tiktoken.get_encoding("cl100k_base")
+  return lambda text: len(encoding.encode(text)), "tiktoken cl100k_base"
+
+
+async def _load_tools():
+  session = PersistentMCPSession(connection=None)
+  try:
+    return await load_mcp_tools(session)
+  finally:
+    await session.close()
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--top-k", type=int, default=12)
+  args = parser.parse_args()
+  logging.disable(logging.CRITICAL)
+
+  tools = asyncio.run(_load_tools())
+  count, method = _token_counter()
+  schema_tokens = {tool.name: count(json.dumps(convert_to_openai_tool(tool))) for tool in tools}
+  full = sum(schema_tokens.values())
+  index = ToolIndex(tools)
+
+  selected_tokens, hits = [], 0
+  print(f"{'query':<45} {'tools':>5} {'tokens':>7}  hit")
+  for query, expected in QUERIES.items():
+    selected = index.select([HumanMessage(content=query)], k=args.top_k)
+    tokens = sum(schema_tokens[tool.name] for tool in selected)
+    hit = expected in {tool.name for tool in selected}
+    hits += hit
+    selected_tokens.append(tokens)
+    print(f"{query:<45} {len(selected):>5} {tokens:>7}  {'yes' if hit else 'NO'}")
+
+  mean = statistics.mean(selected_tokens)
+  print()
+  print(f"Token counting: {method}")
+  print(f"All {len(tools)} tools: {full} tokens per LLM turn")
+  print(f"Retrieved (top-k={args.top_k}): {mean:.0f} tokens on average, {1 - mean / full:.0%} fewer")
+  print(f"Needed tool selected for {hits}/{len(QUERIES)} queries")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,133 @@
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Local stand-in for the ArgoCD API server used by the benchmarks.
+
+Serves a synthetic fleet of applications over HTTP/1.1 with keep-alive so that
+client-side costs (connection setup, decoding, caching) can be measured without
+a real cluster.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+PROJECTS = ["default", "jarvis-agent-dev", "platform", "payments", "search"]
+HEALTH = ["Healthy", "Healthy", "Healthy", "Progressing", "Degraded", "Missing"]
+SYNC = ["Synced", "Synced", "OutOfSync"]
+CLUSTERS = ["https://kubernetes.default.svc", "https://prod-east.example.com", "https://prod-west.example.com"]
+
+
+def make_application(i: int) -> Dict[str, Any]:
+    """Build one synthetic ArgoCD Application resembling a real API payload."""
+    name = f"app-{i:05d}"
+    project = PROJECTS[i % len(PROJECTS)]
+    namespace = f"ns-{i % 40}"
+    resources = [
+        {
+            "group": "apps",
+            "version": "v1",
+            "kind": "Deployment",
+            "namespace": namespace,
+            "name": f"{name}-{n}",
+            "status": SYNC[(i + n) % len(SYNC)],
+            "health": {"status": HEALTH[(i + n) % len(HEALTH)]},
+        }
+        for n in range(8)
+    ]
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "argocd",
+            "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "resourceVersion": str(1000 + i),
+            "labels": {"team": f"team-{i % 12}", "tier": ["frontend", "backend", "data"][i % 3]},
+            "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{" + "x" * 512 + "}"},
+            "managedFields": [{"manager": "argocd-server", "operation": "Update", "fieldsV1": {"f:spec": {"f:source": {}}}}],
+        },
+        "spec": {
+            "project": project,
+            "source": {"repoURL": f"https://github.com/example/repo-{i % 25}.git", "path": name, "targetRevision": "HEAD"},
+            "destination": {"server": CLUSTERS[i % len(CLUSTERS)], "namespace": namespace},
+        },
+        "status": {
+            "resources": resources,
+            "sync": {"status": SYNC[i % len(SYNC)], "revision": f"{i:040x}"},
+            "health": {"status": HEALTH[i % len(HEALTH)]},
+            "operationState": {"phase": ["Succeeded", "Running", "Failed"][i % 3]},
+        },
+    }
+
+
+def make_fleet(count: int) -> List[Dict[str, Any]]:
+    """Build a synthetic fleet of `count` applications."""
+    return [make_application(i) for i in range(count)]
+
+
+class FakeArgoCD:
+    """Threaded HTTP server that answers a small subset of the ArgoCD REST API."""
+
+    def __init__(self, app_count: int = 100, host: str = "127.0.0.1", port: int = 0):
+        self.apps = {app["metadata"]["name"]: app for app in make_fleet(app_count)}
+        self.request_count = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeArgoCD":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeArgoCD":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                fake.request_count += 1
+                path = urlparse(self.path).path
+                if path == "/api/version":
+                    self._send_json(200, {"Version": "v2.14.0+fake"})
+                elif path == "/api/v1/applications":
+                    self._send_json(200, {"metadata": {"resourceVersion": "1"}, "items": list(fake.apps.values())})
+                elif path.startswith("/api/v1/applications/"):
+                    name = path.rsplit("/", 1)[-1]
+                    if name in fake.apps:
+                        self._send_json(200, fake.apps[name])
+                    else:
+                        self._send_json(404, {"error": f"applications.argoproj.io \"{name}\" not found", "code": 5})
+                else:
+                    self._send_json(404, {"error": "not found", "code": 5})
+
+        return Handler
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from agent_argocd.protocol_bindings.a2a_server.admission import AdmissionController, AdmissionRejected
+
+
+@pytest.mark.asyncio
+async def test_global_cap_queues_in_order_and_hands_over_slots():
+  admission = AdmissionController(max_concurrent=2, max_per_context=5, max_queued=5, queue_timeout=5)
+  release = asyncio.Event()
+  order = []
+
+  async def run(name):
+    async with admission.admit(name):
+      order.append(name)
+      await release.wait()
+
+  tasks = [asyncio.create_task(run(f"c{i}")) for i in range(4)]
+  await asyncio.sleep(0.01)
+  assert (admission.running, admission.queued) == (2, 2)
+  assert order == ["c0", "c1"]
+
+  release.set()
+  await asyncio.gather(*tasks)
+  assert order == ["c0", "c1", "c2", "c3"]
+  metrics = admission.metrics()
+  assert (metrics["running"], metrics["queued"], metrics["contexts"]) == (0, 0, 0)
+  assert (metrics["admitted"], metrics["queued_total"], metrics["completed"]) == (4, 2, 4)
+
+
+@pytest.mark.asyncio
+async def test_rejections_are_immediate():
+  admission = AdmissionController(max_concurrent=1, max_per_context=1, max_queued=1, queue_timeout=5)
+  await admission.acquire("a")
+  with pytest.raises(AdmissionRejected) as rejected:
+    await admission.acquire("a")
+  assert rejected.value.reason == "context_limit"
+
+  waiting = asyncio.create_task(admission.acquire("b"))
+  await asyncio.sleep(0)
+  with pytest.raises(AdmissionRejected) as rejected:
+    await admission.acquire("c")
+  assert rejected.value.reason == "queue_full"
+
+  admission.release("a")
+  await waiting
+  admission.release("b")
+  assert admission.metrics()["rejected"] == {"context_limit": 1, "queue_full": 1}
+  assert admission.running == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_and_cancel_leave_no_slot_behind():
+  admission = AdmissionController(max_concurrent=1, max_per_context=5, max_queued=5, queue_timeout=0.01)
+  await admission.acquire("a")
+  with pytest.raises(AdmissionRejected) as rejected:
+    await admission.acquire("b")
+  assert rejected.value.reason == "queue_timeout"
+
+  admission.queue_timeout = 5
+  waiting = asyncio.create_task(admission.acquire("c"))
+  await asyncio.sleep(0)
+  waiting.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await waiting
+  assert admission.queued == 0
+
+  admission.release("a")
+  assert admission.running == 0
+  await admission.acquire("d")
+  assert admission.running == 1
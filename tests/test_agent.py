@@ -1,8 +1,14 @@
 import types
+from typing import Annotated, Any, TypedDict
+
 import pytest
 from unittest import mock
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
 from agent_argocd.agent import ArgoCDAgent, ResponseFormat
 from agent_argocd import agent
+from agent_argocd.checkpointer import create_checkpointer
 
 @pytest.fixture(autouse=True)
 def set_env_vars(monkeypatch):
@@ -38,49 +44,124 @@ def test_supported_content_types():
   assert 'text' in ArgoCDAgent.SUPPORTED_CONTENT_TYPES
   assert 'text/plain' in ArgoCDAgent.SUPPORTED_CONTENT_TYPES
 
-def test_get_agent_response_completed(monkeypatch):
+@pytest.mark.asyncio
+async def test_get_agent_response_completed(monkeypatch):
   agent = ArgoCDAgent.__new__(ArgoCDAgent)
   mock_graph = mock.Mock()
   mock_config = mock.Mock()
   resp = ResponseFormat(status="completed", message="Done")
-  mock_graph.get_state.return_value = types.SimpleNamespace(values={'structured_response': resp})
+  mock_graph.aget_state = mock.AsyncMock(return_value=types.SimpleNamespace(values={'structured_response': resp}))
   agent.graph = mock_graph
-  result = agent.get_agent_response(mock_config)
+  result = await agent.get_agent_response(mock_config)
   assert result['is_task_complete'] is True
   assert result['require_user_input'] is False
   assert result['content'] == "Done"
 
-def test_get_agent_response_input_required(monkeypatch):
+@pytest.mark.asyncio
+async def test_get_agent_response_input_required(monkeypatch):
   agent = ArgoCDAgent.__new__(ArgoCDAgent)
   mock_graph = mock.Mock()
   mock_config = mock.Mock()
   resp = ResponseFormat(status="input_required", message="Need input")
-  mock_graph.get_state.return_value = types.SimpleNamespace(values={'structured_response': resp})
+  mock_graph.aget_state = mock.AsyncMock(return_value=types.SimpleNamespace(values={'structured_response': resp}))
   agent.graph = mock_graph
-  result = agent.get_agent_response(mock_config)
+  result = await agent.get_agent_response(mock_config)
   assert result['is_task_complete'] is False
   assert result['require_user_input'] is True
   assert result['content'] == "Need input"
 
-def test_get_agent_response_error(monkeypatch):
+@pytest.mark.asyncio
+async def test_get_agent_response_error(monkeypatch):
   agent = ArgoCDAgent.__new__(ArgoCDAgent)
   mock_graph = mock.Mock()
   mock_config = mock.Mock()
   resp = ResponseFormat(status="error", message="Error occurred")
-  mock_graph.get_state.return_value = types.SimpleNamespace(values={'structured_response': resp})
+  mock_graph.aget_state = mock.AsyncMock(return_value=types.SimpleNamespace(values={'structured_response': resp}))
   agent.graph = mock_graph
-  result = agent.get_agent_response(mock_config)
+  result = await agent.get_agent_response(mock_config)
   assert result['is_task_complete'] is False
   assert result['require_user_input'] is True
   assert result['content'] == "Error occurred"
 
-def test_get_agent_response_no_structured(monkeypatch):
+@pytest.mark.asyncio
+async def test_get_agent_response_no_structured(monkeypatch):
   agent = ArgoCDAgent.__new__(ArgoCDAgent)
   mock_graph = mock.Mock()
   mock_config = mock.Mock()
-  mock_graph.get_state.return_value = types.SimpleNamespace(values={})
+  mock_graph.aget_state = mock.AsyncMock(return_value=types.SimpleNamespace(values={}))
   agent.graph = mock_graph
-  result = agent.get_agent_response(mock_config)
+  result = await agent.get_agent_response(mock_config)
   assert result['is_task_complete'] is False
   assert result['require_user_input'] is True
-  assert "unable to process" in result['content'].lower()
\ No newline at end of file
+  assert "unable to process" in result['content'].lower()
+
+class ReplyState(TypedDict):
+  messages: Annotated[list, add_messages]
+  structured_response: Any
+
+@pytest.mark.asyncio
+async def test_stream_with_sqlite_checkpointer(tmp_path):
+  pytest.importorskip("langgraph.checkpoint.sqlite")
+  saver = await create_checkpointer("sqlite", str(tmp_path / "checkpoints.sqlite"))
+  builder = StateGraph(ReplyState)
+  builder.add_node("reply", lambda state: {"messages": [AIMessage(content="Done")], "structured_response": ResponseFormat(status="completed", message="Done")})
+  builder.add_edge(START, "reply")
+  builder.add_edge("reply", END)
+  argocd_agent = ArgoCDAgent.__new__(ArgoCDAgent)
+  argocd_agent.graph = builder.compile(checkpointer=saver)
+  try:
+    events = [event async for event in argocd_agent.stream("list apps", "ctx-1")]
+  finally:
+    await saver.aclose()
+  assert events[-1] == {'is_task_complete': True, 'require_user_input': False, 'content': "Done"}
+  assert saver.metrics()['threads'] == 1
+
+def test_tool_set_hash_is_order_independent():
+  a = types.SimpleNamespace(name="a", description="A", args_schema={"properties": {}})
+  b = types.SimpleNamespace(name="b", description="B", args_schema={"properties": {"x": {}}})
+  assert agent.tool_set_hash([a, b]) == agent.tool_set_hash([b, a])
+  changed = types.SimpleNamespace(name="b", description="B2", args_schema={"properties": {"x": {}}})
+  assert agent.tool_set_hash([a, b]) != agent.tool_set_hash([a, changed])
+
+def test_describe_tools_lists_parameters_and_defaults():
+  tool = types.SimpleNamespace(name="get_app", description="Get an app.\nMore detail.", args_schema={"properties": {"name": {"type": "string", "title": "Name"}, "limit": {"type": "integer", "default": 10}}})
+  bare = types.SimpleNamespace(name="version", description="Version.", args_schema={})
+  assert agent.describe_tools([tool, bare]).splitlines() == [
+    "Tool: get_app",
+    "  Description: Get an app.",
+    "  Parameters:",
+    "    - name (string): Name",
+    "    - limit (integer): limit [default: 10]",
+    "Tool: version",
+    "  Description: Version.",
+    "  Parameters: None",
+  ]
+
+@pytest.mark.asyncio
+async def test_warm_up_calls_llm_once_per_tool_set(tmp_path, monkeypatch):
+  monkeypatch.setattr(agent, "CAPABILITIES_CACHE_PATH", str(tmp_path / "capabilities.json"))
+  calls = []
+
+  async def summarize():
+    calls.append(1)
+    return "I manage ArgoCD applications."
+
+  for expected_source in ("generated", "cached"):
+    argocd_agent = ArgoCDAgent.__new__(ArgoCDAgent)
+    argocd_agent.graph = mock.Mock()
+    argocd_agent.tools_hash = "abc"
+    argocd_agent._summarize_capabilities = summarize
+    assert await argocd_agent.warm_up() == "I manage ArgoCD applications."
+    assert argocd_agent.capabilities_source == expected_source
+  assert len(calls) == 1
+
+def test_readiness_reports_init_error():
+  argocd_agent = ArgoCDAgent.__new__(ArgoCDAgent)
+  argocd_agent.graph = None
+  argocd_agent.tool_count = 0
+  argocd_agent.tools_hash = None
+  argocd_agent.capabilities_source = None
+  argocd_agent.init_error = "ARGOCD_TOKEN must be set"
+  status = argocd_agent.readiness()
+  assert status['ready'] is False
+  assert status['error'] == "ARGOCD_TOKEN must be set"
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events.event_queue import EventQueue
+from a2a.types import AgentCapabilities, AgentCard, Message, MessageSendParams, Part, Role, TaskState, TextPart
+from a2a.utils.errors import ServerError
+from starlette.testclient import TestClient
+
+from agent_argocd.protocol_bindings.a2a_server.admission import AdmissionController
+from agent_argocd.protocol_bindings.a2a_server.agent_executor import ArgoCDAgentExecutor
+from agent_argocd.protocol_bindings.a2a_server.app import build_app
+
+
+class SlowAgent:
+  def __init__(self):
+    self.started = asyncio.Event()
+    self.cancelled = 0
+
+  async def stream(self, query, context_id):
+    self.started.set()
+    try:
+      await asyncio.sleep(60)
+    except asyncio.CancelledError:
+      self.cancelled += 1
+      raise
+    yield {"is_task_complete": True, "require_user_input": False, "content": "done"}
+
+
+def _context(context_id="ctx"):
+  message = Message(role=Role.user, parts=[Part(root=TextPart(text="sync guestbook"))], messageId="m1", contextId=context_id)
+  return RequestContext(request=MessageSendParams(message=message))
+
+
+def _drain(queue):
+  events = []
+  while not queue.queue.empty():
+    events.append(queue.queue.get_nowait())
+  return events
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_the_run_and_frees_its_slot():
+  agent = SlowAgent()
+  admission = AdmissionController(max_concurrent=1)
+  executor = ArgoCDAgentExecutor(admission=admission, agent=agent)
+  queue = EventQueue()
+  context = _context()
+
+  execution = asyncio.create_task(executor.execute(context, queue))
+  await asyncio.wait_for(agent.started.wait(), 5)
+  assert admission.running == 1
+  task = _drain(queue)[0]
+
+  await executor.cancel(RequestContext(None, task_id=task.id, context_id=task.contextId, task=task), queue)
+  await execution
+  assert agent.cancelled == 1
+  assert admission.running == 0
+  assert [event.status.state for event in _drain(queue)] == [TaskState.canceled]
+  assert executor.canceled == 1
+
+  with pytest.raises(ServerError):
+    await executor.cancel(RequestContext(None, task_id=task.id, context_id=task.contextId, task=task), queue)
+
+
+@pytest.mark.asyncio
+async def test_cancel_while_queued_for_admission():
+  agent = SlowAgent()
+  admission = AdmissionController(max_concurrent=1)
+  executor = ArgoCDAgentExecutor(admission=admission, agent=agent)
+  running, waiting = EventQueue(), EventQueue()
+
+  first = asyncio.create_task(executor.execute(_context("a"), running))
+  await asyncio.wait_for(agent.started.wait(), 5)
+  second = asyncio.create_task(executor.execute(_context("b"), waiting))
+  await asyncio.sleep(0.01)
+  assert admission.queued == 1
+
+  task = _drain(waiting)[0]
+  await executor.cancel(RequestContext(None, task_id=task.id, context_id=task.contextId, task=task), waiting)
+  await second
+  assert admission.queued == 0 and admission.running == 1
+  assert [event.status.state for event in _drain(waiting)] == [TaskState.canceled]
+
+  first.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await first
+  assert admission.running == 0
+
+
+class LifecycleAgent:
+  def __init__(self):
+    self.ready = asyncio.Event()
+    self.closed = 0
+
+  async def start(self):
+    self.ready.set()
+
+  def readiness(self):
+    return {"ready": self.ready.is_set()}
+
+  def metrics(self):
+    return {"mcp_reconnects": 0}
+
+  async def close(self):
+    self.closed += 1
+
+
+def test_app_starts_and_closes_the_agent():
+  agent = LifecycleAgent()
+  card = AgentCard(name="ArgoCD", description="", url="http://localhost/", version="1.0.0", defaultInputModes=["text"], defaultOutputModes=["text"], capabilities=AgentCapabilities(), skills=[])
+  app = build_app(card, ArgoCDAgentExecutor(agent=agent))
+
+  with TestClient(app) as client:
+    assert client.get("/ready").json() == {"ready": True}
+    metrics = client.get("/metrics").json()
+    assert metrics["mcp_reconnects"] == 0 and metrics["canceled_tasks"] == 0
+    assert client.get("/.well-known/agent.json").json()["name"] == "ArgoCD"
+  assert agent.closed == 1
@@ -0,0 +1,53 @@
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_aggregate as agg  # noqa: E402
+
+
+def _app(name, project, health, sync="Synced", phase="Succeeded", cluster="in-cluster"):
+  return {
+    "metadata": {"name": name},
+    "spec": {"project": project, "destination": {"name": cluster, "namespace": "default"}},
+    "status": {"health": {"status": health}, "sync": {"status": sync}, "operationState": {"phase": phase}},
+  }
+
+
+APPS = [
+  _app("a", "payments", "Healthy"),
+  _app("b", "payments", "Degraded", sync="OutOfSync"),
+  _app("c", "search", "Degraded"),
+  _app("d", "search", "Healthy", phase="Failed", cluster="prod"),
+  _app("e", "search", "Progressing"),
+  {"metadata": {"name": "f"}},
+]
+
+
+def test_aggregate_builds_matrix_totals_and_offenders():
+  result = agg.aggregate(APPS, "project", "health", top=3)
+  assert result["total"] == 6
+  assert result["header"] == ["project", "Degraded", "Healthy", "<none>", "Progressing", "total"]
+  assert result["matrix"] == [["search", 1, 1, 0, 1, 3], ["payments", 1, 1, 0, 0, 2], ["<none>", 0, 0, 1, 0, 1]]
+  assert result["totals"]["cluster"] == {"in-cluster": 4, "prod": 1, "<none>": 1}
+  assert [o["name"] for o in result["top_offenders"]] == ["b", "c", "d"]
+  assert result["top_offenders"][0]["score"] == 5
+
+
+@pytest.mark.asyncio
+async def test_aggregate_tool_requests_only_needed_fields(monkeypatch):
+  requests = []
+
+  async def fake_request(path, method="GET", token=None, params={}, data={}, timeout=30):
+    requests.append(params)
+    return True, {"items": APPS}
+
+  monkeypatch.setattr(agg, "make_api_request", fake_request)
+  monkeypatch.setattr(agg, "get_inventory", lambda: None)
+  result = await agg.application_service__aggregate(rows="cluster", columns="sync", project="payments,search")
+  assert requests[0]["fields"] == ",".join(agg.LIST_FIELDS)
+  assert requests[0]["projects"] == ["payments", "search"]
+  assert result["header"][0] == "cluster"
+  assert "error" in await agg.application_service__aggregate(rows="owner")
@@ -0,0 +1,115 @@
+import asyncio
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_bulk_sync as bulk  # noqa: E402
+
+
+def _app(name, project, labels=None):
+  return {"metadata": {"name": name, "namespace": "argocd", "labels": labels or {}}, "spec": {"project": project}, "status": {}}
+
+
+APPS = [_app("payments-api", "payments", {"tier": "backend"}), _app("payments-web", "payments", {"tier": "frontend"}), _app("search-api", "search")]
+
+
+class FakeContext:
+  def __init__(self):
+    self.progress = []
+
+  async def report_progress(self, progress, total=None, message=None):
+    self.progress.append((progress, total, message))
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+  state = {"failures": {}, "in_flight": 0, "max_in_flight": 0, "syncs": [], "reads": [], "operations": {}}
+
+  async def fake_request(path, method="GET", token=None, params={}, data={}, timeout=30):
+    if method == "GET" and path == "/api/v1/applications":
+      return True, {"metadata": {}, "items": APPS}
+    if method == "GET":
+      name = path.rsplit("/", 1)[1]
+      state["reads"].append(name)
+      return True, {"metadata": {"name": name}, "status": {"operationState": state["operations"].get(name)}}
+    state["in_flight"] += 1
+    state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+    await asyncio.sleep(0.01)
+    state["in_flight"] -= 1
+    state["syncs"].append(data["name"])
+    remaining = state["failures"].get(data["name"], [])
+    if remaining:
+      failure = remaining.pop(0)
+      return False, failure if isinstance(failure, dict) else {"error": failure}
+    return True, {"operation": {"sync": {"revision": data.get("revision", "abc")}}}
+
+  monkeypatch.setattr(bulk, "make_api_request", fake_request)
+  monkeypatch.setattr(bulk, "get_inventory", lambda: None)
+  monkeypatch.setattr(bulk, "RETRY_BACKOFF", 0)
+  return state
+
+
+@pytest.mark.asyncio
+async def test_selector_combines_project_glob_and_labels(fake_api):
+  apps, error = await bulk.select_applications(project="payments", name_glob="*-api")
+  assert error is None and apps == [("argocd", "payments-api")]
+  apps, _ = await bulk.select_applications(label_selector="tier=frontend")
+  assert apps == [("argocd", "payments-web")]
+  apps, _ = await bulk.select_applications(names=["b", "a", "a"])
+  assert apps == [("", "a"), ("", "b")]
+
+
+@pytest.mark.asyncio
+async def test_sync_many_retries_transient_failures_and_reports_progress(fake_api):
+  fake_api["failures"] = {"payments-api": ["API request failed: 503"], "search-api": ["API request failed: 403 - permission denied"]}
+  ctx = FakeContext()
+  result = await bulk.application_service__sync_many(names=["payments-api", "payments-web", "search-api"], concurrency=2, revision="v2", ctx=ctx)
+
+  assert (result["total"], result["started"], result["failed"]) == (3, 2, 1)
+  rows = {row[0]: dict(zip(result["columns"], row)) for row in result["rows"]}
+  assert rows["payments-api"]["attempts"] == 2 and rows["payments-api"]["revision"] == "v2"
+  assert rows["search-api"]["attempts"] == 1 and "403" in rows["search-api"]["error"]
+  assert fake_api["max_in_flight"] <= 2
+  assert [p[0] for p in ctx.progress] == [1, 2, 3] and all(p[1] == 3 for p in ctx.progress)
+
+
+@pytest.mark.asyncio
+async def test_sync_many_requires_a_selector_and_respects_max_apps(fake_api):
+  assert "error" in await bulk.application_service__sync_many()
+  result = await bulk.application_service__sync_many(project="payments,search", max_apps=2)
+  assert result["matched"] == 3 and not fake_api["syncs"]
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_is_not_resent_once_an_operation_started(fake_api):
+  started_at = bulk.datetime.now(bulk.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+  fake_api["failures"] = {"payments-api": ["Request timed out after 30 seconds"], "payments-web": ["API request failed: 503"]}
+  fake_api["operations"] = {
+    "payments-api": {"phase": "Running", "startedAt": started_at, "operation": {"sync": {"revision": "v2"}}},
+    "payments-web": {"phase": "Succeeded", "startedAt": "2020-01-01T00:00:00Z"},
+  }
+  result = await bulk.application_service__sync_many(names=["payments-api", "payments-web"], revision="v2")
+
+  rows = {row[0]: dict(zip(result["columns"], row)) for row in result["rows"]}
+  assert rows["payments-api"]["result"] == "started" and rows["payments-api"]["attempts"] == 1 and rows["payments-api"]["revision"] == "v2"
+  # An operation older than the first attempt is not ours, so the sync is sent again
+  assert rows["payments-web"]["result"] == "started" and rows["payments-web"]["attempts"] == 2
+  assert sorted(fake_api["syncs"]) == ["payments-api", "payments-web", "payments-web"]
+  assert sorted(fake_api["reads"]) == ["payments-api", "payments-web"]
+
+
+@pytest.mark.asyncio
+async def test_unsent_syncs_are_resent_and_conflicts_are_not(fake_api):
+  fake_api["failures"] = {
+    "payments-api": [{"error": "Connection error: refused", "request_sent": False}],
+    "payments-web": ["API request failed: 409 - another operation is already in progress"],
+  }
+  result = await bulk.application_service__sync_many(names=["payments-api", "payments-web"])
+
+  rows = {row[0]: dict(zip(result["columns"], row)) for row in result["rows"]}
+  assert rows["payments-api"]["result"] == "started" and rows["payments-api"]["attempts"] == 2
+  assert rows["payments-web"]["result"] == "failed" and rows["payments-web"]["attempts"] == 1
+  assert fake_api["reads"] == []
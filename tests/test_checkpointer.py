@@ -0,0 +1,121 @@
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from agent_argocd.checkpointer import BoundedMemorySaver, create_checkpointer
+
+
+class State(TypedDict):
+  messages: Annotated[list, operator.add]
+
+
+def build_graph(saver):
+  builder = StateGraph(State)
+  builder.add_node("reply", lambda state: {"messages": ["x" * 1000]})
+  builder.add_edge(START, "reply")
+  builder.add_edge("reply", END)
+  return builder.compile(checkpointer=saver)
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+def config(thread_id):
+  return {"configurable": {"thread_id": thread_id}}
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_threads_are_evicted():
+  saver = BoundedMemorySaver(max_threads=2, ttl_seconds=None, thread_max_bytes=None)
+  graph = build_graph(saver)
+  for thread_id in ("a", "b"):
+    await graph.ainvoke({"messages": ["hi"]}, config(thread_id))
+  # Reading "a" makes "b" the least recently used thread
+  assert graph.get_state(config("a")).values["messages"]
+  await graph.ainvoke({"messages": ["hi"]}, config("c"))
+
+  assert set(saver.storage) == {"a", "c"}
+  assert not any(key[0] == "b" for key in saver.blobs)
+  metrics = saver.metrics()
+  assert metrics["threads"] == 2
+  assert metrics["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_threads_expire():
+  clock = FakeClock()
+  saver = BoundedMemorySaver(max_threads=10, ttl_seconds=60, thread_max_bytes=None, clock=clock)
+  graph = build_graph(saver)
+  await graph.ainvoke({"messages": ["hi"]}, config("old"))
+  clock.now = 120
+  await graph.ainvoke({"messages": ["hi"]}, config("new"))
+
+  assert set(saver.storage) == {"new"}
+  assert saver.metrics()["expirations"] == 1
+  assert graph.get_state(config("old")).values == {}
+
+
+@pytest.mark.asyncio
+async def test_thread_over_budget_keeps_only_latest_checkpoint():
+  saver = BoundedMemorySaver(max_threads=10, ttl_seconds=None, thread_max_bytes=8_000)
+  graph = build_graph(saver)
+  for _ in range(10):
+    await graph.ainvoke({"messages": ["hi"]}, config("t"))
+
+  # The conversation survives pruning, only the history of checkpoints is dropped
+  assert len(graph.get_state(config("t")).values["messages"]) == 20
+  assert len(list(saver.list(config("t")))) < 10
+  assert saver.metrics()["prunes"] > 0
+  assert saver.metrics()["bytes"] < 40_000
+
+  unbounded = BoundedMemorySaver(max_threads=10, ttl_seconds=None, thread_max_bytes=None)
+  unbounded_graph = build_graph(unbounded)
+  for _ in range(10):
+    await unbounded_graph.ainvoke({"messages": ["hi"]}, config("t"))
+  assert unbounded.metrics()["bytes"] > saver.metrics()["bytes"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_backend_is_rejected():
+  with pytest.raises(ValueError):
+    await create_checkpointer("redis")
+  assert isinstance(await create_checkpointer("memory"), BoundedMemorySaver)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_threads_are_evicted_and_expire(tmp_path):
+  pytest.importorskip("langgraph.checkpoint.sqlite")
+  import aiosqlite
+  from agent_argocd.sqlite_checkpointer import BoundedSqliteSaver
+
+  clock = FakeClock()
+  saver = BoundedSqliteSaver(await aiosqlite.connect(str(tmp_path / "checkpoints.sqlite")), max_threads=2, ttl_seconds=60, clock=clock)
+  graph = build_graph(saver)
+  try:
+    for thread_id in ("a", "b"):
+      await graph.ainvoke({"messages": ["hi"]}, config(thread_id))
+    assert (await graph.aget_state(config("a"))).values["messages"]
+    await graph.ainvoke({"messages": ["hi"]}, config("c"))
+    assert (await graph.aget_state(config("b"))).values == {}
+    assert saver.metrics() == {"backend": "sqlite", "threads": 2, "evictions": 1, "expirations": 0}
+
+    clock.now = 120
+    await graph.ainvoke({"messages": ["hi"]}, config("d"))
+    assert (await graph.aget_state(config("a"))).values == {}
+    assert saver.metrics()["threads"] == 1 and saver.metrics()["expirations"] == 2
+  finally:
+    await saver.aclose()
+
+  # Threads already on disk are tracked again after a restart
+  saver = await create_checkpointer("sqlite", str(tmp_path / "checkpoints.sqlite"))
+  try:
+    assert saver.metrics()["threads"] == 1
+  finally:
+    await saver.aclose()
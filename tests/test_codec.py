@@ -0,0 +1,24 @@
+import importlib.util
+
+import pytest
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils import codec
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_backends_round_trip_and_raise_value_error(backend):
+  if backend != "json" and importlib.util.find_spec(backend) is None:
+    pytest.skip(f"{backend} is not installed")
+  loads, dumps = codec.BACKENDS[backend]()
+  value = {"metadata": {"name": "guestbook", "labels": {"tier": "ünïcode"}}, "items": [1, 2.5, None, True]}
+  assert loads(dumps(value)) == value
+  assert loads(dumps(value).decode()) == value
+  with pytest.raises(ValueError):
+    loads(b'{"truncated": ')
+
+
+def test_select_backend_falls_back_to_json(monkeypatch):
+  monkeypatch.setattr(codec.importlib.util, "find_spec", lambda name: None)
+  assert codec.select_backend("auto") == "json"
+  assert codec.select_backend("orjson") == "json"
+  assert codec.select_backend("unknown") == "json"
@@ -0,0 +1,103 @@
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store import content_cache as cache_module  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.content_cache import ContentCache, content_key, is_pinned_revision  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import api_v1_applications_name_manifests as manifests_tool  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import api_v1_applications_name_revisions_revision_metadata as metadata_tool  # noqa: E402
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+def test_only_pinned_revisions_are_cacheable():
+  assert is_pinned_revision(SHA)
+  assert not is_pinned_revision("main")
+  assert not is_pinned_revision("HEAD")
+  assert not is_pinned_revision("1.2.3")
+  assert is_pinned_revision("1.2.3", allow_chart_version=True)
+  assert content_key("metadata", "app", "main") is None
+  assert content_key("manifests", "app", [SHA, "main"]) is None
+  assert content_key("metadata", "app", SHA, None, 0) == ("metadata", "app", (SHA,), None, 0)
+
+
+def test_memory_tier_evicts_least_recently_used_entries():
+  cache = ContentCache(max_bytes=40, directory=None)
+  cache.put(("a",), {"v": "x" * 10})
+  cache.put(("b",), {"v": "y" * 10})
+  assert cache.get(("a",)) is not None
+  cache.put(("c",), {"v": "z" * 10})
+
+  assert cache.get(("b",)) is None
+  assert cache.get(("a",)) == {"v": "x" * 10}
+  assert cache.bytes <= 40
+  assert cache.stats["evictions"] == 1
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+  first = ContentCache(max_bytes=1024, directory=str(tmp_path))
+  first.put(("metadata", "app", SHA), {"author": "dev"})
+
+  second = ContentCache(max_bytes=1024, directory=str(tmp_path))
+  assert second.get(("metadata", "app", SHA)) == {"author": "dev"}
+  assert second.stats["disk_hits"] == 1
+  assert second.get(("metadata", "app", SHA)) == {"author": "dev"}
+  assert second.stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_revision_metadata_is_fetched_once_per_commit(monkeypatch):
+  calls = []
+
+  async def fake_request(path, method="GET", token=None, params={}, data={}, timeout=30):
+    calls.append(path)
+    return True, {"author": "dev", "message": "fix"}
+
+  monkeypatch.setattr(metadata_tool, "make_api_request", fake_request)
+  monkeypatch.setattr(metadata_tool, "content_cache", ContentCache(directory=None))
+  monkeypatch.setattr(cache_module, "CONTENT_CACHE_ENABLED", True)
+
+  for _ in range(3):
+    assert (await metadata_tool.application_service__revision_metadata("guestbook", SHA))["author"] == "dev"
+  await metadata_tool.application_service__revision_metadata("guestbook", "main")
+  await metadata_tool.application_service__revision_metadata("guestbook", "main")
+
+  assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_manifests_are_cached_without_the_inventory(monkeypatch):
+  app = {"metadata": {"name": "guestbook"}, "spec": {"source": {"repoURL": "https://git", "targetRevision": SHA}}}
+  calls = []
+
+  async def fake_request(path, method="GET", token=None, params={}, data={}, timeout=30):
+    calls.append(path)
+    if path.endswith("/manifests"):
+      return True, {"manifests": ["kind: Service"]}
+    return True, app
+
+  monkeypatch.setattr(manifests_tool, "make_api_request", fake_request)
+  monkeypatch.setattr(manifests_tool, "get_inventory", lambda: None)
+  monkeypatch.setattr(manifests_tool, "content_cache", ContentCache(directory=None))
+  monkeypatch.setattr(cache_module, "CONTENT_CACHE_ENABLED", True)
+
+  for _ in range(2):
+    assert (await manifests_tool.application_service__get_manifests("guestbook", SHA))["manifests"]
+    # Without a revision the application renders its target revision, the same commit
+    assert (await manifests_tool.application_service__get_manifests("guestbook"))["manifests"]
+  assert calls.count("/api/v1/applications/guestbook/manifests") == 1
+
+  # A branch is never cached and costs no extra read of the application
+  calls.clear()
+  await manifests_tool.application_service__get_manifests("guestbook", "main")
+  await manifests_tool.application_service__get_manifests("guestbook", "main")
+  assert calls == ["/api/v1/applications/guestbook/manifests"] * 2
+
+  # A changed spec renders different manifests
+  calls.clear()
+  app["spec"]["source"]["path"] = "overlays/prod"
+  await manifests_tool.application_service__get_manifests("guestbook", SHA)
+  assert calls.count("/api/v1/applications/guestbook/manifests") == 1
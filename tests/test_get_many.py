@@ -0,0 +1,58 @@
+import asyncio
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import ApplicationInventory  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_get_many as get_many  # noqa: E402
+
+
+def _app(name, health):
+  return {
+    "metadata": {"name": name, "namespace": "argocd"},
+    "spec": {"project": "default"},
+    "status": {"health": {"status": health}, "sync": {"status": "Synced", "revision": f"rev-{name}"}},
+  }
+
+
+@pytest.mark.asyncio
+async def test_get_many_fetches_concurrently_and_keeps_request_order(monkeypatch):
+  state = {"in_flight": 0, "max_in_flight": 0}
+
+  async def fake_request(path, method="GET", token=None, params={}, data={}, timeout=30):
+    name = path.rsplit("/", 1)[-1]
+    state["in_flight"] += 1
+    state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+    await asyncio.sleep(0.01)
+    state["in_flight"] -= 1
+    if name == "missing":
+      return False, {"error": "API request failed: 404"}
+    return True, _app(name, "Degraded" if name == "b" else "Healthy")
+
+  monkeypatch.setattr(get_many, "make_api_request", fake_request)
+  monkeypatch.setattr(get_many, "get_inventory", lambda: None)
+  result = await get_many.application_service__get_many(["c", "b", "missing", "a", "b"], columns=["metadata.name", "status.health.status"], concurrency=2)
+
+  assert result["rows"] == [["c", "Healthy"], ["b", "Degraded"], ["missing", None], ["a", "Healthy"]]
+  assert list(result["errors"]) == ["missing"]
+  assert result["source"] == "api"
+  assert 1 < state["max_in_flight"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_from_inventory(monkeypatch):
+  inventory = ApplicationInventory()
+  inventory.replace([_app("a", "Healthy"), _app("b", "Missing")], "1")
+
+  async def fail(*args, **kwargs):
+    raise AssertionError("inventory hits must not call the API")
+
+  monkeypatch.setattr(get_many, "make_api_request", fail)
+  monkeypatch.setattr(get_many, "get_inventory", lambda: inventory)
+  result = await get_many.application_service__get_many(["b", "a"])
+  assert result["columns"] == get_many.DEFAULT_COLUMNS
+  assert result["rows"] == [["b", "default", "Missing", "Synced", "rev-b"], ["a", "default", "Healthy", "Synced", "rev-a"]]
+  assert result["source"] == "inventory"
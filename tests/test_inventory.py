@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api import client  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.indexes import parse_label_selector  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory import ApplicationInventory  # noqa: E402
+
+
+def make_app(name, project="default", namespace="argocd", labels=None, repo="https://github.com/example/repo.git", version="1", health="Healthy", sync="Synced"):
+  return {
+    "metadata": {"name": name, "namespace": namespace, "labels": labels or {}, "resourceVersion": version},
+    "spec": {"project": project, "source": {"repoURL": repo}, "destination": {"server": "https://kubernetes.default.svc", "namespace": "default"}},
+    "status": {"health": {"status": health}, "sync": {"status": sync}},
+  }
+
+
+def test_parse_label_selector():
+  assert parse_label_selector("team=a, tier!=db,owner,!legacy") == [
+    ("team", "=", "a"),
+    ("tier", "!=", "db"),
+    ("owner", "exists", None),
+    ("legacy", "!", None),
+  ]
+  assert parse_label_selector("env in (prod,staging)") is None
+
+
+def test_list_filters():
+  inventory = ApplicationInventory()
+  inventory.replace([
+    make_app("a", project="dev", labels={"team": "x"}),
+    make_app("b", project="prod", labels={"team": "y"}),
+    make_app("c", project="dev", labels={"team": "y"}, repo="https://github.com/example/other.git"),
+  ], "10")
+  names = lambda result: sorted(app["metadata"]["name"] for app in result["items"])  # noqa: E731
+  assert names(inventory.list(projects=["dev"])) == ["a", "c"]
+  assert names(inventory.list(selector="team=y")) == ["b", "c"]
+  assert names(inventory.list(projects=["dev"], repo="https://github.com/example/other.git")) == ["c"]
+  assert inventory.list(selector="team in (x)") is None
+  assert inventory.list()["metadata"]["resourceVersion"] == "10"
+
+
+def test_apply_events_and_namespaced_get():
+  inventory = ApplicationInventory()
+  inventory.replace([make_app("a")], "1")
+  inventory.apply_event({"result": {"type": "ADDED", "application": make_app("a", namespace="team-ns", version="2")}})
+  assert inventory.get("a") is None
+  assert inventory.get("a", "team-ns")["metadata"]["resourceVersion"] == "2"
+  inventory.apply_event({"result": {"type": "DELETED", "application": make_app("a", version="3")}})
+  assert inventory.get("a")["metadata"]["namespace"] == "team-ns"
+  assert inventory.resource_version == "3"
+  assert len(inventory) == 1
+
+
+def test_index_compound_query_and_updates():
+  inventory = ApplicationInventory()
+  inventory.replace([
+    make_app("a", project="jarvis-agent-dev", health="Degraded", labels={"team": "x"}),
+    make_app("b", project="jarvis-agent-dev", health="Healthy"),
+    make_app("c", project="jarvis-agent-dev", health="Missing", sync="OutOfSync"),
+    make_app("d", project="prod", health="Degraded"),
+  ], "1")
+  index = inventory.index
+  names = lambda keys: sorted(name for _, name in keys)  # noqa: E731
+  assert names(index.query({"project": "jarvis-agent-dev", "health": "!Healthy"})) == ["a", "c"]
+  assert names(index.query({"health": "Degraded,Missing", "sync": "OutOfSync"})) == ["c"]
+  assert names(index.query({}, selector="team=x")) == ["a"]
+  assert names(index.query({}, selector="!team")) == ["b", "c", "d"]
+
+  inventory.apply_event({"result": {"type": "MODIFIED", "application": make_app("a", project="jarvis-agent-dev", health="Healthy")}})
+  inventory.apply_event({"result": {"type": "DELETED", "application": make_app("c")}})
+  assert names(index.query({"project": "jarvis-agent-dev", "health": "!Healthy"})) == []
+  assert index.values("health") == {"Healthy": 2, "Degraded": 1}
+  with pytest.raises(ValueError):
+    index.query({}, selector="team in (x)")
+
+
+@pytest.mark.asyncio
+async def test_informer_lists_then_resumes_watch(monkeypatch):
+  watch_versions = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/v1/applications":
+      return httpx.Response(200, json={"metadata": {"resourceVersion": "5"}, "items": [make_app("a", version="5")]})
+    watch_versions.append(request.url.params.get("resourceVersion"))
+    event = {"result": {"type": "MODIFIED", "application": make_app("b", version=str(5 + len(watch_versions)))}}
+    return httpx.Response(200, content=(json.dumps(event) + "\n").encode())
+
+  transport = httpx.MockTransport(handler)
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=transport))
+  monkeypatch.setattr(client, "_client", None)
+  monkeypatch.setattr("agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.inventory.MIN_BACKOFF", 0)
+
+  inventory = ApplicationInventory()
+  inventory.start()
+  while len(watch_versions) < 3:
+    await asyncio.sleep(0.01)
+  await inventory.stop()
+  await client.close_client()
+
+  assert watch_versions[:3] == ["5", "6", "7"]
+  assert inventory.get("b") is not None
+  assert inventory.stats["relists"] == 1
+
+
+def test_compact_inventory_serves_queries_but_not_full_objects():
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools.application_aggregate import aggregate
+
+  inventory = ApplicationInventory(compact=True)
+  inventory.replace([
+    make_app("a", project="dev", labels={"team": "x"}, health="Degraded"),
+    make_app("b", project="prod", labels={"team": "y"}),
+  ], "10")
+
+  assert inventory.get("a") is None
+  assert inventory.list(projects=["dev"]) is None
+  assert inventory.index.query({"project": "dev"}, selector="team=x") == {("argocd", "a")}
+
+  items = inventory.list(projects=["dev"], full=False)["items"]
+  assert items == [{
+    "metadata": {"namespace": "argocd", "name": "a", "resourceVersion": "1", "labels": {"team": "x"}},
+    "spec": {"project": "dev", "destination": {"server": "https://kubernetes.default.svc", "namespace": "default"}, "source": {"repoURL": "https://github.com/example/repo.git"}},
+    "status": {"health": {"status": "Degraded"}, "sync": {"status": "Synced"}},
+  }]
+  counts = aggregate(inventory.list(full=False)["items"], "project", "health", top=1)
+  assert counts["matrix"] == [["dev", 1, 0, 1], ["prod", 0, 1, 1]]
+
+  a, b = inventory._apps[("argocd", "a")], inventory._apps[("argocd", "b")]
+  assert a.server is b.server and a.repos[0] is b.repos[0]
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api import client  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools.api_v1_applications_name_pods_podname_logs import application_service__pod_logs  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils import logs  # noqa: E402
+
+
+def _entries(lines, pod="web-1", last=True):
+  events = [{"result": {"content": line, "timeStampStr": f"2025-01-01T00:00:{i:02d}Z", "podName": pod}} for i, line in enumerate(lines)]
+  if last:
+    events.append({"result": {"content": "", "last": True}})
+  return events
+
+
+def _fake_stream(monkeypatch, events, delay=0.0):
+  async def fake_stream(path, token=None, params={}, **kwargs):
+    for event in events:
+      if delay:
+        await asyncio.sleep(delay)
+      yield event
+
+  monkeypatch.setattr(logs, "stream_api_request", fake_stream)
+
+
+def test_log_level_detection():
+  assert logs.log_level('{"level":"error","msg":"boom"}') == logs.LEVELS["error"]
+  assert logs.log_level("time=x level=WARN msg=slow") == logs.LEVELS["warn"]
+  assert logs.log_level("[INFO] started") == logs.LEVELS["info"]
+  assert logs.log_level("E0612 10:00:00.000000 1 controller.go:1] failed") == logs.LEVELS["error"]
+  assert logs.log_level("just text") is None
+
+
+def test_tail_keeps_last_lines_and_counts_duplicates():
+  tail = logs.LogTail(limit=3)
+  for content in ["a", "b", "a", "c", "d", "b"]:
+    tail.add("t", "p", content)
+  # The repeat of "a" moved it past "b", so "b" was evicted first; "a" was then evicted before "b" repeated
+  assert [(line.content, line.count) for line in tail.lines] == [("c", 1), ("d", 1), ("b", 1)]
+  assert tail.duplicates == 1 and tail.matched == 6
+  tail.add("t", "p", "a")
+  assert tail.lines[-1].content == "a" and tail.lines[-1].count == 1
+
+
+def test_tail_moves_repeated_lines_to_the_newest_end():
+  tail = logs.LogTail(limit=2)
+  for i, content in enumerate(["a", "b", "a", "c"]):
+    tail.add(f"2025-01-01T00:00:0{i}Z", "p", content)
+  assert [(line.timestamp, line.content, line.count) for line in tail.lines] == [("2025-01-01T00:00:02Z", "a", 2), ("2025-01-01T00:00:03Z", "c", 1)]
+
+  other = logs.LogTail(limit=2)
+  other.add("2025-01-01T00:00:01Z", "q", "b")
+  lines, _ = logs.merge_tails([tail, other], limit=3, max_output_bytes=10_000)
+  assert [line.content for line in lines] == ["b", "a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_tail_logs_filters_while_reading_and_stops_on_budget(monkeypatch):
+  lines = ["level=info ok", "level=error db down", "level=error db down", "level=warn slow", "level=error cache miss"]
+  _fake_stream(monkeypatch, _entries(lines))
+  success, result = await logs.tail_logs("/logs", {}, level="warn", match="db|cache")
+  assert success
+  assert result["lines"] == ["2025-01-01T00:00:02Z level=error db down [x2]", "2025-01-01T00:00:04Z level=error cache miss"]
+  assert (result["scanned"], result["matched"], result["duplicates"], result["stop_reason"]) == (5, 3, 1, "end")
+
+  _fake_stream(monkeypatch, _entries([f"line {i}" for i in range(50)], last=False))
+  _, result = await logs.tail_logs("/logs", {}, limit=2, max_lines=10)
+  assert result["stop_reason"] == "max_lines" and result["scanned"] == 10
+  assert [line.split(" ", 1)[1] for line in result["lines"]] == ["line 8", "line 9"]
+
+  _fake_stream(monkeypatch, _entries(["x" * 100] * 10, last=False))
+  _, result = await logs.tail_logs("/logs", {}, dedup=False, max_bytes=250)
+  assert result["stop_reason"] == "max_bytes" and result["scanned"] == 3
+
+  _fake_stream(monkeypatch, _entries([f"tick {i}" for i in range(100)], last=False), delay=0.01)
+  _, result = await logs.tail_logs("/logs", {}, max_duration=0.05)
+  assert result["stop_reason"] == "max_duration" and result["scanned"] < 100
+
+  assert (await logs.tail_logs("/logs", {}, match="("))[0] is False
+
+
+@pytest.mark.asyncio
+async def test_pod_logs_tool_streams_from_the_api(monkeypatch):
+  body = b"".join(json.dumps(event).encode() + b"\n" for event in _entries(["level=error a", "level=info b"]))
+  requests = []
+
+  def handler(request):
+    requests.append(request)
+    return httpx.Response(200, content=body)
+
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+  monkeypatch.setattr(client, "_client", None)
+  result = await application_service__pod_logs("guestbook", "web-1", param_tailLines="1000", level="error")
+  assert result["lines"] == ["2025-01-01T00:00:00Z level=error a"]
+  assert requests[0].url.params["tailLines"] == "1000"
+  await client.close_client()
+
+
+TREE = [
+  {"kind": "Deployment", "group": "apps", "name": "web", "namespace": "shop", "uid": "d1"},
+  {"kind": "ReplicaSet", "group": "apps", "name": "web-7f", "namespace": "shop", "uid": "r1", "parentRefs": [{"uid": "d1"}]},
+  {"kind": "Pod", "name": "web-7f-a", "namespace": "shop", "uid": "p1", "parentRefs": [{"uid": "r1"}]},
+  {"kind": "Pod", "name": "web-7f-b", "namespace": "shop", "uid": "p2", "parentRefs": [{"uid": "r1"}]},
+  {"kind": "StatefulSet", "group": "apps", "name": "db", "namespace": "shop", "uid": "s1"},
+  {"kind": "Pod", "name": "db-0", "namespace": "shop", "uid": "p3", "parentRefs": [{"uid": "s1"}]},
+]
+
+
+def test_find_pods_follows_owner_references():
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools.application_pod_logs_many import find_pods
+
+  assert [pod.name for pod in find_pods(TREE)] == ["db-0", "web-7f-a", "web-7f-b"]
+  assert [pod.name for pod in find_pods(TREE, kind="Deployment", resource_name="web")] == ["web-7f-a", "web-7f-b"]
+  assert [pod.name for pod in find_pods(TREE, pod_glob="*-b")] == ["web-7f-b"]
+
+
+def test_merge_tails_orders_by_timestamp_and_caps_output():
+  first, second = logs.LogTail(10), logs.LogTail(10)
+  first.add("2025-01-01T00:00:01.5Z", "a", "one")
+  first.add("2025-01-01T00:00:03Z", "a", "three")
+  second.add("2025-01-01T00:00:01.25Z", "b", "zero")
+  second.add("2025-01-01T00:00:02Z", "b", "two")
+  lines, truncated = logs.merge_tails([first, second], limit=10, max_output_bytes=10_000)
+  assert [line.content for line in lines] == ["zero", "one", "two", "three"] and not truncated
+
+  lines, truncated = logs.merge_tails([first, second], limit=3, max_output_bytes=10_000)
+  assert [line.content for line in lines] == ["one", "two", "three"] and truncated
+  lines, truncated = logs.merge_tails([first, second], limit=10, max_output_bytes=40)
+  assert [line.content for line in lines] == ["three"] and truncated
+
+
+@pytest.mark.asyncio
+async def test_pod_logs_many_reads_pods_concurrently_and_merges(monkeypatch):
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_pod_logs_many as many
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_resource_graph
+
+  async def fake_request(path, method="GET", token=None, params={}, data={}, timeout=30):
+    return True, {"nodes": TREE}
+
+  state = {"in_flight": 0, "max_in_flight": 0}
+
+  async def fake_stream(path, token=None, params={}, **kwargs):
+    pod = path.split("/pods/")[1].split("/")[0]
+    offset = {"web-7f-a": 0, "web-7f-b": 1}[pod]
+    state["in_flight"] += 1
+    state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+    for i in range(3):
+      await asyncio.sleep(0.005)
+      yield {"result": {"content": f"level=error {pod} {i}", "timeStampStr": f"2025-01-01T00:00:0{2 * i + offset}Z", "podName": pod}}
+    state["in_flight"] -= 1
+
+  monkeypatch.setattr(application_resource_graph, "make_api_request", fake_request)
+  monkeypatch.setattr(logs, "stream_api_request", fake_stream)
+  result = await many.application_service__pod_logs_many("shop", kind="Deployment", level="error", concurrency=2)
+  assert [line.split(" ", 2)[1] for line in result["lines"]] == ["web-7f-a", "web-7f-b"] * 3
+  assert result["pods"] == {"web-7f-a": "end", "web-7f-b": "end"}
+  assert state["max_in_flight"] == 2
+  assert "error" in await many.application_service__pod_logs_many("shop", kind="CronJob")
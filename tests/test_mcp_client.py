@@ -0,0 +1,340 @@
+import asyncio
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api import client  # noqa: E402
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+  calls = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    calls.append(request)
+    if request.url.path == "/api/v1/applications/missing":
+      return httpx.Response(404, json={"error": "not found"})
+    return httpx.Response(200, json={"path": request.url.path, "method": request.method})
+
+  transport = httpx.MockTransport(handler)
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=transport))
+  monkeypatch.setattr(client, "_client", None)
+  monkeypatch.setattr(client, "_client_loop", None)
+  return calls
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_reuses_shared_client(mock_transport):
+  success, data = await client.make_api_request("/api/v1/applications/a")
+  first = client.get_client()
+  success2, _ = await client.make_api_request("/api/v1/applications/b")
+  assert success and success2
+  assert data == {"path": "/api/v1/applications/a", "method": "GET"}
+  assert client.get_client() is first
+  assert len(mock_transport) == 2
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_close_client_allows_lazy_recreation(mock_transport):
+  first = client.get_client()
+  await client.close_client()
+  assert first.is_closed
+  second = client.get_client()
+  assert second is not first
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_error_response(mock_transport):
+  success, data = await client.make_api_request("/api/v1/applications/missing")
+  assert success is False
+  assert "404" in data["error"]
+  await client.close_client()
+
+
+def test_build_client_http2_falls_back_without_h2(monkeypatch):
+  monkeypatch.setattr(client, "HTTP2_ENABLED", True)
+  monkeypatch.setattr(client.importlib.util, "find_spec", lambda name: None)
+  http_client = client._build_client()
+  assert isinstance(http_client, httpx.AsyncClient)
+
+
+def _stream_client(monkeypatch, chunks):
+  async def body():
+    for chunk in chunks:
+      yield chunk
+
+  transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=transport))
+  monkeypatch.setattr(client, "_client", None)
+
+
+@pytest.mark.asyncio
+async def test_stream_api_request_splits_events_across_chunks(monkeypatch):
+  _stream_client(monkeypatch, [b'{"result": {"n": 1}}\n{"res', b'ult": {"n": 2}}\n\n', b'{"result": {"n": 3}}'])
+  events = [event async for event in client.stream_api_request("/api/v1/stream/applications")]
+  assert [event["result"]["n"] for event in events] == [1, 2, 3]
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_stream_api_request_rejects_oversized_event(monkeypatch):
+  _stream_client(monkeypatch, [b'{"result": "' + b"x" * 64, b"x" * 64])
+  with pytest.raises(client.StreamRequestError):
+    async for _ in client.stream_api_request("/api/v1/stream/applications", max_event_bytes=100):
+      pass
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_watch_api_request_stops_on_condition_and_count(monkeypatch):
+  lines = b"".join(b'{"result": {"n": %d}}\n' % n for n in range(10))
+  _stream_client(monkeypatch, [lines])
+  success, data = await client.watch_api_request("/api/v1/stream/applications", until=lambda event: event["result"]["n"] == 3)
+  assert success and data["stop_reason"] == "condition_met" and data["count"] == 4
+
+  _stream_client(monkeypatch, [lines])
+  success, data = await client.watch_api_request("/api/v1/stream/applications", max_events=2)
+  assert data["stop_reason"] == "max_events" and data["count"] == 2
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_watch_api_request_stops_on_duration(monkeypatch):
+  async def body():
+    yield b'{"result": {"n": 1}}\n'
+    await asyncio.sleep(10)
+
+  transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=transport))
+  monkeypatch.setattr(client, "_client", None)
+  success, data = await client.watch_api_request("/api/v1/stream/applications", max_duration=0.1)
+  assert success and data["stop_reason"] == "max_duration" and data["count"] == 1
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(mock_transport, monkeypatch):
+  monkeypatch.setattr(client, "request_stats", {"upstream": 0, "deduplicated": 0})
+  results = await asyncio.gather(*[
+    client.make_api_request("/api/v1/applications/a", params={"project": "x", "refresh": None})
+    for _ in range(5)
+  ])
+  assert len(mock_transport) == 1
+  assert all(result == results[0] for result in results)
+  assert client.request_stats == {"upstream": 1, "deduplicated": 4}
+
+  # Parameter order does not matter, but the token and the method do
+  await asyncio.gather(
+    client.make_api_request("/api/v1/applications/a", params={"a": "1", "b": "2"}),
+    client.make_api_request("/api/v1/applications/a", params={"b": "2", "a": "1"}),
+    client.make_api_request("/api/v1/applications/a", token="other-token", params={"a": "1", "b": "2"}),
+    client.make_api_request("/api/v1/applications/a", method="POST", data={"a": "1"}),
+    client.make_api_request("/api/v1/applications/a", method="POST", data={"a": "1"}),
+  )
+  assert len(mock_transport) == 5
+  assert not client._in_flight
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_survives_one_caller_cancelling(monkeypatch):
+  release = asyncio.Event()
+  started = []
+
+  async def handler(request):
+    started.append(request)
+    await release.wait()
+    return httpx.Response(200, json={"ok": True})
+
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+  monkeypatch.setattr(client, "_client", None)
+  first = asyncio.create_task(client.make_api_request("/api/v1/applications/slow"))
+  second = asyncio.create_task(client.make_api_request("/api/v1/applications/slow"))
+  await asyncio.sleep(0.01)
+  first.cancel()
+  await asyncio.sleep(0)
+  release.set()
+  assert await second == (True, {"ok": True})
+  assert len(started) == 1
+
+  # When every caller gives up the upstream request is cancelled too
+  release.clear()
+  only = asyncio.create_task(client.make_api_request("/api/v1/applications/abandoned"))
+  await asyncio.sleep(0.01)
+  flight = next(iter(client._in_flight.values()))
+  only.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await only
+  await asyncio.sleep(0)
+  assert flight.task.cancelled()
+  assert not client._in_flight
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_get_after_a_write_does_not_join_an_earlier_get(monkeypatch):
+  state = {"version": 1}
+  release = asyncio.Event()
+
+  async def handler(request):
+    if request.method == "PUT":
+      state["version"] += 1
+      return httpx.Response(200, json={"version": state["version"]})
+    version = state["version"]
+    await release.wait()
+    return httpx.Response(200, json={"version": version})
+
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+  monkeypatch.setattr(client, "_client", None)
+  before = asyncio.create_task(client.make_api_request("/api/v1/applications/a"))
+  await asyncio.sleep(0.01)
+  assert await client.make_api_request("/api/v1/applications/a", method="PUT", data={}) == (True, {"version": 2})
+  after = asyncio.create_task(client.make_api_request("/api/v1/applications/a"))
+  await asyncio.sleep(0.01)
+  release.set()
+  assert await before == (True, {"version": 1})
+  assert await after == (True, {"version": 2})
+  assert not client._in_flight
+  await client.close_client()
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_marked_as_not_sent(monkeypatch):
+  def handler(request):
+    if "/refused/" in request.url.path:
+      raise httpx.ConnectError("connection refused", request=request)
+    raise httpx.ReadTimeout("read timed out", request=request)
+
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+  monkeypatch.setattr(client, "_client", None)
+  success, response = await client.make_api_request("/api/v1/applications/refused/sync", method="POST", data={})
+  assert not success and response["request_sent"] is False
+  success, response = await client.make_api_request("/api/v1/applications/slow/sync", method="POST", data={})
+  assert not success and "request_sent" not in response
+  await client.close_client()
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_policy_paths_until_a_write(mock_transport, monkeypatch):
+  monkeypatch.setattr(client, "response_cache", client.response_cache.__class__(policies={r"/api/v1/projects": 30}))
+  for _ in range(3):
+    success, data = await client.make_api_request("/api/v1/projects")
+    assert success and data["path"] == "/api/v1/projects"
+  assert len(mock_transport) == 1
+
+  # Paths without a policy always go upstream
+  await client.make_api_request("/api/v1/applications/a")
+  await client.make_api_request("/api/v1/applications/a")
+  assert len(mock_transport) == 3
+
+  # A write anywhere under the collection drops the cached list
+  await client.make_api_request("/api/v1/projects/team-a", method="DELETE")
+  await client.make_api_request("/api/v1/projects")
+  assert len(mock_transport) == 5
+  assert client.response_cache.stats["hits"] == 2
+  assert client.response_cache.stats["invalidations"] == 1
+  await client.close_client()
+
+
+def test_response_cache_expires_entries_after_their_ttl():
+  now = [0.0]
+  cache = client.response_cache.__class__(policies={r"/api/version": 10}, clock=lambda: now[0])
+  cache.put(("/api/version",), "/api/version", {"Version": "v2"})
+  now[0] = 9
+  assert cache.get(("/api/version",)) == {"Version": "v2"}
+  now[0] = 10
+  assert cache.get(("/api/version",)) is None
+  assert cache.stats["expired"] == 1
+
+  # A result fetched before an invalidation is not stored
+  generation = cache.generation
+  cache.invalidate("/api/version")
+  cache.put(("/api/version",), "/api/version", {"Version": "v1"}, generation)
+  assert len(cache) == 0
+
+
+@pytest.fixture
+def versioned_transport(monkeypatch):
+  state = {"version": "1", "etag": None, "decoded": 0}
+  calls = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    calls.append(request)
+    headers = {"ETag": state["etag"]} if state["etag"] else {}
+    if state["etag"] and request.headers.get("if-none-match") == state["etag"]:
+      return httpx.Response(304, headers=headers)
+    body = {"metadata": {"resourceVersion": state["version"]}, "items": [{"metadata": {"resourceVersion": "9"}}]}
+    return httpx.Response(200, json=body, headers=headers)
+
+  monkeypatch.setattr(client, "revalidation_cache", client.revalidation_cache.__class__())
+  monkeypatch.setattr(client, "_build_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+  monkeypatch.setattr(client, "_client", None)
+  original_loads = client.codec.loads
+
+  def counting_loads(data):
+    state["decoded"] += 1
+    return original_loads(data)
+
+  monkeypatch.setattr(client.codec, "loads", counting_loads)
+  return state, calls
+
+
+@pytest.mark.asyncio
+async def test_unchanged_resource_version_skips_decoding(versioned_transport):
+  state, calls = versioned_transport
+  _, first = await client.make_api_request("/api/v1/applications")
+  _, second = await client.make_api_request("/api/v1/applications")
+  assert second is first
+  assert state["decoded"] == 1
+
+  state["version"] = "2"
+  _, third = await client.make_api_request("/api/v1/applications")
+  assert third["metadata"]["resourceVersion"] == "2"
+  assert state["decoded"] == 2
+  assert client.revalidation_cache.stats["applications.list"] == {"hits": 1, "revalidations": 2, "misses": 2}
+  await client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_etag_is_sent_back_and_304_returns_cached_object(versioned_transport):
+  state, calls = versioned_transport
+  state["etag"] = '"abc"'
+  _, first = await client.make_api_request("/api/v1/applications/guestbook")
+  _, second = await client.make_api_request("/api/v1/applications/guestbook")
+  assert calls[1].headers["if-none-match"] == '"abc"'
+  assert second is first
+  assert state["decoded"] == 1
+  assert client.cache_metrics()["revalidation_cache"]["endpoints"]["applications.get"]["hits"] == 1
+  await client.close_client()
+
+
+def test_resource_version_is_only_read_from_top_level_metadata():
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api.response_cache import resource_version
+
+  assert resource_version(b'{"metadata":{"name":"a","resourceVersion":"42"},"spec":{}}') == b"42"
+  assert resource_version(b'{"metadata":{},"items":[{"metadata":{"resourceVersion":"7"}}]}') is None
+  assert resource_version(b'{"nodes":[]}') is None
+
+
+def test_revalidation_cache_bounds_the_parsed_size(monkeypatch):
+  from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.api import response_cache
+
+  body = client.codec.dumps({"items": [{"metadata": {"name": f"app-{i}", "labels": {"team": "a"}}} for i in range(200)]})
+  value = client.codec.loads(body)
+  measured = response_cache.object_size(value)
+  assert measured > 2 * len(body)
+
+  monkeypatch.setattr(response_cache, "SIZE_SAMPLE_INTERVAL", 3)
+  cache = response_cache.RevalidationCache(max_bytes=measured + len(body))
+  sizes = [cache.parsed_size("applications.list", value, len(body)) for _ in range(4)]
+  # Measured on the first and every third response, scaled from the body size in between
+  assert sizes[0] == sizes[3] == measured
+  assert sizes[1] == sizes[2] == int(len(body) * measured / len(body))
+
+  cache.put(("a",), response_cache.Validated(value, body, size=sizes[0]))
+  cache.put(("b",), response_cache.Validated(value, body, size=sizes[1]))
+  assert len(cache) == 1 and cache.bytes <= cache.max_bytes
@@ -0,0 +1,126 @@
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://argocd.example.com")
+os.environ.setdefault("ARGOCD_TOKEN", "test-token")
+
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp import types
+
+from agent_argocd.mcp_session import PersistentMCPSession, _memory_session, connection_from_env
+
+
+class FakeSession:
+  def __init__(self, broken=False):
+    self.broken = broken
+    self.calls = []
+
+  async def list_tools(self):
+    return types.ListToolsResult(tools=[
+      types.Tool(name="get", inputSchema={}, annotations=types.ToolAnnotations(readOnlyHint=True)),
+      types.Tool(name="sync", inputSchema={}, annotations=types.ToolAnnotations(readOnlyHint=False)),
+    ])
+
+  async def call_tool(self, name, arguments):
+    if self.broken:
+      raise anyio.ClosedResourceError()
+    self.calls.append((name, arguments))
+    return {"name": name}
+
+
+def test_connection_from_env(monkeypatch):
+  monkeypatch.delenv("MCP_TRANSPORT", raising=False)
+  assert connection_from_env("server.py")["transport"] == "stdio"
+  monkeypatch.setenv("MCP_TRANSPORT", "sse")
+  monkeypatch.setenv("MCP_SERVER_URL", "http://mcp:9000/sse")
+  assert connection_from_env() == {"transport": "sse", "url": "http://mcp:9000/sse"}
+  monkeypatch.setenv("MCP_TRANSPORT", "inprocess")
+  assert connection_from_env() is None
+  monkeypatch.setenv("MCP_TRANSPORT", "carrier-pigeon")
+  with pytest.raises(ValueError):
+    connection_from_env()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_and_reopened_after_transport_failure(monkeypatch):
+  sessions = [FakeSession(), FakeSession(broken=True), FakeSession(), FakeSession(broken=True), FakeSession()]
+  opened = []
+
+  @asynccontextmanager
+  async def fake_open(self):
+    session = sessions[len(opened)]
+    opened.append(session)
+    yield session
+
+  monkeypatch.setattr(PersistentMCPSession, "_open", fake_open)
+  client = PersistentMCPSession(connection=None)
+
+  await client.list_tools()
+  await client.call_tool("get", {})
+  assert len(opened) == 1
+  assert client.read_only_tools == {"get"}
+
+  # Break the transport; a read-only call reconnects once and succeeds
+  await client._drop()
+  assert await client.call_tool("get", {"name": "a"}) == {"name": "get"}
+  assert len(opened) == 3
+  assert sessions[2].calls == [("get", {"name": "a"})]
+  assert client.reconnects == 2
+
+  # A mutating call may already have run, so it is not sent again
+  await client._drop()
+  with pytest.raises(anyio.ClosedResourceError):
+    await client.call_tool("sync", {})
+  assert len(opened) == 4
+  assert await client.call_tool("sync", {}) == {"name": "sync"}
+  assert sessions[4].calls == [("sync", {})]
+  await client.close()
+  assert not client.connected
+
+
+@pytest.mark.asyncio
+async def test_inprocess_session_lists_tools(monkeypatch):
+  monkeypatch.setenv("ARGOCD_INVENTORY_ENABLED", "false")
+  client = PersistentMCPSession(connection=None)
+  try:
+    result = await client.list_tools()
+    assert "application_service__list" in {tool.name for tool in result.tools}
+  finally:
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_tool_call_is_cancelled_on_the_server(monkeypatch):
+  import asyncio
+  from mcp.server.fastmcp import FastMCP
+
+  server = FastMCP("test")
+  started = {"a": asyncio.Event(), "b": asyncio.Event()}
+  server_cancelled = {"a": asyncio.Event(), "b": asyncio.Event()}
+
+  @server.tool()
+  async def slow(key: str) -> str:
+    started[key].set()
+    try:
+      await asyncio.sleep(60 if key == "b" else 0.5)
+    except asyncio.CancelledError:
+      server_cancelled[key].set()
+      raise
+    return "done"
+
+  monkeypatch.setattr(PersistentMCPSession, "_open", lambda self: _memory_session(server._mcp_server))
+  client = PersistentMCPSession(connection=None)
+  # Two calls share the session; only the second one is cancelled
+  first = asyncio.create_task(client.call_tool("slow", {"key": "a"}))
+  second = asyncio.create_task(client.call_tool("slow", {"key": "b"}))
+  await asyncio.wait_for(asyncio.gather(started["a"].wait(), started["b"].wait()), 5)
+  second.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await second
+  await asyncio.wait_for(server_cancelled["b"].wait(), 5)
+  result = await asyncio.wait_for(first, 5)
+  assert not result.isError and not server_cancelled["a"].is_set()
+  assert client.cancelled_requests == 1 and client.reconnects == 0
+  await client.close()
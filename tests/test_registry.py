@@ -0,0 +1,83 @@
+import asyncio
+import json
+import os
+import sys
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd import registry  # noqa: E402
+
+
+@pytest.fixture
+def schema_cache(tmp_path, monkeypatch):
+  path = tmp_path / "tool_schemas.json"
+  monkeypatch.setattr(registry, "SCHEMA_CACHE_PATH", str(path))
+  return path
+
+
+def test_lazy_registration_matches_eager_schemas(schema_cache):
+  eager = FastMCP("eager")
+  registry.register_tools(eager, lazy=True)
+  assert schema_cache.exists()
+
+  lazy = FastMCP("lazy")
+  registry.register_tools(lazy, lazy=True)
+  assert all(isinstance(tool, registry.LazyTool) for tool in lazy._tool_manager.list_tools())
+
+  eager_tools = asyncio.run(eager.list_tools())
+  lazy_tools = asyncio.run(lazy.list_tools())
+  assert len(lazy_tools) == len(registry.TOOL_MANIFEST)
+  assert [tool.model_dump() for tool in lazy_tools] == [tool.model_dump() for tool in eager_tools]
+
+
+def test_read_only_tools_are_annotated(schema_cache):
+  assert registry.READ_ONLY_TOOLS <= set(registry.TOOL_MANIFEST)
+  server = FastMCP("annotated")
+  registry.register_tools(server, lazy=False)
+  hints = {tool.name: tool.annotations.readOnlyHint for tool in asyncio.run(server.list_tools())}
+  assert hints["application_service__get"] and hints["application_service__unhealthy_resources"]
+  assert not hints["application_service__sync"] and not hints["application_service__delete"]
+
+
+def test_stale_cache_is_ignored(schema_cache):
+  schema_cache.write_text('{"fingerprint": "stale", "tools": []}')
+  assert registry.load_schema_cache() is None
+
+
+def test_lazy_tool_imports_module_on_first_call(schema_cache, monkeypatch):
+  registry.register_tools(FastMCP("warmup"), lazy=True)
+  module_name = f"{registry.TOOLS_PACKAGE}.api_version"
+  monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+  server = FastMCP("lazy")
+  registry.register_tools(server, lazy=True)
+  assert module_name not in sys.modules
+
+  async def fake_request(*args, **kwargs):
+    return True, {"Version": "v2.14.0"}
+
+  tool = server._tool_manager.get_tool("version_service__version")
+  tool.resolve()
+  assert module_name in sys.modules
+  monkeypatch.setattr(sys.modules[module_name], "make_api_request", fake_request)
+  result = asyncio.run(server._tool_manager.call_tool("version_service__version", {}))
+  assert result["Version"] == "v2.14.0"
+
+
+def test_fast_codec_result_matches_fastmcp_conversion(schema_cache, monkeypatch):
+  monkeypatch.setattr(registry.codec, "FAST_CODEC", True)
+  server = FastMCP("codec")
+  registry.register_tools(server, lazy=False)
+  tool = server._tool_manager.get_tool("version_service__version")
+  assert isinstance(tool, registry.CodecTool)
+
+  result = {"Version": "v2.14.0", "ünïcode": ["a", 1, None]}
+  content, structured = registry.encode_tool_result(result, tool)
+  expected_content, expected_structured = tool.fn_metadata.convert_result(result)
+  assert json.loads(content[0].text) == json.loads(expected_content[0].text)
+  assert structured == expected_structured
+  assert structured["result"] is result
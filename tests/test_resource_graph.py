@@ -0,0 +1,104 @@
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store.resource_graph import ResourceGraph  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_resource_graph  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools.application_pod_logs_many import find_pods  # noqa: E402
+
+
+def _node(kind, name, uid, parent=None, group="", health=None, namespace="default"):
+  node = {"group": group, "kind": kind, "namespace": namespace, "name": name, "uid": uid}
+  if parent:
+    node["parentRefs"] = [{"group": parent[0], "kind": parent[1], "namespace": namespace, "name": parent[2], "uid": parent[3]}]
+  if health:
+    node["health"] = {"status": health, "message": f"{name} is {health}"}
+  return node
+
+
+def _tree():
+  return [
+    _node("Deployment", "web", "d1", group="apps", health="Degraded"),
+    _node("ReplicaSet", "web-1", "r1", ("apps", "Deployment", "web", "d1"), group="apps", health="Degraded"),
+    _node("Pod", "web-1-a", "p1", ("apps", "ReplicaSet", "web-1", "r1"), health="Healthy"),
+    _node("Pod", "web-1-b", "p2", ("apps", "ReplicaSet", "web-1", "r1"), health="Degraded"),
+    _node("Service", "web", "s1", health="Healthy"),
+    _node("Deployment", "api", "d2", group="apps", health="Missing"),
+  ]
+
+
+def test_subtree_and_ancestry():
+  graph = ResourceGraph(_tree())
+  assert [(graph.get(i).name, depth) for i, depth in graph.subtree("d1")] == [("web", 0), ("web-1", 1), ("web-1-a", 2), ("web-1-b", 2)]
+  assert [i for i, _ in graph.subtree("d1", max_depth=1)] == ["d1", "r1"]
+  assert graph.ancestors("p2") == ["r1", "d1"]
+  assert sorted(graph.roots()) == ["d1", "d2", "s1"]
+
+
+def test_find_is_narrowed_by_namespace_and_group():
+  graph = ResourceGraph(_tree())
+  assert graph.find("Deployment", "web") == ["d1"]
+  assert graph.find("Deployment", "web", "default", "apps") == ["d1"]
+  assert graph.find("Deployment", "web", "other") == []
+  assert graph.find("Service", "web", group="apps") == []
+
+
+def test_unhealthy_leaves_skip_unhealthy_owners():
+  graph = ResourceGraph(_tree())
+  assert sorted(graph.unhealthy_leaves()) == ["d2", "p2"]
+  assert graph.unhealthy_leaves("r1") == ["p2"]
+
+
+def test_remove_updates_adjacency():
+  graph = ResourceGraph(_tree())
+  graph.remove("p2")
+  assert graph.get("p2") is None
+  assert graph.children("r1") == ["p1"]
+  assert graph.unhealthy_leaves("d1") == ["r1"]
+  assert graph.find("Pod", "web-1-b") == []
+
+
+def test_find_pods_by_owner():
+  pods = find_pods(_tree(), kind="Deployment", resource_name="web")
+  assert [pod.name for pod in pods] == ["web-1-a", "web-1-b"]
+  assert find_pods(_tree(), kind="Deployment", resource_name="api") == []
+
+
+@pytest.mark.asyncio
+async def test_tools(monkeypatch):
+  async def fake_request(path, method="GET", params={}, **kwargs):
+    assert path == "/api/v1/applications/shop/resource-tree"
+    return True, {"nodes": _tree()}
+
+  monkeypatch.setattr(application_resource_graph, "make_api_request", fake_request)
+
+  result = await application_resource_graph.application_service__unhealthy_resources("shop")
+  assert result["count"] == 2
+  pod = next(r for r in result["resources"] if r["kind"] == "Pod")
+  assert pod == {"kind": "Pod", "name": "web-1-b", "namespace": "default", "health": "Degraded", "message": "web-1-b is Degraded", "owners": ["ReplicaSet/web-1", "Deployment/web"]}
+
+  result = await application_resource_graph.application_service__resource_ancestry("shop", "Pod", "web-1-a")
+  assert [owner["name"] for owner in result["owners"]] == ["web-1", "web"]
+
+  result = await application_resource_graph.application_service__resource_subtree("shop", "Deployment", "web", limit=2)
+  assert result["count"] == 4 and result["truncated"] and len(result["nodes"]) == 2
+
+  result = await application_resource_graph.application_service__resource_subtree("shop", "StatefulSet", "db")
+  assert "error" in result
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_name_lists_candidates(monkeypatch):
+  nodes = _tree() + [_node("Deployment", "web", "d3", group="apps", namespace="other")]
+
+  async def fake_request(path, method="GET", params={}, **kwargs):
+    return True, {"nodes": nodes}
+
+  monkeypatch.setattr(application_resource_graph, "make_api_request", fake_request)
+  result = await application_resource_graph.application_service__resource_subtree("shop", "Deployment", "web")
+  assert len(result["candidates"]) == 2
+  result = await application_resource_graph.application_service__resource_subtree("shop", "Deployment", "web", namespace="other")
+  assert result["count"] == 1
@@ -0,0 +1,85 @@
+import inspect
+import json
+
+import pytest
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.utils.shaping import (
+  field_value,
+  parse_field_path,
+  project_fields,
+  shape_response,
+  shape_result,
+  strip_noise,
+)
+
+APP = {
+  "metadata": {
+    "name": "guestbook",
+    "managedFields": [{"manager": "argocd-server"}],
+    "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{...}", "owner": "team-a"},
+  },
+  "status": {"health": {"status": "Healthy"}, "resources": [{"kind": "Service", "name": "a"}, {"kind": "Deployment", "name": "b"}]},
+}
+
+
+def test_parse_field_path():
+  assert parse_field_path("$.items[*].metadata.name") == ["items", "metadata", "name"]
+  assert parse_field_path("spec.containers[0].image") == ["spec", "containers", "0", "image"]
+
+
+def test_project_fields_traverses_lists():
+  result = project_fields({"items": [APP, APP]}, ["items.metadata.name", "items.status.resources.kind"])
+  assert result["items"][0] == {"metadata": {"name": "guestbook"}, "status": {"resources": [{"kind": "Service"}, {"kind": "Deployment"}]}}
+  assert project_fields(APP, ["status.resources[1].name"]) == {"status": {"resources": [{"name": "b"}]}}
+  assert project_fields(APP, ["metadata", "metadata.name"])["metadata"] == APP["metadata"]
+
+
+def test_field_value_reads_one_path():
+  assert field_value(APP, "status.health.status") == "Healthy"
+  assert field_value(APP, "status.resources.kind") == ["Service", "Deployment"]
+  assert field_value(APP, "status.resources[1].name") == "b"
+  assert field_value(APP, "status.resources[5].name") is None
+  assert field_value(APP, "spec.project") is None
+
+
+def test_strip_noise_does_not_mutate_input():
+  stripped = strip_noise(APP)
+  assert "managedFields" not in stripped["metadata"]
+  assert stripped["metadata"]["annotations"] == {"owner": "team-a"}
+  assert "managedFields" in APP["metadata"]
+
+
+def test_strip_noise_returns_clean_values_as_is():
+  clean = {"metadata": {"name": "guestbook", "annotations": {"owner": "team-a"}}, "items": [{"a": 1}]}
+  removed = []
+  assert strip_noise(clean, removed) is clean
+  assert removed == []
+  stripped = strip_noise({"status": APP["status"], "metadata": APP["metadata"]}, removed)
+  assert stripped["status"] is APP["status"]
+  assert [key for key, _ in removed] == ["managedFields", "kubectl.kubernetes.io/last-applied-configuration"]
+
+
+def test_shape_result_reports_bytes_saved_and_skips_errors():
+  shaped = shape_result(APP, ["metadata.name"])
+  assert shaped["metadata"] == {"name": "guestbook"}
+  saved = len(json.dumps(APP, separators=(",", ":"))) - len(json.dumps({"metadata": {"name": "guestbook"}}, separators=(",", ":")))
+  assert shaped["_response_shaping"]["bytes_saved"] == pytest.approx(saved, rel=0.1)
+  error = {"error": "not found"}
+  assert shape_result(error, ["metadata.name"]) is error
+  clean = {"metadata": {"name": "guestbook"}}
+  assert shape_result(clean) is clean
+
+
+@pytest.mark.asyncio
+async def test_shape_response_adds_fields_parameter():
+  async def tool(path_name: str, param_project: str = None):
+    """Get an app."""
+    return dict(APP)
+
+  wrapped = shape_response(tool)
+  assert list(inspect.signature(wrapped).parameters) == ["path_name", "param_project", "fields"]
+  assert "fields" in wrapped.__doc__
+  assert await wrapped(path_name="guestbook", fields=["status.health.status"]) == {
+    "status": {"health": {"status": "Healthy"}},
+    "_response_shaping": pytest.approx(shape_result(APP, ["status.health.status"])["_response_shaping"]),
+  }
@@ -0,0 +1,91 @@
+from typing import Any, List
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import StructuredTool
+from langgraph.prebuilt import create_react_agent
+
+from agent_argocd.tool_retrieval import ToolIndex, tokenize, with_tool_retrieval
+
+
+def make_tool(name: str, description: str, params: List[str] = ()) -> StructuredTool:
+  schema = {"type": "object", "properties": {p: {"type": "string"} for p in params}}
+  return StructuredTool(name=name, description=description, args_schema=schema, coroutine=lambda **kwargs: "ok")
+
+
+TOOLS = [
+  make_tool("application_service__list", "List returns list of applications", ["param_projects", "param_selector"]),
+  make_tool("application_service__get", "Get returns an application by name", ["param_name"]),
+  make_tool("application_service__sync", "Sync syncs an application to its target state", ["param_name", "body_revision"]),
+  make_tool("application_service__pod_logs", "PodLogs returns stream of log entries for the specified pod", ["param_podName", "param_container"]),
+  make_tool("application_service__rollback", "Rollback syncs an application to its previous version", ["param_name", "body_id"]),
+  make_tool("cluster_service__list", "List returns list of clusters", ["param_server"]),
+  make_tool("cluster_service__invalidate_cache", "InvalidateCache invalidates cluster cache", ["param_id_value"]),
+  make_tool("project_service__delete", "Delete deletes a project", ["param_name"]),
+  make_tool("repository_service__create_repository", "CreateRepository creates a new repository configuration", ["body_repo", "body_sshPrivateKey"]),
+  make_tool("gpg_key_service__list", "List all available repository certificates", ["param_keyID"]),
+  make_tool("version_service__version", "Version returns version information of the API server"),
+]
+
+
+class RecordingChatModel(BaseChatModel):
+  bound_tool_names: List[List[str]] = []
+
+  @property
+  def _llm_type(self) -> str:
+    return "recording"
+
+  def bind_tools(self, tools: Any, **kwargs: Any):
+    self.bound_tool_names.append([tool.name for tool in tools])
+    return self
+
+  def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+    return ChatResult(generations=[ChatGeneration(message=AIMessage(content="done"))])
+
+
+def test_tokenize_splits_camel_case_and_plurals():
+  assert tokenize("PodLogs for applications") == ["pod", "log", "application"]
+
+
+@pytest.mark.parametrize("query,expected", [
+  ("show pod logs for frontend", "application_service__pod_logs"),
+  ("which clusters are registered?", "cluster_service__list"),
+  ("rollback backend to the previous version", "application_service__rollback"),
+  ("delete project team-a", "project_service__delete"),
+  ("refresh the cluster cache", "cluster_service__invalidate_cache"),
+])
+def test_search_ranks_the_matching_tool_first(query, expected):
+  assert ToolIndex(TOOLS).search(query, k=3)[0].name == expected
+
+
+def test_search_adds_core_tools_of_mentioned_categories():
+  names = [tool.name for tool in ToolIndex(TOOLS).search("is the frontend app degraded", k=1)]
+  assert {"application_service__list", "application_service__get"} <= set(names)
+
+
+def test_select_widens_to_all_tools_without_a_confident_match():
+  assert ToolIndex(TOOLS).select([HumanMessage(content="hello there")], k=2) == TOOLS
+
+
+def test_select_keeps_tools_already_called():
+  messages = [
+    HumanMessage(content="sync guestbook"),
+    AIMessage(content="", tool_calls=[{"name": "project_service__delete", "args": {}, "id": "1"}]),
+    HumanMessage(content="show pod logs"),
+  ]
+  names = {tool.name for tool in ToolIndex(TOOLS).select(messages, k=1)}
+  assert {"application_service__pod_logs", "project_service__delete"} <= names
+
+
+@pytest.mark.asyncio
+async def test_react_agent_binds_only_selected_tools():
+  model = RecordingChatModel()
+  model.bound_tool_names = []
+  graph = create_react_agent(with_tool_retrieval(model, TOOLS, enabled=True, top_k=2), TOOLS)
+  await graph.ainvoke({"messages": [("user", "show pod logs for frontend")]})
+  assert model.bound_tool_names
+  bound = model.bound_tool_names[-1]
+  assert "application_service__pod_logs" in bound
+  assert len(bound) < len(TOOLS)
@@ -0,0 +1,153 @@
+import asyncio
+import os
+
+os.environ.setdefault("ARGOCD_API_URL", "https://dummy-argocd")
+os.environ.setdefault("ARGOCD_TOKEN", "dummy-token")
+
+import pytest  # noqa: E402
+
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.store import tree_cache  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_resource_graph  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import api_v1_applications_applicationname_resource_tree as resource_tree  # noqa: E402
+from agent_argocd.protocol_bindings.mcp_server.mcp_argocd.tools import application_pod_logs_many  # noqa: E402
+
+
+def _pod(name, uid, health="Healthy"):
+  return {"kind": "Pod", "namespace": "default", "name": name, "uid": uid, "health": {"status": health}}
+
+
+class FakeWatch:
+  """Per-application queues of trees that the fake stream yields."""
+
+  def __init__(self, monkeypatch):
+    self.queues = {}
+    self.opened = []
+    monkeypatch.setattr(tree_cache, "stream_api_request", self.stream)
+
+  def queue(self, app):
+    return self.queues.setdefault(f"/api/v1/stream/applications/{app}/resource-tree", asyncio.Queue())
+
+  async def stream(self, path, token=None, params={}, **kwargs):
+    self.opened.append(path)
+    queue = self.queues.setdefault(path, asyncio.Queue())
+    while True:
+      yield {"result": await queue.get()}
+
+
+@pytest.mark.asyncio
+async def test_updates_are_applied_as_diffs(monkeypatch):
+  watch = FakeWatch(monkeypatch)
+  cache = tree_cache.ResourceTreeCache(max_apps=5, idle_seconds=600)
+  watch.queue("shop").put_nowait({"nodes": [_pod("a", "1"), _pod("b", "2")]})
+
+  graph = await cache.get("shop", timeout=1)
+  assert sorted(node.name for _, node in graph.items()) == ["a", "b"]
+  assert cache.stats["misses"] == 1
+
+  watch.queue("shop").put_nowait({"nodes": [_pod("a", "1"), _pod("b", "2", "Degraded"), _pod("c", "3")]})
+  watch.queue("shop").put_nowait({"nodes": [_pod("b", "2", "Degraded"), _pod("c", "3")]})
+  await asyncio.sleep(0.01)
+
+  assert await cache.get("shop") is graph
+  assert cache.stats["hits"] == 1
+  assert graph.unhealthy_leaves() == ["2"]
+  tree = cache._trees[("", "shop")]
+  assert {k: tree.stats[k] for k in ("events", "added", "updated", "removed")} == {"events": 3, "added": 3, "updated": 1, "removed": 1}
+  assert watch.opened == ["/api/v1/stream/applications/shop/resource-tree"]
+  await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_idle_expiry(monkeypatch):
+  watch = FakeWatch(monkeypatch)
+  now = [0.0]
+  cache = tree_cache.ResourceTreeCache(max_apps=2, idle_seconds=100, clock=lambda: now[0])
+  for app in ("a", "b", "c"):
+    watch.queue(app).put_nowait({"nodes": [_pod(app, app)]})
+
+  await cache.get("a", timeout=1)
+  await cache.get("b", timeout=1)
+  await cache.get("a")
+  await cache.get("c", timeout=1)
+  assert list(cache._trees) == [("", "a"), ("", "c")]
+  assert cache.stats["evictions"] == 1
+
+  now[0] = 50.0
+  await cache.get("c")
+  now[0] = 120.0
+  await cache.expire()
+  assert list(cache._trees) == [("", "c")]
+  assert cache.stats["expirations"] == 1
+  await cache.stop()
+  assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_watch_is_closed_without_further_queries(monkeypatch):
+  watch = FakeWatch(monkeypatch)
+  cache = tree_cache.ResourceTreeCache(max_apps=2, idle_seconds=0.05)
+  watch.queue("shop").put_nowait({"nodes": [_pod("a", "1")]})
+
+  await cache.get("shop", timeout=1)
+  tree = cache._trees[("", "shop")]
+  task = tree._task
+  await asyncio.sleep(0.2)
+
+  assert len(cache) == 0
+  assert cache.stats["expirations"] == 1
+  assert task.cancelled() and tree._task is None
+  assert cache._sweeper.done()
+  await cache.stop()
+
+@pytest.mark.asyncio
+async def test_timeout_falls_back_to_api(monkeypatch):
+  FakeWatch(monkeypatch)
+  cache = tree_cache.ResourceTreeCache(max_apps=2, idle_seconds=100)
+  monkeypatch.setattr(tree_cache, "TREE_CACHE_ENABLED", True)
+  monkeypatch.setattr(tree_cache, "tree_cache", cache)
+  calls = []
+
+  async def fake_request(path, method="GET", params={}, **kwargs):
+    calls.append(path)
+    return True, {"nodes": [_pod("a", "1", "Degraded")]}
+
+  monkeypatch.setattr(application_resource_graph, "make_api_request", fake_request)
+
+  async def quick_get(name, app_namespace=None, timeout=None):
+    return await tree_cache.ResourceTreeCache.get(cache, name, app_namespace, timeout=0.01)
+
+  monkeypatch.setattr(cache, "get", quick_get)
+  result = await application_resource_graph.application_service__unhealthy_resources("shop")
+  assert result["count"] == 1
+  assert calls == ["/api/v1/applications/shop/resource-tree"]
+  assert cache.stats["timeouts"] == 1
+  await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_resource_tree_tools_are_served_from_the_cache(monkeypatch):
+  watch = FakeWatch(monkeypatch)
+  cache = tree_cache.ResourceTreeCache(max_apps=2, idle_seconds=100)
+  monkeypatch.setattr(tree_cache, "TREE_CACHE_ENABLED", True)
+  monkeypatch.setattr(tree_cache, "tree_cache", cache)
+  calls = []
+
+  async def fake_request(path, method="GET", params={}, **kwargs):
+    calls.append(path)
+    return True, {"nodes": []}
+
+  monkeypatch.setattr(resource_tree, "make_api_request", fake_request)
+  monkeypatch.setattr(application_resource_graph, "make_api_request", fake_request)
+  tree = {"nodes": [_pod("web-1", "1"), _pod("web-2", "2")], "hosts": [{"name": "node-a"}]}
+  watch.queue("shop").put_nowait(tree)
+
+  assert await resource_tree.application_service__resource_tree("shop") == tree
+  pods = await application_pod_logs_many.application_service__pod_logs_many("shop", pod_glob="nothing-*")
+  assert pods == {"error": "No pods found in application shop for the given filters"}
+  assert calls == []
+  assert cache.stats["hits"] == 1
+
+  # A project to check still goes to the API server
+  await resource_tree.application_service__resource_tree("shop", param_project="default")
+  assert calls == ["/api/v1/applications/shop/resource-tree"]
+  await cache.stop()